@@ -0,0 +1,171 @@
+"""
+Benchmarks of the bulging post-processor.
+
+Times ``BulgingModel.bulge_radius``, the cross-section (and analytic contour) builders and the whole
+post-processing step for every roll pass of the test sequences and of scaled-up sequences,
+as well as the solution of the whole sequences. Results are written to a JSON file, which can be compared
+against the one of another version using ``--compare``.
+
+Run with ``python benchmarks/bench_bulging.py`` or ``hatch run bench:run``.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import shapely
+import pyroll.core
+import pyroll.wusatowski_spreading
+import pyroll.profile_bulging
+from pyroll.core import Profile as BaseProfile
+from pyroll.profile_bulging import Config
+from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+from sequences import SEQUENCES, SCALED_SEQUENCES
+
+
+def measure(func, repeat: int, min_time: float) -> dict:
+    """Time ``func`` with as many calls per repetition as needed to run at least ``min_time`` seconds."""
+    start = time.perf_counter()
+    func()
+    estimate = time.perf_counter() - start
+
+    number = max(1, int(min_time / estimate)) if estimate > 0 else 1000
+    times = [t / number for t in timeit.Timer(func).repeat(repeat=repeat, number=number)]
+
+    return dict(
+        number=number,
+        repeat=repeat,
+        min=min(times),
+        median=statistics.median(times),
+        mean=statistics.fmean(times),
+    )
+
+
+def _profile_copy(profile):
+    return BaseProfile(**{k: v for k, v in profile.__dict__.items() if not k.startswith("_")})
+
+
+def bench_roll_pass(roll_pass, repeat: int, min_time: float):
+    model = BulgingModel(roll_pass)
+    template = _profile_copy(roll_pass.out_profile)
+    template.bulge_radius = model.bulge_radius(template)
+
+    targets = {
+        "bulge_radius": lambda: model.bulge_radius(template),
+        "solve": lambda: BulgingModel(roll_pass).solve(_profile_copy(roll_pass.out_profile)),
+    }
+
+    pair = model.model_pair
+    if pair is not None:
+        targets[pair.cross_section.__name__] = lambda: pair.cross_section(model, template)
+
+        if pair.contour is not None:
+            targets[pair.contour.__name__] = lambda: pair.contour(model, template)
+
+    for target, func in targets.items():
+        yield target, measure(func, repeat, min_time)
+
+
+def bench_sequence(name: str, factory, passes, repeat: int, min_time: float, sequence_repeat: int):
+    durations = []
+    for _ in range(max(sequence_repeat, 1)):
+        sequence, in_profile = factory() if passes is None else factory(passes)
+        start = time.perf_counter()
+        sequence.solve(in_profile)
+        durations.append(time.perf_counter() - start)
+
+    roll_passes = sequence.roll_passes
+    base = dict(sequence=name, passes=len(roll_passes))
+
+    yield dict(
+        base, roll_pass=None, index=None, target="sequence_solve",
+        number=1, repeat=sequence_repeat, min=min(durations), median=statistics.median(durations),
+        mean=statistics.fmean(durations),
+    )
+
+    for index, roll_pass in enumerate(roll_passes):
+        for target, timing in bench_roll_pass(roll_pass, repeat, min_time):
+            yield dict(base, roll_pass=roll_pass.label, index=index, target=target, **timing)
+
+
+def metadata():
+    return dict(
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        python=sys.version,
+        platform=platform.platform(),
+        pyroll_profile_bulging=pyroll.profile_bulging.VERSION,
+        pyroll_core=pyroll.core.VERSION,
+        numpy=np.__version__,
+        shapely=shapely.__version__,
+        config={name: getattr(Config, name) for name in Config.to_dict()},
+    )
+
+
+def _key(result):
+    return result["sequence"], result["passes"], result["index"], result["target"]
+
+
+def compare(results, baseline_file: Path):
+    baseline = {_key(r): r for r in json.loads(baseline_file.read_text())["results"]}
+
+    print(f"{'sequence':28s} {'n':>3s} {'pass':>4s} {'target':60s} {'baseline':>10s} {'current':>10s} {'ratio':>6s}")
+    for result in results:
+        reference = baseline.get(_key(result))
+        if reference is None:
+            continue
+
+        print(
+            f"{result['sequence']:28s} {result['passes']:3d} {str(result['index']):>4s} {result['target']:60s} "
+            f"{reference['median'] * 1e3:8.3f}ms {result['median'] * 1e3:8.3f}ms "
+            f"{result['median'] / reference['median']:6.2f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", type=Path, default=Path("bench_output.json"),
+                        help="JSON file to write the results to")
+    parser.add_argument("--compare", type=Path, help="JSON file of a previous run to compare the results with")
+    parser.add_argument("--passes", type=int, nargs="*", default=[20, 50],
+                        help="pass counts of the scaled-up sequences")
+    parser.add_argument("--sequences", nargs="*", help="names of the sequences to run, all if omitted")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per timing")
+    parser.add_argument("--min-time", type=float, default=0.02,
+                        help="minimum duration of a single repetition in seconds")
+    parser.add_argument("--sequence-repeat", type=int, default=1,
+                        help="repetitions of the solution of whole sequences")
+    parser.add_argument("--cache", action="store_true",
+                        help="keep the cross-section cache enabled, it is disabled by default to time the builders")
+    args = parser.parse_args(argv)
+
+    if not args.cache:
+        Config.CROSS_SECTION_CACHE_SIZE = 0
+
+    jobs = [(name, factory, None) for name, factory in SEQUENCES.items()]
+    jobs += [(f"{name}_{n}", factory, n) for n in args.passes for name, factory in SCALED_SEQUENCES.items()]
+
+    if args.sequences:
+        jobs = [job for job in jobs if job[0] in args.sequences]
+
+    results = []
+    for name, factory, passes in jobs:
+        print(f"Running {name} ...", file=sys.stderr)
+        results.extend(bench_sequence(name, factory, passes, args.repeat, args.min_time, args.sequence_repeat))
+
+    args.output.write_text(json.dumps(dict(metadata=metadata(), results=results), indent=2, default=str))
+    print(f"Results written to {args.output}.", file=sys.stderr)
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
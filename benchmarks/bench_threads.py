@@ -0,0 +1,82 @@
+"""
+Benchmark of solving independent strands in threads.
+
+Solves a number of copies of a scaled-up sequence one after another and with
+``pyroll.profile_bulging.parallel.solve_sequences`` for each given thread count, checks that the bulged profiles are
+identical and prints the wall times and speedups.
+
+Run with ``python benchmarks/bench_threads.py``.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import shapely
+import pyroll.wusatowski_spreading
+from pyroll.profile_bulging import Config, cross_section_cache, pass_geometry_cache, incremental_memo
+from pyroll.profile_bulging.parallel import solve_sequences
+
+from sequences import SCALED_SEQUENCES
+
+
+def _clear_caches():
+    for cache in (cross_section_cache, pass_geometry_cache, incremental_memo):
+        cache.clear()
+
+
+def _bulged(jobs):
+    return [
+        [(u.in_profile.__dict__.get("bulge_radius"), u.in_profile.cross_section) for u in sequence.units[1:]]
+        for sequence, _ in jobs
+    ]
+
+
+def run(factory, strands: int, passes: int, threads: int):
+    """Solve fresh strands, return the wall time and the bulged profiles."""
+    _clear_caches()
+    jobs = [factory(passes) for _ in range(strands)]
+
+    start = time.perf_counter()
+    solve_sequences(jobs, threads=threads)
+    return time.perf_counter() - start, _bulged(jobs)
+
+
+def _equal(a, b) -> bool:
+    return all(
+        ra == rb and shapely.equals_exact(ca, cb, tolerance=0)
+        for sa, sb in zip(a, b) for (ra, ca), (rb, cb) in zip(sa, sb)
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sequence", default="round_oval_round", choices=list(SCALED_SEQUENCES),
+                        help="name of the scaled-up sequence to solve per strand")
+    parser.add_argument("--passes", type=int, default=10, help="pass count of each strand")
+    parser.add_argument("--strands", type=int, default=8, help="count of strands")
+    parser.add_argument("--threads", type=int, nargs="*", default=[2, 4, os.cpu_count() or 1],
+                        help="thread counts to run")
+    parser.add_argument("--no-cache", action="store_true", help="disable the cross-section cache")
+    args = parser.parse_args(argv)
+
+    if args.no_cache:
+        Config.CROSS_SECTION_CACHE_SIZE = 0
+
+    factory = SCALED_SEQUENCES[args.sequence]
+    print(f"CPU count: {os.cpu_count()}", file=sys.stderr)
+
+    run(factory, 1, args.passes, 1)  # warm up lazy imports and per-process caches
+    serial_time, serial = run(factory, args.strands, args.passes, 1)
+    print(f"{'threads':>7s} {'time s':>8s} {'speedup':>7s} {'identical':>9s}")
+    print(f"{1:7d} {serial_time:8.3f} {1:7.2f} {'yes':>9s}")
+
+    for threads in sorted(set(args.threads) - {1}):
+        threaded_time, threaded = run(factory, args.strands, args.passes, threads)
+        print(f"{threads:7d} {threaded_time:8.3f} {serial_time / threaded_time:7.2f} "
+              f"{'yes' if _equal(serial, threaded) else 'NO':>9s}")
+
+
+if __name__ == "__main__":
+    main()
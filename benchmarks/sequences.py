@@ -0,0 +1,317 @@
+"""
+Pass sequences used by the benchmarks.
+
+The basic sequences are the ones of the solve tests in ``tests/``,
+the scaled ones repeat the round-oval-round, square-diamond-square and three-roll oval
+patterns with grooves scaled to the actual incoming profile to create long sequences.
+Every function returns a fresh tuple ``(sequence, in_profile)``.
+"""
+
+from pyroll.core import Profile, Roll, RollPass, ThreeRollPass, Transport, RoundGroove, CircularOvalGroove, \
+    DiamondGroove, SquareGroove, FlatGroove, PassSequence
+
+
+def _round_oval_round_in_profile():
+    return Profile.round(
+        diameter=30e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C20", "steel"],
+        flow_stress=100e6
+    )
+
+
+def _round_oval_round_pass(i: int, f: float = 1):
+    if i % 2 == 0:
+        return RollPass(
+            label=f"Oval {i + 1}",
+            roll=Roll(
+                groove=CircularOvalGroove(
+                    depth=8e-3 * f,
+                    r1=6e-3 * f,
+                    r2=40e-3 * f
+                ),
+                nominal_radius=160e-3 * f,
+                rotational_frequency=1
+            ),
+            gap=2e-3 * f,
+        )
+
+    return RollPass(
+        label=f"Round {i + 1}",
+        roll=Roll(
+            groove=RoundGroove(
+                r1=1e-3 * f,
+                r2=12.5e-3 * f,
+                depth=11.5e-3 * f
+            ),
+            nominal_radius=160e-3 * f,
+            rotational_frequency=1
+        ),
+        gap=4e-3 * f,
+    )
+
+
+def _square_diamond_square_in_profile():
+    return Profile.square(
+        side=45e-3,
+        corner_radius=3e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C20", "steel"],
+        flow_stress=100e6
+    )
+
+
+def _square_diamond_square_pass(i: int, f: float = 1):
+    if i % 2 == 0:
+        return RollPass(
+            label=f"Raute {i + 1}",
+            roll=Roll(
+                groove=DiamondGroove(
+                    usable_width=76.55e-3 * f,
+                    tip_depth=22.1e-3 * f,
+                    r1=12e-3 * f,
+                    r2=8e-3 * f
+                ),
+                nominal_radius=(324e-3 + 320e-3) / 2 / 2 * f
+            ),
+            velocity=1,
+            gap=3e-3 * f,
+        )
+
+    return RollPass(
+        label=f"Quadrat {i + 1}",
+        roll=Roll(
+            groove=SquareGroove(
+                usable_width=52.7e-3 * f,
+                tip_depth=25.95e-3 * f,
+                r1=8e-3 * f,
+                r2=6e-3 * f
+            ),
+            nominal_radius=(328e-3 + 324e-3) / 2 / 2 * f,
+        ),
+        velocity=1,
+        gap=3e-3 * f,
+    )
+
+
+def _with_transports(passes):
+    units = []
+
+    for i, roll_pass in enumerate(passes):
+        if i > 0:
+            units.append(Transport(label=f"{i} => {i + 1}", duration=1))
+        units.append(roll_pass)
+
+    return units
+
+
+def _scaled(make_pass, make_in_profile, passes: int, period: int):
+    """
+    Chain ``passes`` passes created by ``make_pass(i, f)`` and scale every period of passes by ``f``,
+    the ratio of the equivalent diameter of its actual incoming profile to the one of the initial profile.
+    The scales are determined by solving the periods one after another in advance.
+    """
+    in_profile = make_in_profile()
+    reference = in_profile.equivalent_radius
+    profile = in_profile
+    scales = []
+
+    for start in range(0, passes, period):
+        f = profile.equivalent_radius / reference
+        scales.append(f)
+        design = PassSequence(
+            [make_pass(i, f) for i in range(start, min(start + period, passes))] + [Transport(duration=1)]
+        )
+        design.solve(profile)
+        profile = design.units[-1].out_profile
+
+    units = _with_transports([make_pass(i, scales[i // period]) for i in range(passes)])
+    return PassSequence(units), make_in_profile()
+
+
+def round_oval_round(passes: int = 2):
+    if passes == 2:
+        return PassSequence(_with_transports([_round_oval_round_pass(0), _round_oval_round_pass(1)])), \
+            _round_oval_round_in_profile()
+    return _scaled(_round_oval_round_pass, _round_oval_round_in_profile, passes, 2)
+
+
+def square_diamond_square(passes: int = 2):
+    if passes == 2:
+        return PassSequence(_with_transports([_square_diamond_square_pass(0), _square_diamond_square_pass(1)])), \
+            _square_diamond_square_in_profile()
+    return _scaled(_square_diamond_square_pass, _square_diamond_square_in_profile, passes, 2)
+
+
+def oval_square_oval_square():
+    in_profile = Profile.from_groove(
+        groove=SquareGroove(
+            usable_width=40.74e-3,
+            tip_depth=20.05e-3,
+            r1=7e-3,
+            r2=5e-3
+        ),
+        gap=3e-3,
+        filling=0.9,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C20", "steel"],
+        flow_stress=100e6
+    )
+
+    sequence = PassSequence(
+        [
+            RollPass(
+                label="Oval I",
+                orientation='h',
+                roll=Roll(
+                    groove=CircularOvalGroove(
+                        depth=7.25e-3,
+                        r1=6e-3,
+                        r2=44.5e-3
+                    ),
+                    nominal_radius=(324e-3 + 320e-3) / 2 / 2,
+                ),
+                velocity=1,
+                gap=3e-3,
+            ),
+            Transport(
+                duration=1
+            ),
+            RollPass(
+                label="Quadrat II",
+                orientation='v',
+                roll=Roll(
+                    groove=SquareGroove(
+                        usable_width=29.64e-3,
+                        tip_depth=14.625e-3,
+                        r1=6e-3,
+                        r2=4e-3
+                    ),
+                    nominal_radius=(328e-3 + 324e-3) / 2 / 2
+                ),
+                velocity=1,
+                gap=3e-3,
+            )
+        ]
+    )
+    return sequence, in_profile
+
+
+def three_roll_round_flat_flat():
+    in_profile = Profile.round(
+        diameter=96e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+        length=1,
+        density=7.5e3,
+        specific_heat_capacity=690,
+        thermal_conductivity=23
+    )
+
+    sequence = PassSequence([
+        ThreeRollPass(
+            label="Stand - I",
+            orientation="Y",
+            roll=Roll(
+                groove=FlatGroove(
+                    r1=5e-3,
+                    usable_width=90e-3,
+                    pad_angle=30,
+                ),
+                nominal_radius=293e-3 / 2,
+                rotational_frequency=1.73,
+            ),
+            inscribed_circle_diameter=85e-3,
+        ),
+        Transport(
+            label="I->II",
+            length=0.72,
+        ),
+        ThreeRollPass(
+            label="Stand - II",
+            orientation="AntiY",
+            roll=Roll(
+                groove=FlatGroove(
+                    r1=5e-3,
+                    usable_width=90e-3,
+                    pad_angle=30,
+                ),
+                nominal_radius=292.3e-3 / 2,
+                rotational_frequency=1.913,
+            ),
+            inscribed_circle_diameter=70e-3,
+        )
+    ])
+    return sequence, in_profile
+
+
+def _three_roll_in_profile():
+    return Profile.round(
+        diameter=71e-3,
+        temperature=1000 + 273.15,
+        strain=0,
+        material=["S304", "steel"],
+        flow_stress=100e6,
+        length=1,
+        density=7.5e3,
+        specific_heat_capacity=690,
+        thermal_conductivity=23
+    )
+
+
+def _three_roll_oval_pass(label, usable_width, r2, nominal_radius, rotational_frequency, inscribed_circle_diameter):
+    return ThreeRollPass(
+        label=label,
+        roll=Roll(
+            groove=CircularOvalGroove(
+                usable_width=usable_width,
+                r1=0.1e-3,
+                r2=r2,
+                pad_angle=30
+            ),
+            nominal_radius=nominal_radius,
+            rotational_frequency=rotational_frequency
+        ),
+        inscribed_circle_diameter=inscribed_circle_diameter,
+    )
+
+
+def three_roll_round_oval_oval():
+    sequence = PassSequence([
+        _three_roll_oval_pass("Oval I", 67.12e-3, 129e-3 / 2, 195e-3 / 2, 130 * 1 / 60, 59.9e-3),
+        Transport(label="I => II", duration=1),
+        _three_roll_oval_pass("Oval II", 62.37e-3, 129e-3 / 2, 197e-3 / 2, 100 * 1 / 60, 54.4e-3),
+        Transport(label="II => III", duration=1),
+        _three_roll_oval_pass("Oval III", 56.25e-3, 129e-3 / 2, 201e-3 / 2, 100 * 1 / 60, 47.7e-3),
+    ])
+    return sequence, _three_roll_in_profile()
+
+
+def _three_roll_oval_series_pass(i: int, f: float = 1):
+    return _three_roll_oval_pass(f"Oval {i + 1}", 67.12e-3 * f, 129e-3 / 2 * f, 195e-3 / 2 * f, 130 * 1 / 60, 59.9e-3 * f)
+
+
+def three_roll_oval_series(passes: int = 3):
+    return _scaled(_three_roll_oval_series_pass, _three_roll_in_profile, passes, 1)
+
+
+SEQUENCES = {
+    "round_oval_round": round_oval_round,
+    "square_diamond_square": square_diamond_square,
+    "oval_square_oval_square": oval_square_oval_square,
+    "3rp_round_flat_flat": three_roll_round_flat_flat,
+    "3rp_round_oval_oval": three_roll_round_oval_oval,
+}
+"""The sequences of the solve tests."""
+
+SCALED_SEQUENCES = {
+    "round_oval_round": round_oval_round,
+    "square_diamond_square": square_diamond_square,
+    "3rp_oval_series": three_roll_oval_series,
+}
+"""Sequence factories accepting a pass count for scaled-up benchmarks."""
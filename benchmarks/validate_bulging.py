@@ -0,0 +1,77 @@
+"""
+Accuracy-versus-speed validation of the bulging configurations.
+
+Generates a corpus of bulge radii, including the branch points and fallbacks of the builders, behind every roll pass
+of the test sequences and of scaled-up sequences, evaluates each configuration of
+``pyroll.profile_bulging.validation.CONFIGURATIONS`` on it and compares the bulged area, width and height against a
+high-resolution reference. Prints a table of the errors next to the runtimes with the Pareto-optimal configurations
+marked, and the maximum errors per kind of case.
+
+Run with ``python benchmarks/validate_bulging.py``.
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from dataclasses import asdict
+from pathlib import Path
+
+import pyroll.wusatowski_spreading
+from pyroll.profile_bulging import validation
+
+from sequences import SEQUENCES, SCALED_SEQUENCES
+
+
+def solved_sequences(passes):
+    """Solve the test sequences and the scaled-up ones with ``passes`` passes."""
+    jobs = [(name, factory, None) for name, factory in SEQUENCES.items()]
+    jobs += [(f"{name}_{passes}", factory, passes) for name, factory in SCALED_SEQUENCES.items()]
+    sequences = []
+
+    for name, factory, n in jobs:
+        print(f"Solving {name} ...", file=sys.stderr)
+        sequence, in_profile = factory() if n is None else factory(n)
+        sequence.solve(in_profile)
+        sequences.append(sequence)
+
+    return sequences
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--passes", type=int, default=6, help="pass count of the scaled-up sequences")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per configuration")
+    parser.add_argument("--margin", type=float, default=1e-3,
+                        help="relative distance of the radii around the branch points of the builders")
+    parser.add_argument("--configurations", nargs="*",
+                        help="names of the configurations to run, all if omitted")
+    parser.add_argument("-o", "--output", type=Path, help="JSON file to write the rows to")
+    args = parser.parse_args(argv)
+
+    # the sequences are kept referenced, as the roll passes refer to them for the previous passes
+    sequences = solved_sequences(args.passes)
+    cases = validation.generate_corpus([rp for s in sequences for rp in s.roll_passes], margin=args.margin)
+    coverage = Counter((c.builder, c.kind) for c in cases)
+    print(f"{len(cases)} cases:", file=sys.stderr)
+    for (builder, kind), count in sorted(coverage.items()):
+        print(f"  {builder:60s} {kind:12s} {count:4d}", file=sys.stderr)
+
+    configurations = validation.CONFIGURATIONS
+    if args.configurations:
+        configurations = [c for c in configurations if c.name in args.configurations]
+
+    rows = validation.validate(cases, configurations, repeat=args.repeat)
+    print(validation.format_table(rows))
+    print()
+    print(validation.format_kind_table(rows))
+
+    if args.output:
+        args.output.write_text(json.dumps(
+            [dict(asdict(row), max_error=row.max_error) for row in rows], indent=2, default=str
+        ))
+        print(f"Rows written to {args.output}.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
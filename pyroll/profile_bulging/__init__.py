@@ -1,3 +1,29 @@
+import importlib
+
 VERSION = "3.0.0"
 
+from .config import Config
+from .cache import cross_section_cache, pass_geometry_cache
+from .incremental import incremental_memo
+
+from . import parameters
+from . import radius_models
+from . import registry
+from . import contour
 from . import symmetric_roll_pass
+
+# optional tools are imported on first access to keep the import of the plugin light
+_LAZY_MODULES = {
+    "batch", "calibration", "compact", "export", "instrumentation", "parallel", "sensitivities", "simplification",
+    "surrogate", "sweep", "validation",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name == "surrogate_tables":
+        return importlib.import_module(f"{__name__}.surrogate").surrogate_tables
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
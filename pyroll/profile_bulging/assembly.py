@@ -0,0 +1,232 @@
+import functools
+import math
+from typing import Optional
+
+import numpy as np
+
+_EPS = 1e-12
+
+
+def circle_coords(center, radius: float, quad_segs: int) -> np.ndarray:
+    """
+    Closed ring of the vertices of a circle tessellated like ``Point(center).buffer(radius, quad_segs)``,
+    but running counter-clockwise from the rightmost point.
+    """
+    angles = np.arange(4 * quad_segs + 1) * (math.pi / 2 / quad_segs)
+    coords = np.column_stack([center[0] + radius * np.cos(angles), center[1] + radius * np.sin(angles)])
+    coords[-1] = coords[0]
+    return coords
+
+
+def polygon_crossings(coords, center, radius: float, quad_segs: int) -> np.ndarray:
+    """
+    Intersection points of a line string given by its vertex coordinates with the boundary of the tessellated circle
+    of :py:func:`circle_coords`. Segments crossing the boundary twice are not detected.
+    """
+    coords = np.asarray(coords, dtype=float)
+    step = math.pi / 2 / quad_segs
+    relative = coords - center
+    angles = np.arctan2(relative[:, 1], relative[:, 0]) % (2 * math.pi)
+
+    # distance of the chord from the center along the ray through each vertex
+    limits = radius * math.cos(step / 2) / np.cos(angles - (np.floor(angles / step) + 0.5) * step)
+    inside = np.hypot(relative[:, 0], relative[:, 1]) < limits
+    segments = np.flatnonzero(inside[:-1] != inside[1:])
+
+    if len(segments) == 0:
+        return np.empty((0, 2))
+
+    ring = circle_coords(center, radius, quad_segs)
+    p, r = coords[segments, np.newaxis], coords[segments + 1, np.newaxis] - coords[segments, np.newaxis]
+    q, s = ring[np.newaxis, :-1], ring[np.newaxis, 1:] - ring[np.newaxis, :-1]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        denominator = _cross(r, s)
+        t = _cross(q - p, s) / denominator
+        u = _cross(q - p, r) / denominator
+
+    hits = (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    rows, columns = np.nonzero(hits)
+    return p[rows, 0] + t[rows, columns, np.newaxis] * r[rows, 0]
+
+
+def _cross(a, b):
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_half_circle(quad_segs: int):
+    coords = circle_coords((0, 0), 1, quad_segs)[2 * quad_segs::-1]
+    coords[[0, -1], 1] = 0
+    coords.flags.writeable = False
+    return coords[:, 0], coords[:, 1]
+
+
+class Curve:
+    """
+    Polyline bounding the region between itself and the abscissa, given by strictly ascending abscissae
+    like :py:class:`pyroll.profile_bulging.contour.Envelope`, but made of straight segments only.
+
+    Regions are combined by :py:meth:`minimum` (intersection) and :py:meth:`maximum` (union) in a single sweep over
+    the merged vertices, inserting the crossings of both curves directly, so no general polygon boolean operation
+    is involved. The vertices of the result are the ones of the curve bounding it on either side and the crossings.
+    """
+
+    def __init__(self, x, y):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+
+    @classmethod
+    def vertical(cls, coords) -> Optional["Curve"]:
+        """Curve from a line string with strictly ascending abscissae, returns None otherwise."""
+        coords = np.asarray(coords, dtype=float)
+
+        if len(coords) < 2 or np.any(np.diff(coords[:, 0]) <= 0):
+            return None
+
+        return cls(coords[:, 0], coords[:, 1])
+
+    @classmethod
+    def circle(cls, center_x: float, radius: float, quad_segs: int) -> Optional["Curve"]:
+        """Curve of the upper half of the circle around ``(center_x, 0)`` tessellated like :py:func:`circle_coords`."""
+        if not radius > 0:
+            return None
+
+        x, y = _unit_half_circle(quad_segs)
+        return cls(center_x + radius * x, radius * y)
+
+    @property
+    def start(self) -> float:
+        return self.x[0]
+
+    @property
+    def end(self) -> float:
+        return self.x[-1]
+
+    @property
+    def coords(self) -> np.ndarray:
+        return np.column_stack([self.x, self.y])
+
+    def at(self, x) -> np.ndarray:
+        """Ordinates of the curve at the abscissae ``x``, which must lie within its range."""
+        return np.interp(x, self.x, self.y)
+
+    def restrict(self, start: float, end: float) -> Optional["Curve"]:
+        """The part of the curve with abscissae between ``start`` and ``end``, None if empty."""
+        start, end = max(start, self.start), min(end, self.end)
+
+        if not end - start > _EPS:
+            return None
+
+        first, last = np.searchsorted(self.x, [start, end], side="right")
+        if self.x[last - 1] == end:
+            last -= 1
+
+        return Curve(
+            np.concatenate([[start], self.x[first:last], [end]]),
+            np.concatenate([self.at([start]), self.y[first:last], self.at([end])]),
+        )
+
+    def _sweep(self, other: "Curve", start: float, end: float):
+        """
+        Merged abscissae within ``start`` and ``end`` including the crossings of both curves,
+        the ordinates of both curves there and which of them are vertices of this curve, the other one or crossings.
+        """
+        x = np.concatenate([self.x, other.x])
+        order = np.argsort(x, kind="stable")
+        x = x[order]
+        first, last = np.searchsorted(x, start, side="left"), np.searchsorted(x, end, side="right")
+        x, own = x[first:last], np.where(order[first:last] < len(self.x), 1, 2)
+        a, b = self.at(x), other.at(x)
+
+        # at most one crossing per interval, as both curves are straight in between
+        difference = a - b
+        overlap = (x[:-1] >= max(self.start, other.start)) & (x[1:] <= min(self.end, other.end))
+        crossing = np.flatnonzero((difference[:-1] * difference[1:] < 0) & overlap)
+
+        if len(crossing):
+            t = difference[crossing] / (difference[crossing] - difference[crossing + 1])
+            crossing_x = x[crossing] + t * (x[crossing + 1] - x[crossing])
+            crossing_y = a[crossing] + t * (a[crossing + 1] - a[crossing])
+            x = np.insert(x, crossing + 1, crossing_x)
+            a = np.insert(a, crossing + 1, crossing_y)
+            b = np.insert(b, crossing + 1, crossing_y)
+            own = np.insert(own, crossing + 1, 3)
+
+        return x, a, b, own
+
+    @staticmethod
+    def _distinct(x, y) -> "Curve":
+        keep = np.ones(len(x), dtype=bool)
+        # crossings computed on both curves may differ in the last digits, which would leave zigzags of zero width
+        keep[1:] = (np.abs(np.diff(x)) > _EPS) | (np.abs(np.diff(y)) > _EPS)
+        return Curve(x[keep], y[keep])
+
+    def minimum(self, other: Optional["Curve"]) -> Optional["Curve"]:
+        """Curve of the intersection of both regions, None if it is empty."""
+        if other is None:
+            return None
+
+        start, end = max(self.start, other.start), min(self.end, other.end)
+        if not end - start > _EPS:
+            return None
+
+        x, a, b, own = self._sweep(other, start, end)
+        take_a = a <= b
+
+        keep = (np.where(take_a, own & 1, own & 2) > 0) | (a == b)
+        keep[[0, -1]] = True
+        return self._distinct(x[keep], np.where(take_a, a, b)[keep])
+
+    def maximum(self, other: Optional["Curve"]) -> Optional["Curve"]:
+        """
+        Curve of the union of both regions, None if it is not connected.
+        Where a region ends inside the other one, the resulting curve jumps, so its abscissae repeat there.
+        """
+        if other is None:
+            return self
+
+        start, end = min(self.start, other.start), max(self.end, other.end)
+        if max(self.start, other.start) - min(self.end, other.end) > _EPS:
+            return None
+
+        x, a, b, own = self._sweep(other, start, end)
+        bounds = (x == self.start) | (x == self.end) | (x == other.start) | (x == other.end)
+
+        # limits from the left and from the right, as the regions may end in between
+        sides = (
+            ((x > self.start) & (x <= self.end), (x > other.start) & (x <= other.end)),
+            ((x >= self.start) & (x < self.end), (x >= other.start) & (x < other.end)),
+        )
+        limits = []
+
+        for side_a, side_b in sides:
+            take_a = side_a & ((a >= b) | ~side_b)
+            take_b = side_b & ~take_a
+            keep = (take_a & (own & 1 > 0)) | (take_b & (own & 2 > 0)) | ((take_a | take_b) & bounds)
+            limits.append((keep, np.where(take_a, a, b)))
+
+        (keep_left, left), (keep_right, right) = limits
+        keep_right &= ~keep_left | (left != right)
+
+        merged_keep = np.column_stack([keep_left, keep_right]).ravel()
+        merged_y = np.column_stack([left, right]).ravel()[merged_keep]
+        return self._distinct(np.repeat(x, 2)[merged_keep], merged_y)
+
+    def quadrant_arc(self) -> Optional[np.ndarray]:
+        """
+        Outer arc of the region in the first quadrant running counter-clockwise from the abscissa to the ordinate,
+        like :py:func:`pyroll.profile_bulging.symmetry.outer_arc`. None if the region does not reach the ordinate.
+        """
+        if abs(self.start) > _EPS or not self.y[0] > _EPS:
+            return None
+
+        arc = self.coords[::-1]
+        arc[-1, 0] = 0
+
+        if arc[0, 1] > _EPS:
+            arc = np.concatenate([[(arc[0, 0], 0)], arc])
+        else:
+            arc[0, 1] = 0
+
+        return arc
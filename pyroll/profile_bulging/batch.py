@@ -0,0 +1,378 @@
+import copy
+import logging
+import math
+
+import numpy as np
+import shapely
+
+from . import parameters, radius_models, registry, symmetry
+from .tessellation import quad_segs
+
+
+def _classifier_set(classifiers):
+    if isinstance(classifiers, str):
+        return {classifiers}
+    return set(classifiers)
+
+
+def _arrays(names, values):
+    result = {}
+
+    for name in names:
+        value = values[name]
+
+        if value is None:
+            raise ValueError(f"The parameter '{name}' is required for the selected bulge radius model.")
+
+        result[name] = np.asarray(value, dtype=float)
+
+    return result
+
+
+def bulge_radii(
+        in_classifiers,
+        pass_classifiers,
+        width,
+        in_width=None,
+        in_area=None,
+        r2=None,
+        usable_width=None,
+        height=None,
+        inscribed_circle_diameter=None,
+        displaced_area=None,
+        oval_radius=None,
+        parameter_profile=None,
+):
+    """
+    Vectorized counterpart of ``BulgingModel.bulge_radius`` for parameter sweeps.
+    All numeric arguments may be scalars or NumPy arrays and are broadcast against each other,
+    the model is resolved once from the classifier pair by :py:func:`pyroll.profile_bulging.registry.resolve`
+    like in the scalar implementation.
+
+    :param in_classifiers: classifiers of the incoming profile (a single string or an iterable of strings)
+    :param pass_classifiers: classifiers of the roll pass, include ``"3fold"`` for three-roll passes
+    :param width: width of the outgoing profile
+    :param in_width: width of the incoming profile
+    :param in_area: cross-section area of the incoming profile
+    :param r2: groove radius r2
+    :param usable_width: usable width of the groove
+    :param height: height of the roll pass
+    :param inscribed_circle_diameter: inscribed circle diameter of three-roll passes
+    :param displaced_area: displaced cross-section area of three-roll passes
+    :param oval_radius: groove radius r2 of the previous oval pass (oval-round two-roll passes only)
+    :param parameter_profile: name or instance of the parameter profile of the models,
+        defaults to :py:attr:`Config.PARAMETER_PROFILE`
+    :return: array of bulge radii
+    :raises ValueError: if no model with a vectorized counterpart is registered for the classifier pair
+        or a required parameter is missing
+    """
+    from .symmetric_roll_pass import BulgingModel
+
+    in_classifiers = _classifier_set(in_classifiers)
+    pass_classifiers = _classifier_set(pass_classifiers)
+    pair = registry.resolve(in_classifiers, pass_classifiers)
+    model = None
+
+    # functions registered by other plugins have no vectorized counterpart
+    if pair is not None and getattr(BulgingModel, pair.bulge_radius.__name__, None) is pair.bulge_radius:
+        model = _RADIUS_MODELS.get(pair.bulge_radius.__name__)
+
+    if model is None:
+        raise ValueError(
+            f"No vectorized bulge radius model available for in-profile classifiers {sorted(in_classifiers)} "
+            f"and roll pass classifiers {sorted(pass_classifiers)}."
+        )
+
+    function, names, constant = model
+    values = dict(
+        width=width,
+        in_width=in_width,
+        in_area=in_area,
+        in_equivalent_radius=np.sqrt(np.asarray(in_area, dtype=float) / np.pi) if in_area is not None else None,
+        r2=r2,
+        usable_width=usable_width,
+        height=height,
+        inscribed_circle_diameter=inscribed_circle_diameter,
+        displaced_area=displaced_area,
+        oval_radius=oval_radius,
+    )
+    kwargs = _arrays(names, values)
+
+    if constant is not None:
+        keyword, attribute = constant
+        kwargs[keyword] = getattr(parameters.resolve(parameter_profile), attribute)
+
+    return np.asarray(function(**kwargs), dtype=float)
+
+
+_RADIUS_MODELS = {
+    "two_roll_bulge_radius_round_oval_lee": (
+        radius_models.two_roll_bulge_radius_round_oval_lee,
+        ["width", "in_width", "in_equivalent_radius", "usable_width", "r2", "height"],
+        ("weight_factor", "lee_weight_factor"),
+    ),
+    "two_roll_bulge_radius_oval_round_lee": (
+        radius_models.two_roll_bulge_radius_oval_round_lee,
+        ["width", "in_width", "usable_width", "r2", "height", "oval_radius"],
+        ("weight_factor", "lee_weight_factor"),
+    ),
+    "two_roll_bulge_radius_model_schmidt": (
+        radius_models.two_roll_bulge_radius_model_schmidt,
+        ["width", "r2", "height"],
+        None,
+    ),
+    "three_roll_bulge_radius_round_round_and_oval_oval_byon": (
+        radius_models.three_roll_bulge_radius_round_round_and_oval_oval_byon,
+        ["width"],
+        None,
+    ),
+    "three_roll_bulge_radius_round_oval_byon": (
+        radius_models.three_roll_bulge_radius_round_oval_byon,
+        ["width", "in_width", "in_area", "displaced_area"],
+        ("eccentricity_factor", "byon_eccentricity_factor"),
+    ),
+    "three_roll_bulge_radius_oval_round_byon": (
+        radius_models.three_roll_bulge_radius_oval_round_byon,
+        ["in_width", "in_area", "displaced_area", "inscribed_circle_diameter"],
+        ("eccentricity_factor", "byon_eccentricity_factor"),
+    ),
+    "three_roll_bulge_radius_model_min": (
+        radius_models.three_roll_bulge_radius_model_min,
+        ["width", "in_width", "in_area", "displaced_area"],
+        ("eccentricity_factor", "min_eccentricity_factor"),
+    ),
+}
+"""
+Vectorized radius model functions by name of the ``BulgingModel`` method registered as bulge radius model,
+with the names of their array arguments and the keyword and attribute of the constant of the parameter profile.
+"""
+
+
+def _circles(centers, radii) -> np.ndarray:
+    """Circles around ``centers`` of shape ``(n, 2)``, tessellated like in the scalar builders."""
+    result = np.empty(len(radii), dtype=object)
+    segments = np.array([quad_segs(r) for r in radii], dtype=int)
+
+    for count in np.unique(segments):
+        selected = segments == count
+        result[selected] = shapely.buffer(shapely.points(centers[selected]), radii[selected], quad_segs=int(count))
+
+    return result
+
+
+def _quadrant_circles(center_x, radii) -> np.ndarray:
+    circles = _circles(np.column_stack([center_x, np.zeros_like(center_x)]), radii)
+    return shapely.clip_by_rect(circles, 0, 0, math.inf, math.inf)
+
+
+def _quadrant_strips(max_quadrants, half_widths) -> np.ndarray:
+    tops = shapely.bounds(max_quadrants)[:, 3]
+    return shapely.intersection(max_quadrants, shapely.box(0, 0, half_widths, tops))
+
+
+def _mirrored(pieces) -> np.ndarray:
+    result = np.empty(len(pieces), dtype=object)
+
+    for i, piece in enumerate(pieces):
+        result[i] = symmetry.assemble_mirrored(piece)
+
+        if result[i] is None:
+            result[i] = shapely.union_all(symmetry.mirrored_copies(piece))
+
+    return result
+
+
+def _scalar(models, profiles, radii, rows) -> np.ndarray:
+    """Cross-sections of the selected ``rows`` built one by one by the scalar builder."""
+    result = np.empty(len(rows), dtype=object)
+
+    for i, row in enumerate(rows):
+        profile = copy.copy(profiles[row])
+        profile.bulge_radius = radii[row]
+        result[i] = models[row].cross_section(profile)
+
+    return result
+
+
+def _round_oval_round(models, profiles, widths, radii) -> np.ndarray:
+    geometries = [m.pass_geometry() for m in models]
+    max_quadrants = np.array([g.max_quadrant for g in geometries], dtype=object)
+    max_boundaries = np.array([g.max_boundary for g in geometries], dtype=object)
+    max_bounds = shapely.bounds(np.array([g.max_cross_section for g in geometries], dtype=object))
+
+    circle_centers = widths / 2 - radii
+    right_circles = _circles(np.column_stack([circle_centers, np.zeros_like(circle_centers)]), radii)
+    right_boundaries = shapely.boundary(right_circles)
+    hit = shapely.intersects(max_boundaries, right_boundaries)
+
+    misses = np.count_nonzero(~hit)
+    if misses:
+        logging.getLogger(__name__).info(
+            "No intersection point found for %d profiles. Continuing without bulging.", misses)
+
+    pieces = np.full(len(profiles), None, dtype=object)
+
+    # inside the first quadrant the intersection of the left and right circle is the one centered left
+    # and their union the one centered right
+    overlapping = hit & (radii * 2 > np.abs(max_bounds[:, 0]) + max_bounds[:, 2])
+    pieces[overlapping] = shapely.intersection(
+        _quadrant_circles(-np.abs(circle_centers[overlapping]), radii[overlapping]), max_quadrants[overlapping]
+    )
+
+    separate = hit & ~overlapping
+    if separate.any():
+        points = shapely.intersection(max_boundaries[separate], right_boundaries[separate])
+        coords, index = shapely.get_coordinates(points, return_index=True)
+        order = np.lexsort((np.abs(coords[:, 1]), index))
+        first = order[np.unique(index[order], return_index=True)[1]]
+
+        pieces[separate] = shapely.union(
+            _quadrant_strips(max_quadrants[separate], np.abs(coords[first, 0])),
+            shapely.intersection(
+                max_quadrants[separate], _quadrant_circles(np.abs(circle_centers[separate]), radii[separate])
+            ),
+        )
+
+    result = np.full(len(profiles), None, dtype=object)
+    result[hit] = _mirrored(pieces[hit])
+    return result
+
+
+def _square(models, profiles, widths, radii, union_bulges: bool) -> np.ndarray:
+    geometries = [m.pass_geometry() for m in models]
+    max_quadrants = np.array([g.max_quadrant for g in geometries], dtype=object)
+    r2 = np.array([m.symmetric_roll_pass.roll.groove.r2 for m in models], dtype=float)
+    heights = np.array([m.symmetric_roll_pass.height for m in models], dtype=float)
+
+    with np.errstate(invalid="ignore"):
+        separation_point_z_coordinates = r2 * np.sin(np.arcsin((widths / 2 - radii) / (r2 - radii)))
+
+    # inside the first quadrant the union of the left and right bulge is the one centered right
+    # and their intersection the one centered left
+    bulge_centers = np.abs(widths / 2 - radii)
+    small = 2 * radii < heights
+
+    # the argument of the arcsin is out of its domain, which the scalar builder handles on its own
+    scalar = small & ~np.isfinite(separation_point_z_coordinates)
+    small &= ~scalar
+    large = ~small & ~scalar
+    pieces = np.empty(len(profiles), dtype=object)
+
+    pieces[small] = shapely.union(
+        _quadrant_circles(bulge_centers[small], radii[small]),
+        _quadrant_strips(max_quadrants[small], np.abs(separation_point_z_coordinates[small])),
+    )
+    pieces[large] = shapely.intersection(
+        _quadrant_circles(bulge_centers[large] if union_bulges else -bulge_centers[large], radii[large]),
+        _quadrant_strips(max_quadrants[large], widths[large] / 2),
+    )
+
+    result = np.empty(len(profiles), dtype=object)
+    result[~scalar] = _mirrored(pieces[~scalar])
+    result[scalar] = _scalar(models, profiles, radii, np.flatnonzero(scalar))
+    return result
+
+
+def _n_fold(models, profiles, widths, radii) -> np.ndarray:
+    from .symmetric_roll_pass import N_FOLD_HELPER_FACTORS
+
+    cross_sections = np.array([p.cross_section for p in profiles], dtype=object)
+    key = models[0].n_fold_classifiers()
+    if key is None:
+        return cross_sections
+
+    helper_factor = N_FOLD_HELPER_FACTORS[key]
+    fold = registry.fold_count(models[0].symmetric_roll_pass.classifiers)
+    start_angle = symmetry.gap_angle(fold)
+    offset_distances = widths / 2 - radii
+
+    extents = 2 * np.maximum.reduce([np.max(np.abs(shapely.bounds(cross_sections)), axis=1), widths, radii])
+    cut = shapely.intersection(cross_sections, symmetry.sectors(fold, start_angle, extents))
+
+    # see BulgingModel.n_fold_bulged_cross_section for the reduction to the bulge of the first gap
+    directions = symmetry.directions(fold, start_angle)
+    centers = offset_distances[:, np.newaxis, np.newaxis] * directions
+    bulges = _circles(centers.reshape(-1, 2), np.repeat(radii, fold)).reshape(-1, fold)
+    single = (np.abs(offset_distances) < radii) & ((offset_distances >= 0) == (helper_factor is not None))
+    bulges[single, 1:] = None
+
+    if helper_factor is None:
+        pieces = shapely.intersection_all(np.column_stack([cut, bulges]), axis=1)
+    else:
+        helpers = np.array([
+            m._sector_helper(fold, start_angle, w * helper_factor) for m, w in zip(models, widths)
+        ], dtype=object)
+        parts = shapely.intersection(cut[:, np.newaxis], bulges)
+        pieces = shapely.union_all(np.column_stack([helpers, parts]), axis=1)
+
+    result = np.empty(len(profiles), dtype=object)
+
+    for i, piece in enumerate(pieces):
+        result[i] = symmetry.assemble(piece, fold, start_angle)
+
+        if result[i] is None:
+            result[i] = shapely.union_all(symmetry.rotated_copies(piece, fold))
+
+    return result
+
+
+def bulged_cross_sections(roll_passes, profiles) -> np.ndarray:
+    """
+    Vectorized counterpart of ``BulgingModel.cross_section`` for large sweeps.
+    The bulges and their intersections with the helper geometries of all profiles are built by single
+    vectorized shapely calls, only the final assembly of the symmetric cross-sections runs per profile.
+    Profiles the vectorized builders do not cover, like square passes with the separation point out of reach
+    of the groove radius, are passed to the scalar builder.
+
+    The vectorized builders always use boolean operations on polygons, regardless of
+    :py:attr:`Config.CONSTRUCTIVE_CROSS_SECTION`. Their results equal the ones of the constructive assembly
+    up to rounding, with vertices in a different order.
+
+    :param roll_passes: solved roll passes, one per profile or a single one for all profiles,
+        all of the same classifier pair
+    :param profiles: unbulged profiles, the bulge radius is computed if it is not set
+    :return: object array of the bulged cross-sections, ``None`` where the builder found no bulge
+    :raises ValueError: if the roll passes and profiles do not match or resolve to different builders
+    """
+    from pyroll.core import SymmetricRollPass
+    from .symmetric_roll_pass import BulgingModel
+
+    profiles = list(profiles)
+    if isinstance(roll_passes, SymmetricRollPass):
+        roll_passes = [roll_passes] * len(profiles)
+    roll_passes = list(roll_passes)
+
+    if len(roll_passes) != len(profiles):
+        raise ValueError("The count of roll passes and profiles must be equal.")
+
+    if not profiles:
+        return np.empty(0, dtype=object)
+
+    unique_models = {}
+    models = [unique_models.setdefault(id(rp), BulgingModel(rp)) for rp in roll_passes]
+    pairs = {m.model_pair for m in unique_models.values()}
+
+    if len(pairs) != 1:
+        raise ValueError("All roll passes must resolve to the same bulging model.")
+
+    pair = pairs.pop()
+    if pair is None:
+        return np.array([p.cross_section for p in profiles], dtype=object)
+
+    widths = np.array([p.width for p in profiles], dtype=float)
+    radii = np.array([
+        p.bulge_radius if p.has_set("bulge_radius") else m.bulge_radius(p) for m, p in zip(models, profiles)
+    ], dtype=float)
+
+    if pair.cross_section is BulgingModel.two_roll_bulged_cross_section_polygon_round_oval_round:
+        return _round_oval_round(models, profiles, widths, radii)
+    if pair.cross_section is BulgingModel.two_roll_bulged_cross_section_polygon_square_diamond_square:
+        return _square(models, profiles, widths, radii, union_bulges=True)
+    if pair.cross_section is BulgingModel.two_roll_bulged_cross_section_polygon_square_oval_square:
+        return _square(models, profiles, widths, radii, union_bulges=False)
+    if pair.cross_section in (BulgingModel.n_fold_bulged_cross_section,
+                              BulgingModel.three_roll_pass_bulged_cross_section):
+        return _n_fold(models, profiles, widths, radii)
+
+    # builders registered by other plugins have no vectorized counterpart
+    return _scalar(models, profiles, radii, range(len(profiles)))
@@ -0,0 +1,353 @@
+import math
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import numpy as np
+import shapely
+from shapely import Polygon
+
+from . import symmetry
+from .assembly import Curve
+from .config import Config
+from .contour import Envelope
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the statistics of a :py:class:`CrossSectionCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _quantize(value, tolerance: float):
+    value = float(value)
+
+    if not math.isfinite(value):
+        return repr(value)
+
+    return round(value / tolerance)
+
+
+def groove_values(groove):
+    """Get the public numeric attributes of a groove as sorted list of ``(name, value)`` tuples."""
+    return [
+        (name, float(value))
+        for name, value in sorted(groove.__dict__.items())
+        if not name.startswith("_") and isinstance(value, (int, float)) and not isinstance(value, bool)
+    ]
+
+
+def _groove_parameters(groove, tolerance: float):
+    return tuple((name, _quantize(value, tolerance)) for name, value in groove_values(groove))
+
+
+class CrossSectionCache:
+    """
+    Bounded least-recently-used cache of bulged cross-sections.
+
+    Entries are keyed by the groove geometry, the classifiers of the roll pass and its incoming profile,
+    the roll pass height and the width and bulge radius of the profile.
+    All lengths are quantized to :py:attr:`Config.CROSS_SECTION_CACHE_TOLERANCE`,
+    so profiles differing by less than the tolerance share an entry.
+
+    Lookups and stores are guarded by a lock, so the cache may be shared by threads solving independent sequences.
+    Entries are built outside of the lock, concurrent misses of the same key may build it twice.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, tolerance: Optional[float] = None):
+        """
+        :param max_size: maximum number of entries, defaults to :py:attr:`Config.CROSS_SECTION_CACHE_SIZE`
+        :param tolerance: quantization step of lengths, defaults to :py:attr:`Config.CROSS_SECTION_CACHE_TOLERANCE`
+        """
+        self._max_size = max_size
+        self._tolerance = tolerance
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return Config.CROSS_SECTION_CACHE_SIZE if self._max_size is None else self._max_size
+
+    @property
+    def tolerance(self) -> float:
+        return Config.CROSS_SECTION_CACHE_TOLERANCE if self._tolerance is None else self._tolerance
+
+    def key(self, roll_pass, profile) -> Optional[Hashable]:
+        """
+        Create the cache key for the bulged cross-section of ``profile`` in ``roll_pass``.
+        Returns ``None`` if the cache is disabled.
+        """
+        if self.max_size <= 0:
+            return None
+
+        tolerance = self.tolerance
+        groove = roll_pass.roll.groove
+
+        return (
+            type(groove).__name__,
+            _groove_parameters(groove, tolerance),
+            _quantize(groove.usable_width, tolerance),
+            _quantize(groove.depth, tolerance),
+            frozenset(roll_pass.classifiers),
+            frozenset(roll_pass.in_profile.classifiers),
+            str(roll_pass.orientation),
+            _quantize(roll_pass.height, tolerance),
+            _quantize(getattr(roll_pass, "inscribed_circle_diameter", 0), tolerance),
+            _quantize(profile.width, tolerance),
+            _quantize(profile.bulge_radius, tolerance),
+            Config.ANALYTIC_CROSS_SECTION,
+            Config.CONSTRUCTIVE_CROSS_SECTION,
+            Config.COMPACT_CROSS_SECTION,
+            Config.COMPACT_CROSS_SECTION_DTYPE,
+            Config.MAX_CHORD_DEVIATION,
+            Config.OUTPUT_VERTEX_BUDGET,
+            Config.OUTPUT_MAX_AREA_ERROR,
+        )
+
+    def get_or_build(self, key: Optional[Hashable], build: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Return the cached entry for ``key`` or build, store and return a new one.
+        A ``key`` of ``None`` bypasses the cache.
+
+        :return: tuple of the entry and whether it was taken from the cache
+        """
+        if key is None:
+            return build(), False
+
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value, True
+
+        value = build()
+
+        with self._lock:
+            self._entries[key] = value
+
+            while len(self._entries) > max(self.max_size, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return value, False
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache statistics."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            max_size=self.max_size,
+        )
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+cross_section_cache = CrossSectionCache()
+"""Global cache used by :py:class:`BulgingModel`."""
+
+
+class _cached:
+    """
+    Like :py:func:`functools.cached_property`, whose lock is shared by all instances before Python 3.12
+    and so serializes the builds of all roll passes across threads. Without a lock, concurrent first accesses
+    may build the value more than once, like misses of :py:class:`CrossSectionCache`, the last one is kept.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.__doc__ = function.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        # the value in the instance dictionary shadows this non-data descriptor on further accesses
+        value = instance.__dict__[self.name] = self.function(instance)
+        return value
+
+
+class PassGeometry:
+    """
+    Helper geometries of a roll pass, which depend only on its groove and gap.
+
+    The coordinates of the contour lines are copied eagerly, all geometries are built on first access.
+    Geometries clipped to a certain width are kept in a small LRU store per kind.
+    """
+
+    def __init__(self, roll_pass, signature: Hashable):
+        self.signature = signature
+        """Groove and gap the geometries were built for."""
+
+        self.contour_coords = [np.asarray(cl.coords) for cl in roll_pass.contour_lines.geoms]
+        """Coordinates of the contour lines of the roll pass."""
+
+        self._clipped = OrderedDict()
+        self._lock = threading.Lock()
+
+    @_cached
+    def max_cross_section(self) -> Polygon:
+        """The cross-section enclosed by the contour lines of the roll pass without contour refinement."""
+        return Polygon(np.concatenate(self.contour_coords))
+
+    @_cached
+    def max_boundary(self):
+        """Boundary of :py:attr:`max_cross_section`, prepared for repeated predicates."""
+        boundary = self.max_cross_section.boundary
+        shapely.prepare(boundary)
+        return boundary
+
+    @_cached
+    def max_quadrant(self) -> Polygon:
+        """:py:attr:`max_cross_section` clipped to the first quadrant."""
+        return symmetry.quadrant(self.max_cross_section)
+
+    @_cached
+    def upper_contour_coords(self) -> np.ndarray:
+        """Coordinates of the upper contour line with ascending abscissae."""
+        coords = max(self.contour_coords, key=lambda c: c[:, 1].mean())
+        return coords if coords[0, 0] < coords[-1, 0] else coords[::-1]
+
+    @_cached
+    def upper_boundary_coords(self) -> np.ndarray:
+        """:py:attr:`upper_contour_coords` closed down to the abscissa at both ends."""
+        coords = self.upper_contour_coords
+        return np.concatenate([[(coords[0, 0], 0)], coords, [(coords[-1, 0], 0)]])
+
+    @_cached
+    def quadrant_curve(self) -> Optional[Curve]:
+        """Vertical curve of the upper contour line in the first quadrant,
+        ``None`` if it is not a function of the abscissa."""
+        curve = Curve.vertical(self.upper_contour_coords)
+        return curve.restrict(0, math.inf) if curve is not None else None
+
+    @_cached
+    def groove_envelope(self) -> Optional[Envelope]:
+        """Vertical envelope of the upper contour line, ``None`` if it is not a function of the abscissa."""
+        return Envelope.from_line(self.upper_contour_coords)
+
+    @_cached
+    def max_envelope(self) -> Optional[Envelope]:
+        """Polar envelope of :py:attr:`max_cross_section`, ``None`` if it is not star-shaped."""
+        return Envelope.from_ring(np.concatenate(self.contour_coords))
+
+    def clipped(self, kind: Hashable, width: float, build: Callable[[], Any]) -> Any:
+        """
+        Return the geometry of ``kind`` clipped to ``width`` from the store or build it with ``build()``.
+        Widths are quantized to :py:attr:`Config.CROSS_SECTION_CACHE_TOLERANCE`.
+        """
+        key = kind, _quantize(width, Config.CROSS_SECTION_CACHE_TOLERANCE)
+
+        with self._lock:
+            try:
+                value = self._clipped[key]
+            except KeyError:
+                pass
+            else:
+                self._clipped.move_to_end(key)
+                return value
+
+        value = build()
+
+        with self._lock:
+            self._clipped[key] = value
+
+            while len(self._clipped) > max(Config.PASS_GEOMETRY_CACHE_WIDTHS, 0):
+                self._clipped.popitem(last=False)
+
+        return value
+
+
+class PassGeometryCache:
+    """
+    Cache of :py:class:`PassGeometry` instances per roll pass, reused across solver iterations and re-solutions.
+    The roll passes are referenced weakly, an entry is rebuilt if the groove or the gap of its roll pass changed.
+    Access is guarded by a lock, so the cache may be shared by threads.
+    """
+
+    def __init__(self):
+        self._entries = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def signature(roll_pass) -> Hashable:
+        groove = roll_pass.roll.groove
+        return type(groove), tuple(groove_values(groove)), float(roll_pass.gap)
+
+    def get(self, roll_pass) -> PassGeometry:
+        """Get the helper geometries of ``roll_pass``, built anew if the cache is disabled."""
+        signature = self.signature(roll_pass)
+
+        if Config.PASS_GEOMETRY_CACHE_WIDTHS <= 0:
+            return PassGeometry(roll_pass, signature)
+
+        with self._lock:
+            entry = self._entries.get(roll_pass)
+
+            if entry is not None and entry.signature == signature:
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            entry = PassGeometry(roll_pass, signature)
+            self._entries[roll_pass] = entry
+            return entry
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache statistics, the size is the number of roll passes."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=0,
+            size=len(self._entries),
+            max_size=-1,
+        )
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+pass_geometry_cache = PassGeometryCache()
+"""Global cache of roll pass helper geometries used by :py:class:`BulgingModel`."""
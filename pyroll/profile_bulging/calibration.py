@@ -0,0 +1,300 @@
+import copy
+from dataclasses import dataclass, fields
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+
+from . import batch, parameters, symmetry
+from .parameters import ParameterProfile
+
+FIELDS = ("area", "width", "height")
+"""Measured quantities the constants can be calibrated against."""
+
+RADIUS_FACTORS = np.geomspace(0.25, 4, 49)
+"""Default grid of bulge radii relative to the ones of the default constants, on which the responses are sampled."""
+
+FAILED_RESIDUAL = 10.0
+"""Relative deviation assigned to measurements of samples whose prediction failed, like for bulge radii
+the cross-section cannot be built with, so the fit is driven away from them instead of ignoring them."""
+
+_INPUTS = (
+    "width", "in_width", "in_area", "r2", "usable_width", "height", "inscribed_circle_diameter", "displaced_area",
+    "oval_radius",
+)
+
+
+@dataclass
+class CalibrationSamples:
+    """
+    Measurements of roll passes of one classifier pair together with the inputs of their bulge radius model
+    and the bulged area, width and height sampled over a grid of bulge radii, created by :py:func:`collect_samples`.
+    """
+
+    in_classifiers: frozenset
+    """Classifiers of the incoming profiles."""
+
+    pass_classifiers: frozenset
+    """Classifiers of the roll passes."""
+
+    inputs: dict
+    """Arrays of the inputs of :py:func:`pyroll.profile_bulging.batch.bulge_radii` per sample,
+    ``None`` for inputs not available."""
+
+    reference_radii: np.ndarray
+    """Bulge radii of the samples computed with the default constants."""
+
+    radius_factors: np.ndarray
+    """Ascending grid of bulge radii relative to :py:attr:`reference_radii`."""
+
+    responses: dict
+    """Arrays of shape ``(samples, radius factors)`` of the bulged area, width and height."""
+
+    measured: dict
+    """Arrays of the measured area, width and height per sample, ``NaN`` where not measured."""
+
+    def __len__(self):
+        return len(self.reference_radii)
+
+    def bulge_radii(self, profile: ParameterProfile) -> np.ndarray:
+        """Bulge radii of all samples with the constants of ``profile``."""
+        return batch.bulge_radii(
+            self.in_classifiers, self.pass_classifiers, **self.inputs, parameter_profile=profile
+        )
+
+    def predict(self, profile: ParameterProfile) -> dict:
+        """
+        Bulged area, width and height of all samples with the constants of ``profile``,
+        interpolated from the sampled responses linearly in the logarithm of the bulge radius.
+        Radii outside the grid are clamped to its ends.
+        """
+        grid = np.log(self.radius_factors)
+        position = np.log(np.abs(self.bulge_radii(profile)) / self.reference_radii)
+        position = np.clip(position, grid[0], grid[-1])
+
+        upper = np.clip(np.searchsorted(grid, position), 1, len(grid) - 1)
+        lower = upper - 1
+        fraction = (position - grid[lower]) / (grid[upper] - grid[lower])
+        rows = np.arange(len(self))
+
+        return {
+            name: values[rows, lower] * (1 - fraction) + values[rows, upper] * fraction
+            for name, values in self.responses.items()
+        }
+
+
+def _model_inputs(model, profile) -> dict:
+    from pyroll.core import SymmetricRollPass
+
+    roll_pass = model.symmetric_roll_pass
+    groove = roll_pass.roll.groove
+
+    try:
+        oval_radius = roll_pass.prev_of(SymmetricRollPass).roll.groove.r2
+    except (ValueError, IndexError, AttributeError):
+        oval_radius = None
+
+    try:
+        displaced_area = roll_pass.displaced_cross_section.area
+    except (ValueError, AttributeError):
+        displaced_area = None
+
+    return dict(
+        width=profile.width,
+        in_width=roll_pass.in_profile.width,
+        in_area=roll_pass.in_profile.cross_section.area,
+        r2=getattr(groove, "r2", None),
+        usable_width=groove.usable_width,
+        height=roll_pass.height,
+        inscribed_circle_diameter=getattr(roll_pass, "inscribed_circle_diameter", None),
+        displaced_area=displaced_area,
+        oval_radius=oval_radius,
+    )
+
+
+def collect_samples(
+        roll_passes: Sequence,
+        measured: Mapping[str, Sequence[float]],
+        radius_factors: Sequence[float] = RADIUS_FACTORS,
+) -> list:
+    """
+    Prepare measurements for :py:func:`calibrate`.
+
+    The bulged cross-sections of each roll pass are built once for the grid of bulge radii,
+    so the calibration itself evaluates the models only on arrays and never re-solves a roll pass.
+
+    :param roll_passes: solved roll passes the measurements were taken behind
+    :param measured: mapping of names in :py:data:`FIELDS` to the measured values in order of ``roll_passes``,
+        ``NaN`` for missing values
+    :param radius_factors: ascending grid of bulge radii relative to the ones of the default constants
+    :return: list of :py:class:`CalibrationSamples`, one per classifier pair
+    :raises ValueError: if a name is unknown, the counts do not match or no bulging model is available for a pass
+    """
+    from pyroll.core import Profile as BaseProfile
+    from .symmetric_roll_pass import BulgingModel
+
+    roll_passes = list(roll_passes)
+    radius_factors = np.asarray(radius_factors, dtype=float)
+
+    for name, values in measured.items():
+        if name not in FIELDS:
+            raise ValueError(f"Unknown measured quantity '{name}', expected one of {FIELDS}.")
+        if len(values) != len(roll_passes):
+            raise ValueError(f"The count of measured values of '{name}' does not match the count of roll passes.")
+
+    groups = {}
+
+    for i, roll_pass in enumerate(roll_passes):
+        model = BulgingModel(roll_pass)
+        model.parameter_profile = parameters.DEFAULT
+
+        if model.model_pair is None:
+            raise ValueError(f"No bulging model available for roll pass '{roll_pass.label}'.")
+
+        template = BaseProfile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+        reference = abs(model.bulge_radius(template))
+        profiles = []
+
+        for factor in radius_factors:
+            profile = copy.copy(template)
+            profile.bulge_radius = reference * factor
+            profiles.append(profile)
+
+        three_fold = "3fold" in roll_pass.classifiers
+        responses = np.array([
+            symmetry.dimensions(cs, three_fold) for cs in batch.bulged_cross_sections(roll_pass, profiles)
+        ])
+
+        key = frozenset(roll_pass.in_profile.classifiers), frozenset(roll_pass.classifiers)
+        groups.setdefault(key, []).append((i, _model_inputs(model, template), reference, responses))
+
+    samples = []
+
+    for (in_classifiers, pass_classifiers), entries in groups.items():
+        indices = [e[0] for e in entries]
+        inputs = {}
+
+        for name in _INPUTS:
+            values = [e[1][name] for e in entries]
+            inputs[name] = None if any(v is None for v in values) else np.array(values, dtype=float)
+
+        responses = np.stack([e[3] for e in entries])
+        samples.append(CalibrationSamples(
+            in_classifiers=in_classifiers,
+            pass_classifiers=pass_classifiers,
+            inputs=inputs,
+            reference_radii=np.array([e[2] for e in entries]),
+            radius_factors=radius_factors,
+            responses={name: responses[:, :, j] for j, name in enumerate(FIELDS)},
+            measured={
+                name: np.array([measured[name][i] if name in measured else np.nan for i in indices], dtype=float)
+                for name in FIELDS
+            },
+        ))
+
+    return samples
+
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    """Result of :py:func:`calibrate`."""
+
+    profile: ParameterProfile
+    """Profile of the fitted constants."""
+
+    fitted: tuple
+    """Names of the fitted constants, constants not affecting any sample keep their initial value."""
+
+    initial_rms: float
+    """Root mean square of the relative deviations from the measurements with the initial constants."""
+
+    rms: float
+    """Root mean square of the relative deviations from the measurements with the fitted constants."""
+
+    residuals: np.ndarray
+    """Relative deviations of the predictions from all measured values with the fitted constants."""
+
+
+def _residuals(samples: Sequence[CalibrationSamples], profile: ParameterProfile) -> np.ndarray:
+    result = []
+
+    for s in samples:
+        prediction = s.predict(profile)
+
+        for name in FIELDS:
+            measured = s.measured[name]
+            selected = np.isfinite(measured)
+            result.append((prediction[name][selected] - measured[selected]) / measured[selected])
+
+    if not result:
+        return np.empty(0)
+
+    result = np.concatenate(result)
+    return np.where(np.isfinite(result), result, FAILED_RESIDUAL)
+
+
+def calibrate(
+        samples: Sequence[CalibrationSamples],
+        initial: Optional[ParameterProfile] = None,
+        constants: Optional[Sequence[str]] = None,
+        name: Optional[str] = None,
+) -> CalibrationResult:
+    """
+    Fit the constants of the bulge radius models to measurements by least squares of the relative deviations
+    of the predicted from the measured quantities. The objective is evaluated for all samples at once.
+
+    Calibrate per mill or material by passing only the samples of it, the fitted profile can be registered
+    under a ``name`` and selected by :py:attr:`Config.PARAMETER_PROFILE` or the ``bulging_parameter_profile``
+    attribute of roll passes and pass sequences.
+
+    :param samples: samples created by :py:func:`collect_samples`
+    :param initial: profile of the initial constants, defaults to the published ones
+    :param constants: names of the constants to fit, by default all affecting any of the samples
+    :param name: name to register the fitted profile with, not registered if omitted
+    :raises ImportError: if SciPy is not installed
+    """
+    try:
+        from scipy.optimize import least_squares
+    except ImportError as e:
+        raise ImportError(
+            "Calibration requires SciPy, install it with 'pip install pyroll-profile-bulging[calibration]'."
+        ) from e
+
+    initial = initial or parameters.DEFAULT
+    samples = [s for s in samples if len(s)]
+    constants = list(constants) if constants is not None else [f.name for f in fields(ParameterProfile)]
+
+    def changes(constant):
+        perturbed = initial.replace(**{constant: getattr(initial, constant) * 1.01 + 1e-3})
+        return any(not np.allclose(s.bulge_radii(perturbed), s.bulge_radii(initial)) for s in samples)
+
+    fitted = tuple(c for c in constants if changes(c))
+    initial_residuals = _residuals(samples, initial)
+
+    def profile_of(x):
+        return initial.replace(**dict(zip(fitted, map(float, x))))
+
+    if fitted and len(initial_residuals):
+        solution = least_squares(
+            lambda x: _residuals(samples, profile_of(x)),
+            np.array([getattr(initial, c) for c in fitted], dtype=float),
+            x_scale="jac",
+        )
+        profile = profile_of(solution.x)
+    else:
+        profile = initial
+
+    residuals = _residuals(samples, profile)
+
+    if name is not None:
+        parameters.register_profile(name, profile)
+
+    def rms(r):
+        return float(np.sqrt(np.mean(r ** 2))) if len(r) else 0.0
+
+    return CalibrationResult(
+        profile=profile,
+        fitted=fitted,
+        initial_rms=rms(initial_residuals),
+        rms=rms(residuals),
+        residuals=residuals,
+    )
@@ -0,0 +1,186 @@
+import math
+import weakref
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import shapely
+from shapely import Polygon
+from shapely.geometry.polygon import orient
+
+from . import symmetry
+
+
+def symmetric_arc(cross_section, fold: int) -> Optional[np.ndarray]:
+    """
+    Outer arc of a bulged cross-section inside the first quadrant (two rolls) or the sector of the first roll gap
+    (three or more rolls) like :py:func:`pyroll.profile_bulging.simplification.simplify` uses it,
+    ``None`` if the cross-section has no such arc.
+    """
+    if not isinstance(cross_section, Polygon) or cross_section.is_empty or cross_section.interiors:
+        return None
+
+    if fold == 2:
+        return symmetry.outer_arc(symmetry.quadrant(cross_section), 4, 45)
+
+    start_angle = symmetry.gap_angle(fold)
+    extent = 2 * np.max(np.abs(cross_section.bounds))
+    return symmetry.outer_arc(
+        shapely.intersection(cross_section, symmetry.sector(fold, start_angle, extent)), fold, start_angle
+    )
+
+
+class CompactCrossSection:
+    """
+    Bulged cross-section stored as the outer arc of its symmetric piece instead of a full shapely polygon.
+
+    The arc runs counter-clockwise from the abscissa to the ordinate for two-roll passes, which is mirrored at both
+    axes, or from one edge of the sector of the first roll gap to the other for passes with three or more rolls,
+    which is rotated ``fold`` times.
+
+    Instances are assigned as explicit hook values like :py:class:`pyroll.profile_bulging.lazy.LazyBulgedCrossSection`,
+    which PyRolL calls on access of the hook. The polygon is materialized then and referenced weakly,
+    so it is built again only once no one else holds it anymore.
+    """
+
+    __slots__ = ("arc", "fold", "bulge_radius", "branch", "area", "_polygon")
+
+    def __init__(self, arc: np.ndarray, fold: int, bulge_radius: float = math.nan, branch: Optional[str] = None,
+                 area: Optional[float] = None):
+        """
+        :param arc: coordinate array of the outer arc of shape ``(n, 2)``, kept as is without copying
+        :param fold: number of rolls of the roll pass
+        :param bulge_radius: bulge radius the cross-section was built with
+        :param branch: name of the model function that built the cross-section
+        :param area: area of the cross-section, computed from the arc if not given
+        """
+        self.arc = arc
+        self.fold = fold
+        self.bulge_radius = bulge_radius
+        self.branch = branch
+        self.area = float(area) if area is not None else Polygon(self.coords()).area
+        self._polygon = None
+
+    @classmethod
+    def from_polygon(cls, cross_section, fold: int, bulge_radius: float = math.nan, branch: Optional[str] = None,
+                     dtype=np.float64, rtol: float = 1e-9) -> Optional["CompactCrossSection"]:
+        """
+        Compact representation of ``cross_section``.
+
+        :param dtype: floating point type of the stored coordinates
+        :param rtol: tolerance of the restored vertices relative to the size of the cross-section,
+            raised to the precision of ``dtype`` if necessary
+        :return: the compact cross-section or ``None`` if ``cross_section`` is not reproduced by its arc
+            within the tolerance, like unsymmetric or disconnected cross-sections
+        """
+        arc = symmetric_arc(cross_section, fold)
+        if arc is None:
+            return None
+
+        result = cls(np.ascontiguousarray(arc, dtype=dtype), fold, bulge_radius, branch, cross_section.area)
+        restored = result.coords()
+        original = shapely.get_coordinates(orient(cross_section, 1.0).exterior)[:-1]
+        rtol = max(4 * np.finfo(dtype).eps, rtol)
+        tolerance = rtol * np.max(np.abs(arc))
+
+        if len(restored) == len(original):
+            start = np.argmin(np.sum((original - restored[0]) ** 2, axis=1))
+            deviation = np.max(np.abs(np.roll(original, -start, axis=0) - restored))
+        elif len(restored) > len(original):
+            # the cut at the sector edges may add vertices on the edges, which do not change the shape
+            # as long as all original vertices are kept and the area is the same
+            if abs(Polygon(restored).area - cross_section.area) > rtol * cross_section.area:
+                return None
+            deviation = np.max(np.min(np.abs(original[:, np.newaxis] - restored[np.newaxis]).max(axis=-1), axis=1))
+        else:
+            return None
+
+        return result if deviation <= tolerance else None
+
+    def coords(self) -> np.ndarray:
+        """Coordinates of the exterior ring of the cross-section, not closed."""
+        arc = self.arc.astype(float, copy=False)
+
+        if self.fold == 2:
+            return symmetry.mirrored_coords(arc)
+        return symmetry.rotated_coords(arc, self.fold)
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Bounds ``(min_x, min_y, max_x, max_y)`` of the cross-section computed without materializing it."""
+        coords = self.coords()
+        return (*coords.min(axis=0).tolist(), *coords.max(axis=0).tolist())
+
+    @property
+    def centroid(self) -> Tuple[float, float]:
+        """Centroid ``(x, y)`` of the cross-section computed without materializing it."""
+        x, y = self.coords().T
+        next_x, next_y = np.roll(x, -1), np.roll(y, -1)
+        cross = x * next_y - next_x * y
+        moment = 3 * cross.sum()
+        return float(((x + next_x) * cross).sum() / moment), float(((y + next_y) * cross).sum() / moment)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of the stored coordinates."""
+        return self.arc.nbytes
+
+    def polygon(self) -> Polygon:
+        """Materialize the cross-section as shapely polygon."""
+        result = self._polygon() if self._polygon is not None else None
+
+        if result is None:
+            result = Polygon(self.coords())
+            self._polygon = weakref.ref(result)
+
+        return result
+
+    def __call__(self) -> Polygon:
+        return self.polygon()
+
+    def __reduce__(self):
+        return type(self), (self.arc, self.fold, self.bulge_radius, self.branch, self.area)
+
+    def __repr__(self):
+        return (
+            f"CompactCrossSection({len(self.arc)} arc vertices, fold={self.fold}, "
+            f"bulge_radius={self.bulge_radius}, area={self.area})"
+        )
+
+
+def pack(cross_sections: Iterable[Optional[CompactCrossSection]], dtype=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Move the arcs of ``cross_sections`` into a single contiguous buffer, rebinding each arc to a view into it.
+    Arcs of the same object are stored once.
+
+    :param cross_sections: compact cross-sections, ``None`` entries are skipped
+    :param dtype: floating point type of the buffer, the type of the first arc if not given
+    :return: tuple of the buffer of shape ``(n, 2)`` and the start offsets of the arcs in the order given,
+        with ``-1`` for ``None`` entries
+    """
+    cross_sections = list(cross_sections)
+    offsets = np.full(len(cross_sections), -1, dtype=np.int64)
+    starts = {}
+    arcs = []
+    length = 0
+
+    for i, cross_section in enumerate(cross_sections):
+        if cross_section is None:
+            continue
+
+        key = id(cross_section.arc)
+        if key not in starts:
+            starts[key] = length
+            arcs.append(cross_section.arc)
+            length += len(cross_section.arc)
+        offsets[i] = starts[key]
+
+    if dtype is None:
+        dtype = arcs[0].dtype if arcs else np.float64
+
+    buffer = np.concatenate(arcs).astype(dtype, copy=False) if arcs else np.empty((0, 2), dtype=dtype)
+
+    for offset, cross_section in zip(offsets, cross_sections):
+        if cross_section is not None:
+            cross_section.arc = buffer[offset:offset + len(cross_section.arc)]
+
+    return buffer, offsets
@@ -0,0 +1,94 @@
+from pyroll.core.config import config
+
+
+@config("PYROLL_PROFILE_BULGING")
+class Config:
+    """Configuration class for ``pyroll.profile_bulging``."""
+
+    ANALYTIC_CROSS_SECTION = False
+    """Whether to construct the bulged cross-sections as exact contours of lines and circular arcs
+    instead of using boolean operations on buffered polygons. The contour is stored on the profile
+    as ``bulged_contour`` and tessellated to the ``cross_section`` polygon."""
+
+    CONSTRUCTIVE_CROSS_SECTION = True
+    """Whether to assemble the polygonal bulged cross-sections of two-roll passes in a single sweep along the groove
+    contour and the tessellated bulges instead of by boolean operations on polygons. The boolean operations are
+    still used where the assembly is not applicable, like for disconnected regions. The vectorized builders of
+    :py:func:`pyroll.profile_bulging.batch.bulged_cross_sections` always use the boolean operations."""
+
+    CROSS_SECTION_CACHE_SIZE = 256
+    """Maximum number of bulged cross-sections kept in the LRU cache, ``0`` disables the cache."""
+
+    CROSS_SECTION_CACHE_TOLERANCE = 1e-9
+    """Quantization step of the lengths forming the cache key in metres,
+    profiles differing by less than this share cached cross-sections."""
+
+    MAX_CHORD_DEVIATION = 0.0
+    """Maximum distance in metres between the circular arcs of the bulges and the chords approximating them,
+    the number of segments per circle is derived from it. A value of ``0`` uses shapely's default resolution."""
+
+    INSTRUMENTATION = False
+    """Whether to record wall time, vertex counts, model branch and fallbacks of each bulging step
+    in ``pyroll.profile_bulging.instrumentation.recorder``."""
+
+    LAZY_CROSS_SECTION = False
+    """Whether to defer the construction of the bulged cross-section until the ``cross_section``
+    (or ``bulged_contour``) of the bulged profile is first accessed. The bulge radius is computed eagerly anyway."""
+
+    COMPACT_CROSS_SECTION = False
+    """Whether to store the bulged cross-sections as :py:class:`pyroll.profile_bulging.compact.CompactCrossSection`
+    holding only the outer arc of their symmetric piece instead of as shapely polygons, to save memory when many
+    solved profiles are kept. The polygon is materialized on access of the ``cross_section`` of the profile.
+    Cross-sections not reproduced by their arc are stored as polygons."""
+
+    COMPACT_CROSS_SECTION_DTYPE = "float64"
+    """NumPy floating point type of the coordinates of compact cross-sections, ``"float32"`` halves their size
+    at a precision of about ``1e-7`` relative to the profile dimensions."""
+
+    INCREMENTAL_SOLVE = False
+    """Whether to reuse the bulge radius and cross-section of the last solution of a roll pass
+    if its inputs did not change beyond :py:attr:`INCREMENTAL_TOLERANCE`."""
+
+    INCREMENTAL_TOLERANCE = 1e-6
+    """Relative tolerance of the inputs of the bulging step for reusing previous results."""
+
+    PASS_GEOMETRY_CACHE_WIDTHS = 32
+    """Maximum number of clipped helper cross-sections kept per roll pass and kind,
+    ``0`` disables the caching of helper geometries per roll pass."""
+
+    SCALAR_ONLY = False
+    """Whether to compute only the bulge radius and the ``bulged_area``, ``bulged_width`` and ``bulged_height``
+    of the profile from the analytic contour without creating any polygon.
+    The ``cross_section`` of the profile stays unbulged, so the following units see the unbulged geometry,
+    a warning is issued if a following roll pass is solved with it.
+    Can be overridden per pass sequence by its ``bulging_scalar_only`` attribute."""
+
+    SURROGATE = False
+    """Whether to take the ``bulged_area``, ``bulged_width`` and ``bulged_height`` of the profile from the
+    lookup tables in ``pyroll.profile_bulging.surrogate.surrogate_tables`` where one matches the roll pass.
+    The ``cross_section`` of the profile stays unbulged then, like with :py:attr:`SCALAR_ONLY`."""
+
+    OUTPUT_VERTEX_BUDGET = 0
+    """Number of vertices to simplify the bulged cross-section to, preserving its symmetry.
+    ``0`` disables the simplification unless :py:attr:`OUTPUT_MAX_AREA_ERROR` is set.
+    The achieved error is reported as ``bulged_simplification_error`` of the profile."""
+
+    OUTPUT_MAX_AREA_ERROR = 0.0
+    """Maximum area between the bulged and the simplified cross-section relative to the bulged area.
+    Without :py:attr:`OUTPUT_VERTEX_BUDGET` as many vertices are removed as this bound allows,
+    with it the bound takes precedence over the budget. ``0`` means no bound."""
+
+    OPT_IN = False
+    """Whether to run the bulging post-processor only for roll passes with ``bulging`` set to ``True``
+    on themselves or an enclosing pass sequence. Otherwise, it runs for all roll passes except those with
+    ``bulging`` set to ``False``."""
+
+    PARAMETER_PROFILE = "default"
+    """Name of the registered :py:class:`pyroll.profile_bulging.parameters.ParameterProfile` of empirical
+    constants used by the bulge radius models. Can be overridden per roll pass or pass sequence
+    by their ``bulging_parameter_profile`` attribute."""
+
+    SENSITIVITIES = False
+    """Whether to store the derivatives of the bulge radius and the bulged area with respect to the profile width,
+    the groove radius ``r2`` and usable width and the roll gap or inscribed circle diameter as
+    ``bulge_radius_gradient`` and ``bulged_area_gradient`` on the bulged profile."""
@@ -0,0 +1,550 @@
+import math
+
+import numpy as np
+import shapely
+from shapely import Polygon
+
+from .tessellation import max_segment_angle
+
+_EPS = 1e-12
+
+LINE = 0
+CIRCLE = 1
+UNBOUNDED = 2
+
+
+class LineSegment:
+    """Straight segment of a closed contour."""
+
+    def __init__(self, start, end):
+        self.start = (float(start[0]), float(start[1]))
+        self.end = (float(end[0]), float(end[1]))
+
+    def __repr__(self):
+        return f"LineSegment({self.start}, {self.end})"
+
+
+class ArcSegment:
+    """Circular arc segment of a closed contour, running counter-clockwise from ``start_angle`` by ``sweep``."""
+
+    def __init__(self, center, radius, start_angle, sweep):
+        self.center = (float(center[0]), float(center[1]))
+        self.radius = float(radius)
+        self.start_angle = float(start_angle)
+        self.sweep = float(sweep)
+
+    def __repr__(self):
+        return f"ArcSegment({self.center}, {self.radius}, {self.start_angle}, {self.sweep})"
+
+
+class Contour:
+    """
+    Closed, counter-clockwise contour made of straight and circular arc segments stored as arrays.
+    Area, centroid, perimeter and bounds are computed in closed form,
+    a shapely polygon is only created on request by :py:meth:`to_polygon`.
+    """
+
+    def __init__(self, kinds, starts, ends, centers, radii, start_angles, sweeps):
+        self.kinds = kinds
+        self.starts = starts
+        self.ends = ends
+        self.centers = centers
+        self.radii = radii
+        self.start_angles = start_angles
+        self.sweeps = sweeps
+
+    @property
+    def segments(self):
+        """List of :py:class:`LineSegment` and :py:class:`ArcSegment` instances describing the contour."""
+        return [
+            ArcSegment(self.centers[i], self.radii[i], self.start_angles[i], self.sweeps[i])
+            if self.kinds[i] == CIRCLE else LineSegment(self.starts[i], self.ends[i])
+            for i in range(len(self.kinds))
+        ]
+
+    def _moments(self):
+        x0, y0 = self.starts.T
+        x1, y1 = self.ends.T
+        is_arc = self.kinds == CIRCLE
+
+        line_area = (x0 * y1 - x1 * y0) / 2
+        line_x2dy = (y1 - y0) * (x0 ** 2 + x0 * x1 + x1 ** 2) / 3
+        line_y2dx = (x1 - x0) * (y0 ** 2 + y0 * y1 + y1 ** 2) / 3
+
+        cx, cy = self.centers.T
+        r = self.radii
+        t0 = self.start_angles
+        t1 = t0 + self.sweeps
+        s0, s1 = np.sin(t0), np.sin(t1)
+        c0, c1 = np.cos(t0), np.cos(t1)
+
+        arc_area = (r ** 2 * self.sweeps + r * cx * (s1 - s0) - r * cy * (c1 - c0)) / 2
+        cos2 = (t1 - t0) / 2 + (np.sin(2 * t1) - np.sin(2 * t0)) / 4
+        cos3 = (s1 - s1 ** 3 / 3) - (s0 - s0 ** 3 / 3)
+        arc_x2dy = r * (cx ** 2 * (s1 - s0) + 2 * cx * r * cos2 + r ** 2 * cos3)
+        sin2 = (t1 - t0) / 2 - (np.sin(2 * t1) - np.sin(2 * t0)) / 4
+        sin3 = (-c1 + c1 ** 3 / 3) - (-c0 + c0 ** 3 / 3)
+        arc_y2dx = -r * (cy ** 2 * (c0 - c1) + 2 * cy * r * sin2 + r ** 2 * sin3)
+
+        area = np.sum(np.where(is_arc, arc_area, line_area))
+        mx = np.sum(np.where(is_arc, arc_x2dy, line_x2dy)) / 2
+        my = -np.sum(np.where(is_arc, arc_y2dx, line_y2dx)) / 2
+        return area, mx, my
+
+    @property
+    def area(self):
+        return self._moments()[0]
+
+    @property
+    def centroid(self):
+        area, mx, my = self._moments()
+        return mx / area, my / area
+
+    @property
+    def perimeter(self):
+        line_lengths = np.hypot(*(self.ends - self.starts).T)
+        return np.sum(np.where(self.kinds == CIRCLE, self.radii * np.abs(self.sweeps), line_lengths))
+
+    @property
+    def bounds(self):
+        points = [self.starts, self.ends]
+        arcs = self.kinds == CIRCLE
+
+        for q in range(-4, 8):
+            angle = q * math.pi / 2
+            passed = arcs & (self.start_angles <= angle) & (self.start_angles + self.sweeps >= angle)
+            points.append(self.centers[passed] + self.radii[passed, np.newaxis] * (math.cos(angle), math.sin(angle)))
+
+        points = np.concatenate(points)
+        return (*points.min(axis=0), *points.max(axis=0))
+
+    @property
+    def width(self):
+        bounds = self.bounds
+        return bounds[2] - bounds[0]
+
+    @property
+    def height(self):
+        bounds = self.bounds
+        return bounds[3] - bounds[1]
+
+    def coords(self, quad_segs=16, max_chord_deviation=None):
+        """
+        Vertices of the tessellated contour.
+
+        :param quad_segs: number of segments per quarter circle the arcs are divided into
+        :param max_chord_deviation: if given and positive, the arcs are divided such that the chords
+            deviate at most this distance from them instead, regardless of ``quad_segs``
+        """
+        if max_chord_deviation is not None and max_chord_deviation > 0:
+            max_angle = np.maximum(max_segment_angle(self.radii, max_chord_deviation), _EPS)
+        else:
+            max_angle = math.pi / 2 / quad_segs
+
+        counts = np.where(
+            self.kinds == CIRCLE,
+            np.maximum(np.ceil(np.abs(self.sweeps) / max_angle), 1),
+            1
+        ).astype(int)
+
+        index = np.repeat(np.arange(len(counts)), counts)
+        steps = np.arange(len(index)) - np.repeat(np.cumsum(counts) - counts, counts)
+        angles = self.start_angles[index] + self.sweeps[index] * steps / counts[index]
+
+        arc_points = self.centers[index] + self.radii[index, np.newaxis] * np.column_stack(
+            [np.cos(angles), np.sin(angles)])
+        return np.where((self.kinds[index] == CIRCLE)[:, np.newaxis], arc_points, self.starts[index])
+
+    def to_polygon(self, quad_segs=16, max_chord_deviation=None):
+        return Polygon(self.coords(quad_segs, max_chord_deviation))
+
+
+def _values(kinds, params, s, polar):
+    values = np.full(len(kinds), np.inf)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        lines = kinds == LINE
+        if lines.any():
+            x0, y0, x1, y1 = params[lines].T
+            sl = s[lines]
+            if polar:
+                values[lines] = (x0 * (y1 - y0) - y0 * (x1 - x0)) / (np.cos(sl) * (y1 - y0) - np.sin(sl) * (x1 - x0))
+            else:
+                values[lines] = y0 + (y1 - y0) * (sl - x0) / (x1 - x0)
+
+        circles = kinds == CIRCLE
+        if circles.any():
+            cx, cy, r, _ = params[circles].T
+            sc = s[circles]
+            if polar:
+                b = np.cos(sc) * cx + np.sin(sc) * cy
+                values[circles] = b + np.sqrt(np.maximum(b ** 2 - cx ** 2 - cy ** 2 + r ** 2, 0))
+            else:
+                values[circles] = cy + np.sqrt(np.maximum(r ** 2 - (sc - cx) ** 2, 0))
+
+    return values
+
+
+def _line_line_crossings(a, b):
+    ax0, ay0, ax1, ay1 = a.T
+    bx0, by0, bx1, by1 = b.T
+    dax, day = ax1 - ax0, ay1 - ay0
+    dbx, dby = bx1 - bx0, by1 - by0
+    t = ((bx0 - ax0) * dby - (by0 - ay0) * dbx) / (dax * dby - day * dbx)
+    return np.column_stack([ax0 + t * dax, ay0 + t * day])[:, np.newaxis, :]
+
+
+def _line_circle_crossings(line, circle):
+    lx0, ly0, lx1, ly1 = line.T
+    cx, cy, r, _ = circle.T
+    dx, dy = lx1 - lx0, ly1 - ly0
+    fx, fy = lx0 - cx, ly0 - cy
+    qa = dx ** 2 + dy ** 2
+    qb = 2 * (fx * dx + fy * dy)
+    root = np.sqrt(qb ** 2 - 4 * qa * (fx ** 2 + fy ** 2 - r ** 2))
+    t = np.column_stack([(-qb - root) / (2 * qa), (-qb + root) / (2 * qa)])
+    return np.stack([lx0[:, np.newaxis] + t * dx[:, np.newaxis], ly0[:, np.newaxis] + t * dy[:, np.newaxis]], axis=2)
+
+
+def _circle_circle_crossings(a, b):
+    ax, ay, ar, _ = a.T
+    bx, by, br, _ = b.T
+    dx, dy = bx - ax, by - ay
+    d = np.hypot(dx, dy)
+    along = (ar ** 2 - br ** 2 + d ** 2) / (2 * d)
+    across = np.sqrt(ar ** 2 - along ** 2)
+    mx, my = ax + along * dx / d, ay + along * dy / d
+    return np.stack([
+        np.column_stack([mx - across * dy / d, my + across * dx / d]),
+        np.column_stack([mx + across * dy / d, my - across * dx / d]),
+    ], axis=1)
+
+
+def _crossings(kinds_a, params_a, kinds_b, params_b):
+    """Cartesian intersection points of pairs of curves, two candidates per pair, NaN where not existing."""
+    points = np.full((len(kinds_a), 2, 2), np.nan)
+    is_line_a = kinds_a == LINE
+    is_line_b = kinds_b == LINE
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        both_lines = is_line_a & is_line_b
+        if both_lines.any():
+            points[both_lines, :1] = _line_line_crossings(params_a[both_lines], params_b[both_lines])
+
+        mixed = is_line_a != is_line_b
+        if mixed.any():
+            a_is_line = is_line_a[mixed, np.newaxis]
+            points[mixed] = _line_circle_crossings(
+                np.where(a_is_line, params_a[mixed], params_b[mixed]),
+                np.where(a_is_line, params_b[mixed], params_a[mixed]),
+            )
+
+        both_circles = ~is_line_a & ~is_line_b
+        if both_circles.any():
+            points[both_circles] = _circle_circle_crossings(params_a[both_circles], params_b[both_circles])
+
+    return points
+
+
+class Envelope:
+    """
+    Piecewise description of a region boundary as function of a sweep parameter.
+    In vertical mode the parameter is the abscissa and the value the upper ordinate of a region symmetric to the
+    abscissa, in polar mode the parameter is the polar angle and the value the radius of a region star-shaped with
+    respect to the origin.
+    Regions are combined exactly by :py:meth:`minimum` (intersection) and :py:meth:`maximum` (union).
+
+    Each piece spans from ``s0`` to ``s1`` and is described by its curve kind and four parameters,
+    the two points of a line or center, radius and a dummy of a circle.
+    """
+
+    def __init__(self, s0, s1, kinds, params, polar: bool):
+        self.s0 = np.asarray(s0, dtype=float)
+        self.s1 = np.asarray(s1, dtype=float)
+        self.kinds = np.asarray(kinds, dtype=int)
+        self.params = np.asarray(params, dtype=float).reshape(-1, 4)
+        self.polar = polar
+
+    @classmethod
+    def from_line(cls, coords):
+        """Vertical envelope from a line string with strictly ascending abscissae, returns None otherwise."""
+        coords = np.asarray(coords)
+
+        if coords[0, 0] > coords[-1, 0]:
+            coords = coords[::-1]
+
+        if np.any(np.diff(coords[:, 0]) <= 0):
+            return None
+
+        return cls(
+            coords[:-1, 0], coords[1:, 0], np.full(len(coords) - 1, LINE),
+            np.column_stack([coords[:-1], coords[1:]]), polar=False
+        )
+
+    @classmethod
+    def from_polygon(cls, polygon: Polygon):
+        """Polar envelope from a polygon star-shaped with respect to the origin, returns None otherwise."""
+        if shapely.get_num_interior_rings(polygon) > 0:
+            return None
+        return cls.from_ring(shapely.get_coordinates(polygon))
+
+    @classmethod
+    def from_ring(cls, coords):
+        """Polar envelope from the coordinates of a closed ring enclosing a region star-shaped with respect to the
+        origin, returns None otherwise."""
+        coords = np.asarray(coords)
+
+        if not np.array_equal(coords[0], coords[-1]):
+            coords = np.concatenate([coords, coords[:1]])
+
+        if np.sum(coords[:-1, 0] * coords[1:, 1] - coords[1:, 0] * coords[:-1, 1]) < 0:
+            coords = coords[::-1]
+
+        angles = np.unwrap(np.arctan2(coords[:, 1], coords[:, 0]))
+
+        if np.any(np.diff(angles) <= 0) or not math.isclose(angles[-1] - angles[0], 2 * math.pi, rel_tol=1e-9):
+            return None
+
+        angles = angles - math.floor((angles[0] + math.pi) / (2 * math.pi)) * 2 * math.pi
+        s0 = angles[:-1]
+        s1 = angles[1:]
+        params = np.column_stack([coords[:-1], coords[1:]])
+
+        split = (s0 < math.pi) & (s1 > math.pi)
+        s0 = np.concatenate([s0, np.full(np.count_nonzero(split), math.pi)])
+        s1 = np.concatenate([np.where(split, math.pi, s1), s1[split]])
+        params = np.concatenate([params, params[split]])
+
+        wrapped = s0 >= math.pi
+        s0 = np.where(wrapped, s0 - 2 * math.pi, s0)
+        s1 = np.where(wrapped, s1 - 2 * math.pi, s1)
+
+        order = np.argsort(s0)
+        return cls(s0[order], s1[order], np.full(len(s0), LINE), params[order], polar=True)
+
+    @classmethod
+    def circle(cls, center, radius, polar: bool):
+        """Envelope of a circle, in polar mode the circle must contain the origin, returns None otherwise."""
+        cx, cy, r = float(center[0]), float(center[1]), float(radius)
+
+        if polar:
+            if not math.hypot(cx, cy) < r:
+                return None
+            return cls([-math.pi], [math.pi], [CIRCLE], [cx, cy, r, 0], polar=True)
+
+        if not r > 0:
+            return cls([], [], [], [], polar=False)
+        return cls([cx - r], [cx + r], [CIRCLE], [cx, cy, r, 0], polar=False)
+
+    @classmethod
+    def half_plane(cls, angle, distance):
+        """Polar envelope of the half-plane of points with a projection of at most ``distance > 0``
+        onto the direction ``angle`` in radians."""
+        direction = np.array([math.cos(angle), math.sin(angle)])
+        foot = distance * direction
+        line = np.concatenate([foot, foot + [-direction[1], direction[0]]])
+
+        angle = (angle + math.pi) % (2 * math.pi) - math.pi
+        pieces = [
+            (angle - math.pi / 2, angle + math.pi / 2, LINE),
+            (angle + math.pi / 2, angle + 3 * math.pi / 2, UNBOUNDED),
+        ]
+
+        s0, s1, kinds = [], [], []
+        for start, end, kind in pieces:
+            shift = math.floor((start + math.pi) / (2 * math.pi)) * 2 * math.pi
+            start, end = start - shift, end - shift
+
+            if end > math.pi:
+                s0 += [start, -math.pi]
+                s1 += [math.pi, end - 2 * math.pi]
+                kinds += [kind, kind]
+            else:
+                s0.append(start)
+                s1.append(end)
+                kinds.append(kind)
+
+        order = np.argsort(s0)
+        return cls(np.array(s0)[order], np.array(s1)[order], np.array(kinds)[order], np.tile(line, (len(kinds), 1)),
+                   polar=True)
+
+    @classmethod
+    def strip(cls, half_width):
+        """Vertical envelope of the unbounded strip ``|x| <= half_width``."""
+        return cls([-half_width], [half_width], [UNBOUNDED], [0, 0, 0, 0], polar=False)
+
+    def _at(self, s):
+        """Kinds and parameters of the pieces covering the parameters, kind -1 where the region is empty."""
+        if len(self.kinds) == 0:
+            return np.full(len(s), -1), np.zeros((len(s), 4))
+
+        i = np.searchsorted(self.s0, s, side="right") - 1
+        safe = np.maximum(i, 0)
+        covered = (i >= 0) & (s <= self.s1[safe])
+        return np.where(covered, self.kinds[safe], -1), self.params[safe]
+
+    def _combine(self, other: "Envelope", use_minimum: bool):
+        breaks = np.unique(np.concatenate([self.s0, self.s1, other.s0, other.s1]))
+        mids = (breaks[:-1] + breaks[1:]) / 2
+        kinds_a, params_a = self._at(mids)
+        kinds_b, params_b = other._at(mids)
+
+        # split the elementary intervals at the crossings of both curves, at most two per interval
+        candidates = (kinds_a >= LINE) & (kinds_a <= CIRCLE) & (kinds_b >= LINE) & (kinds_b <= CIRCLE)
+        points = _crossings(kinds_a[candidates], params_a[candidates], kinds_b[candidates], params_b[candidates])
+        crossings = np.arctan2(points[..., 1], points[..., 0]) if self.polar else points[..., 0]
+        inside = (
+                (crossings > breaks[:-1][candidates, np.newaxis] + _EPS)
+                & (crossings < breaks[1:][candidates, np.newaxis] - _EPS)
+        )
+        splits = np.full((len(mids), 2), np.nan)
+        splits[candidates] = np.where(inside, crossings, np.nan)
+        splits.sort(axis=1)
+
+        bounds = np.column_stack([breaks[:-1], splits, breaks[1:]])
+        valid = ~np.isnan(bounds)
+        flat = bounds[valid]
+        counts = valid.sum(axis=1) - 1
+        is_start = np.ones(len(flat), dtype=bool)
+        is_start[np.cumsum(counts + 1) - 1] = False
+        starts = np.flatnonzero(is_start)
+        parents = np.repeat(np.arange(len(mids)), counts)
+
+        s0, s1 = flat[starts], flat[starts + 1]
+        mids = (s0 + s1) / 2
+        kinds_a, params_a = kinds_a[parents], params_a[parents]
+        kinds_b, params_b = kinds_b[parents], params_b[parents]
+
+        values = _values(
+            np.concatenate([kinds_a, kinds_b]), np.concatenate([params_a, params_b]), np.concatenate([mids, mids]),
+            self.polar
+        )
+        values_a = np.where(kinds_a < 0, -np.inf, values[:len(mids)])
+        values_b = np.where(kinds_b < 0, -np.inf, values[len(mids):])
+
+        if use_minimum:
+            take_a = values_a <= values_b
+            exists = (kinds_a >= 0) & (kinds_b >= 0)
+        else:
+            take_a = values_a >= values_b
+            exists = (kinds_a >= 0) | (kinds_b >= 0)
+
+        s0, s1 = s0[exists], s1[exists]
+        kinds = np.where(take_a, kinds_a, kinds_b)[exists]
+        params = np.where(take_a[:, np.newaxis], params_a, params_b)[exists]
+
+        if len(kinds) == 0:
+            return Envelope(s0, s1, kinds, params, self.polar)
+
+        continued = (kinds[1:] == kinds[:-1]) & np.all(params[1:] == params[:-1], axis=1) & (s0[1:] - s1[:-1] < _EPS)
+        first = np.concatenate([[True], ~continued])
+        last = np.concatenate([~continued, [True]])
+        return Envelope(s0[first], s1[last], kinds[first], params[first], self.polar)
+
+    def minimum(self, *others: "Envelope"):
+        """Envelope of the intersection of the regions."""
+        result = self
+        for o in others:
+            result = result._combine(o, use_minimum=True)
+        return result
+
+    def maximum(self, *others: "Envelope"):
+        """Envelope of the union of the regions."""
+        result = self
+        for o in others:
+            result = result._combine(o, use_minimum=False)
+        return result
+
+    def _points(self, s):
+        values = _values(self.kinds, self.params, s, self.polar)
+
+        if self.polar:
+            return np.column_stack([values * np.cos(s), values * np.sin(s)])
+        return np.column_stack([s, values])
+
+    def to_contour(self):
+        """Closed contour of the described region, None if it is not connected or not bounded."""
+        if len(self.kinds) == 0 or np.any(self.kinds == UNBOUNDED) or np.any(self.s0[1:] - self.s1[:-1] > _EPS):
+            return None
+
+        if self.polar:
+            if self.s0[0] > -math.pi + _EPS or self.s1[-1] < math.pi - _EPS:
+                return None
+
+            # split long arcs so that their sweep is unambiguous
+            counts = np.where(self.kinds == CIRCLE, np.ceil((self.s1 - self.s0) / (math.pi / 2)), 1).astype(int)
+            index = np.repeat(np.arange(len(counts)), counts)
+            steps = np.arange(len(index)) - np.repeat(np.cumsum(counts) - counts, counts)
+            span = (self.s1 - self.s0)[index] / counts[index]
+            s0 = self.s0[index] + steps * span
+
+            envelope = Envelope(s0, s0 + span, self.kinds[index], self.params[index], polar=True)
+            return _chain(envelope._points(envelope.s0), envelope._points(envelope.s1), envelope.kinds,
+                          envelope.params)
+
+        starts = self._points(self.s1)[::-1]
+        ends = self._points(self.s0)[::-1]
+        kinds = self.kinds[::-1]
+        params = self.params[::-1]
+        mirrored_params = np.where((kinds == CIRCLE)[:, np.newaxis], params * [1, -1, 1, 1], params * [1, -1, 1, -1])
+
+        return _chain(
+            np.concatenate([starts, (ends * [1, -1])[::-1]]),
+            np.concatenate([ends, (starts * [1, -1])[::-1]]),
+            np.concatenate([kinds, kinds[::-1]]),
+            np.concatenate([params, mirrored_params[::-1]]),
+        )
+
+
+def _chain(starts, ends, kinds, params):
+    """Contour from consecutive curve parts, gaps between the parts are closed with straight segments."""
+    n = len(kinds)
+
+    all_starts = np.empty((2 * n, 2))
+    all_ends = np.empty((2 * n, 2))
+    all_kinds = np.full(2 * n, LINE)
+    all_params = np.zeros((2 * n, 4))
+
+    all_starts[0::2], all_ends[0::2], all_kinds[0::2], all_params[0::2] = starts, ends, kinds, params
+    all_starts[1::2], all_ends[1::2] = ends, np.roll(starts, -1, axis=0)
+
+    keep = np.hypot(*(all_ends - all_starts).T) > _EPS
+    starts, ends, kinds, params = all_starts[keep], all_ends[keep], all_kinds[keep], all_params[keep]
+
+    is_arc = kinds == CIRCLE
+    centers = np.where(is_arc[:, np.newaxis], params[:, :2], 0)
+    start_angles = np.arctan2(starts[:, 1] - centers[:, 1], starts[:, 0] - centers[:, 0])
+    end_angles = np.arctan2(ends[:, 1] - centers[:, 1], ends[:, 0] - centers[:, 0])
+    sweeps = (end_angles - start_angles) % (2 * math.pi)
+    sweeps = np.where(sweeps > 2 * math.pi - 1e-9, 0, sweeps)
+
+    return Contour(
+        kinds,
+        starts,
+        ends,
+        centers,
+        np.where(is_arc, params[:, 2], 0),
+        np.where(is_arc, start_angles, 0),
+        np.where(is_arc, sweeps, 0),
+    )
+
+
+def circle_intersections(coords, center, radius):
+    """Intersection points of a line string given by its vertex coordinates with a circle."""
+    coords = np.asarray(coords)
+    p = coords[:-1]
+    d = coords[1:] - p
+    f = p - np.asarray(center)
+
+    qa = np.einsum("ij,ij->i", d, d)
+    qb = 2 * np.einsum("ij,ij->i", f, d)
+    qc = np.einsum("ij,ij->i", f, f) - radius ** 2
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        root = np.sqrt(qb ** 2 - 4 * qa * qc)
+        t = np.concatenate([(-qb - root) / (2 * qa), (-qb + root) / (2 * qa)])
+
+    p = np.concatenate([p, p])
+    d = np.concatenate([d, d])
+    valid = (t >= 0) & (t <= 1)
+    return p[valid] + t[valid, np.newaxis] * d[valid]
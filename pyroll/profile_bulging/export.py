@@ -0,0 +1,332 @@
+import contextlib
+import io
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Iterator, Union
+
+import numpy as np
+import shapely
+from pyroll.core import BaseRollPass, PassSequence
+
+from . import symmetry
+from .compact import CompactCrossSection
+from .lazy import LazyBulgedCrossSection
+
+MAGIC = b"PBEX"
+"""Marker at the start of each chunk of an export file."""
+
+_CHUNK_HEADER = struct.Struct("<4sQQ")
+
+SCALAR_FIELDS = ("bulge_radius", "area", "width", "height")
+"""Numeric fields of the exported records."""
+
+
+class StreamingSink:
+    """
+    Append-only export of the results of the bulging step to a chunked file.
+
+    Each record holds the label and classifiers of the roll pass, the bulge radius, area, width and height
+    of the bulged profile and the WKB of its cross-section, which is empty for scalar-only results.
+    Records are buffered and written as a chunk of a ``.npy`` table followed by the concatenated WKB,
+    so a run aborted midway leaves all complete chunks readable.
+
+    The sink is fed by :py:class:`BulgingModel` while activated by :py:func:`streaming_export`.
+    Roll passes within a pass sequence are solved repeatedly until the sequence converges, so their records are held
+    back and only the one of the final solution is kept once the outermost sequence is solved.
+    Writes are guarded by a lock, so sequences solved in parallel threads may feed the same sink.
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = 256, drop_cross_sections: bool = False):
+        """
+        :param path: file to append the chunks to, created if not existing
+        :param chunk_size: number of records buffered before a chunk is written
+        :param drop_cross_sections: whether to replace the bulged cross-sections of the solved profiles by the
+            unbulged ones and to keep only the scalar ``bulged_area``, ``bulged_width`` and ``bulged_height``
+            like with :py:attr:`Config.SCALAR_ONLY`, so that memory does not grow with the length of the run;
+            within a pass sequence this is done once the outermost sequence is solved, the incoming profiles of
+            the following roll passes keep the cross-section derived from the bulged one they were solved with
+        """
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.drop_cross_sections = drop_cross_sections
+        self.written = 0
+        """Count of records written to the file."""
+
+        self._records = []
+        self._pending = {}
+        self._dropped = {}
+        self._lock = threading.RLock()
+        self._file = open(self.path, "ab")
+
+    def write(self, roll_pass, profile):
+        """
+        Add a record of the bulged ``profile`` resulting from ``roll_pass``.
+        If the roll pass is part of a pass sequence, the record replaces the one of its previous solution
+        and is held back until :py:meth:`commit` is called with the sequence.
+        """
+        stored = profile.__dict__.get("cross_section")
+
+        if profile.bulged_scalars_only:
+            # the cross-section of the profile is the unbulged one
+            area, width, height = profile.bulged_area, profile.bulged_width, profile.bulged_height
+            wkb = b""
+        else:
+            # take lazy and compact cross-sections as stored, so that no polygon is kept on the profile
+            cross_section = stored.result()[0] if isinstance(stored, LazyBulgedCrossSection) else stored
+            if cross_section is None:
+                cross_section = profile.cross_section
+
+            area, width, height = symmetry.dimensions(cross_section, "3fold" in profile.classifiers)
+
+            if isinstance(cross_section, CompactCrossSection):
+                wkb = _polygon_wkb(cross_section.coords())
+            else:
+                wkb = shapely.to_wkb(cross_section) if cross_section is not None else b""
+
+        record = (
+            str(roll_pass.label),
+            ",".join(sorted(roll_pass.classifiers)),
+            profile.bulge_radius if profile.bulge_radius is not None else np.nan,
+            area, width, height,
+            wkb,
+        )
+
+        drop = None
+        if self.drop_cross_sections and not profile.bulged_scalars_only and stored is not None:
+            drop = (stored, roll_pass.out_profile.cross_section, area, width, height)
+
+        with self._lock:
+            if roll_pass.parent is not None:
+                self._pending[id(roll_pass)] = record
+                self._dropped[id(roll_pass)] = drop
+                return
+
+            self._append(record)
+
+        if drop is not None:
+            _drop_cross_section(profile, *drop[1:])
+
+    def commit(self, sequence):
+        """
+        Add the held back records of the roll passes of the solved ``sequence`` in their order in it.
+        If :py:attr:`drop_cross_sections` is set, the bulged cross-sections are dropped from the profiles
+        of the sequence afterwards.
+        """
+        with self._lock:
+            drops = {}
+
+            for roll_pass in _roll_passes(sequence):
+                record = self._pending.pop(id(roll_pass), None)
+                drop = self._dropped.pop(id(roll_pass), None)
+
+                if record is not None:
+                    self._append(record)
+                if drop is not None:
+                    drops[id(drop[0])] = drop
+
+        if not drops:
+            return
+
+        # the bulged profile of a roll pass is passed on to the following units
+        for unit in _units(sequence):
+            for profile in (unit.in_profile, unit.out_profile):
+                if profile is None:
+                    continue
+
+                # the drops hold the bulged cross-sections, so their ids are not reused meanwhile
+                drop = drops.get(id(profile.__dict__.get("cross_section")))
+                if drop is not None:
+                    _drop_cross_section(profile, *drop[1:])
+
+    def _append(self, record):
+        self._records.append(record)
+
+        if len(self._records) >= self.chunk_size:
+            self._flush()
+
+    def flush(self):
+        """Write the buffered records as a chunk."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._records:
+            return
+
+        labels, classifiers, *scalars, wkbs = zip(*self._records)
+        lengths = np.array([len(w) for w in wkbs], dtype=np.int64)
+
+        table = np.empty(len(labels), dtype=[
+            ("roll_pass", f"U{max(map(len, labels)) or 1}"),
+            ("classifiers", f"U{max(map(len, classifiers)) or 1}"),
+            *[(name, float) for name in SCALAR_FIELDS],
+            ("wkb_offset", np.int64),
+            ("wkb_length", np.int64),
+        ])
+        table["roll_pass"] = labels
+        table["classifiers"] = classifiers
+        for name, values in zip(SCALAR_FIELDS, scalars):
+            table[name] = np.array(values, dtype=float)
+        table["wkb_offset"] = np.cumsum(lengths) - lengths
+        table["wkb_length"] = lengths
+
+        buffer = io.BytesIO()
+        np.save(buffer, table, allow_pickle=False)
+        table_bytes = buffer.getvalue()
+        wkb_bytes = b"".join(wkbs)
+
+        self._file.write(_CHUNK_HEADER.pack(MAGIC, len(table_bytes), len(wkb_bytes)) + table_bytes + wkb_bytes)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self.written += len(self._records)
+        self._records = []
+
+    def close(self):
+        """Write the remaining records and close the file."""
+        with self._lock:
+            if self._file.closed:
+                return
+
+            try:
+                # records of sequences not solved to the end
+                self._records.extend(self._pending.values())
+                self._pending.clear()
+                self._dropped.clear()
+                self._flush()
+            finally:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+_sinks: list = []
+
+
+def emit(roll_pass, profile):
+    """Pass the bulged ``profile`` of ``roll_pass`` to all active sinks."""
+    for sink in _sinks:
+        sink.write(roll_pass, profile)
+
+
+def active() -> bool:
+    """Whether any sink is active."""
+    return bool(_sinks)
+
+
+def _units(unit):
+    for subunit in getattr(unit, "units", ()):
+        yield subunit
+        yield from _units(subunit)
+
+
+def _roll_passes(unit):
+    return (u for u in _units(unit) if isinstance(u, BaseRollPass))
+
+
+def _drop_cross_section(profile, unbulged, area, width, height):
+    profile.bulged_area, profile.bulged_width, profile.bulged_height = area, width, height
+    profile.bulged_scalars_only = True
+    profile.cross_section = unbulged
+    profile.__dict__.pop("bulged_contour", None)
+
+
+def _polygon_wkb(coords: np.ndarray) -> bytes:
+    # WKB of a polygon with a single ring, encoded directly from the coordinates without building the geometry
+    ring = np.concatenate([coords, coords[:1]]).astype("<f8", copy=False)
+    return struct.pack("<BIII", 1, 3, 1, len(ring)) + ring.tobytes()
+
+
+def _commit_solved_sequence(sequence: PassSequence):
+    # registered as post-processor, so it runs once the sequence is solved, but does not process the profile
+    if sequence.parent is None:
+        for sink in _sinks:
+            sink.commit(sequence)
+    return None
+
+
+PassSequence.post_processors.append(_commit_solved_sequence)
+
+
+@contextlib.contextmanager
+def streaming_export(path: Union[str, Path], chunk_size: int = 256, drop_cross_sections: bool = False):
+    """
+    Context manager exporting the results of all bulging steps run inside to a :py:class:`StreamingSink`,
+    yields the sink. See :py:class:`StreamingSink` for the arguments.
+    """
+    sink = StreamingSink(path, chunk_size=chunk_size, drop_cross_sections=drop_cross_sections)
+    _sinks.append(sink)
+    try:
+        yield sink
+    finally:
+        _sinks.remove(sink)
+        sink.close()
+
+
+def read_chunks(path: Union[str, Path]) -> Iterator[tuple]:
+    """
+    Read the chunks of an export file, an incomplete chunk at the end is skipped.
+
+    :return: iterator of tuples of the record table and the concatenated WKB of each chunk
+    :raises ValueError: if the file is no export file
+    """
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(_CHUNK_HEADER.size)
+
+            if len(header) < _CHUNK_HEADER.size:
+                return
+
+            magic, table_length, wkb_length = _CHUNK_HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"'{path}' is not a bulging export file or is corrupted.")
+
+            table_bytes = file.read(table_length)
+            wkb_bytes = file.read(wkb_length)
+
+            if len(table_bytes) < table_length or len(wkb_bytes) < wkb_length:
+                return
+
+            yield np.load(io.BytesIO(table_bytes), allow_pickle=False), wkb_bytes
+
+
+def read_export(path: Union[str, Path], geometries: bool = True) -> tuple:
+    """
+    Read all records of an export file.
+
+    :param geometries: whether to decode the cross-sections
+    :return: tuple of the record table with the fields ``roll_pass``, ``classifiers`` and :py:data:`SCALAR_FIELDS`
+        and an object array of the cross-sections (``None`` if ``geometries`` is false)
+    """
+    tables = []
+    cross_sections = []
+
+    for table, wkb_bytes in read_chunks(path):
+        tables.append(table[["roll_pass", "classifiers", *SCALAR_FIELDS]])
+
+        if geometries:
+            cross_sections.extend(
+                shapely.from_wkb(wkb_bytes[o:o + n]) if n else None
+                for o, n in zip(table["wkb_offset"], table["wkb_length"])
+            )
+
+    if not tables:
+        table = np.empty(0, dtype=[("roll_pass", "U1"), ("classifiers", "U1")] + [(n, float) for n in SCALAR_FIELDS])
+    else:
+        dtype = np.dtype([
+            (name, max((t.dtype[name] for t in tables), key=lambda d: d.itemsize)) for name in tables[0].dtype.names
+        ])
+        table = np.concatenate([t.astype(dtype) for t in tables])
+
+    if not geometries:
+        return table, None
+
+    result = np.empty(len(cross_sections), dtype=object)
+    result[:] = cross_sections
+    return table, result
@@ -0,0 +1,128 @@
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from pyroll.core import SymmetricRollPass
+
+from .cache import groove_values
+from .config import Config
+
+
+@dataclass(frozen=True)
+class IncrementalStats:
+    """Snapshot of the statistics of an :py:class:`IncrementalMemo`."""
+
+    avoided: int
+    """Count of bulging steps whose results were reused."""
+
+    computed: int
+    """Count of bulging steps computed in full."""
+
+
+def inputs(model, profile) -> tuple:
+    """
+    Collect the inputs of the bulging step of ``model`` for ``profile``: incoming width and area,
+    groove parameters, roll pass height, displaced area and inscribed circle diameter, the groove radius of the
+    preceding roll pass, width and area of the unbulged profile, the active parameter profile and the settings of
+    :py:class:`Config` affecting the result.
+
+    :return: tuple of the classifier dependent model pair, a tuple of the settings compared exactly
+        and an array of the numeric inputs compared within tolerance
+    """
+    roll_pass = model.symmetric_roll_pass
+    groove = roll_pass.roll.groove
+
+    values = [
+        roll_pass.in_profile.width,
+        roll_pass.in_profile.cross_section.area,
+        roll_pass.height,
+        roll_pass.displaced_cross_section.area,
+        getattr(roll_pass, "inscribed_circle_diameter", 0),
+        _previous_groove_radius(roll_pass),
+        profile.width,
+        profile.cross_section.area,
+    ]
+    values.extend(v for _, v in groove_values(groove))
+    values.extend(model.parameter_profile.values())
+
+    settings = (
+        model.parameter_profile,
+        model.scalar_only(),
+        Config.SURROGATE,
+        Config.SENSITIVITIES,
+        Config.ANALYTIC_CROSS_SECTION,
+        Config.CONSTRUCTIVE_CROSS_SECTION,
+        Config.LAZY_CROSS_SECTION,
+        Config.COMPACT_CROSS_SECTION,
+        Config.COMPACT_CROSS_SECTION_DTYPE,
+        Config.MAX_CHORD_DEVIATION,
+        Config.OUTPUT_VERTEX_BUDGET,
+        Config.OUTPUT_MAX_AREA_ERROR,
+    )
+
+    return model.model_pair, settings, np.array(values, dtype=float)
+
+
+def _previous_groove_radius(roll_pass) -> float:
+    # read by the oval-round model of Lee, zero if there is no preceding roll pass
+    try:
+        return roll_pass.prev_of(SymmetricRollPass).roll.groove.r2
+    except (ValueError, IndexError, AttributeError):
+        return 0
+
+
+class IncrementalMemo:
+    """
+    Memory of the last inputs and results of the bulging step per roll pass.
+
+    Results are reused as long as no input changed by more than :py:attr:`Config.INCREMENTAL_TOLERANCE`
+    relative to its last value. Access is guarded by a lock, so the memory may be shared by threads.
+    """
+
+    def __init__(self):
+        self._entries = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.avoided = 0
+        self.computed = 0
+
+    def lookup(self, roll_pass, current_inputs) -> Optional[tuple]:
+        """Get the stored results of ``roll_pass`` if its inputs are unchanged within tolerance, else ``None``."""
+        with self._lock:
+            entry = self._entries.get(roll_pass)
+
+            if entry is not None:
+                (pair, settings, values), results = entry
+                current_pair, current_settings, current_values = current_inputs
+
+                if (
+                        pair is current_pair
+                        and settings == current_settings
+                        and values.shape == current_values.shape
+                        and np.all(np.abs(current_values - values) <= Config.INCREMENTAL_TOLERANCE * np.abs(values))
+                ):
+                    self.avoided += 1
+                    return results
+
+            self.computed += 1
+            return None
+
+    def store(self, roll_pass, current_inputs, results: tuple):
+        """Store the inputs and results of the last bulging step of ``roll_pass``."""
+        with self._lock:
+            self._entries[roll_pass] = (current_inputs, results)
+
+    def stats(self) -> IncrementalStats:
+        return IncrementalStats(avoided=self.avoided, computed=self.computed)
+
+    def clear(self):
+        """Forget all stored results and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.avoided = 0
+            self.computed = 0
+
+
+incremental_memo = IncrementalMemo()
+"""Global memory used by :py:class:`BulgingModel` if :py:attr:`Config.INCREMENTAL_SOLVE` is enabled."""
@@ -0,0 +1,220 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Union
+
+import shapely
+
+from .config import Config
+from .lazy import LazyBulgedCrossSection
+
+
+@dataclass
+class BulgingRecord:
+    """Measurements of a single run of :py:meth:`BulgingModel.solve`."""
+
+    roll_pass: str
+    """Label of the roll pass."""
+
+    branch: Optional[str] = None
+    """Name of the builder that created the cross-section, ``None`` if no model was applicable."""
+
+    start: float = 0
+    """Start time in seconds, relative to the creation of the recorder."""
+
+    wall_time: float = 0
+    """Duration of the bulging step in seconds."""
+
+    in_vertices: int = 0
+    """Vertex count of the unbulged cross-section."""
+
+    out_vertices: int = 0
+    """Vertex count of the bulged cross-section."""
+
+    bulge_radius: Optional[float] = None
+    """Computed bulge radius."""
+
+    fallbacks: int = 0
+    """How often the constructive assembly fell back to boolean operations."""
+
+    no_intersection: int = 0
+    """How often the "No intersection point found" fallback fired."""
+
+    cached: bool = False
+    """Whether the cross-section was taken from the cache."""
+
+    thread: int = 0
+    """Identifier of the thread that ran the step."""
+
+    lazy: bool = False
+    """Whether the construction of the cross-section was deferred, the output metrics are not available then."""
+
+
+_current: ContextVar[Optional[BulgingRecord]] = ContextVar("_current", default=None)
+
+
+class Recorder:
+    """Collection of :py:class:`BulgingRecord` instances."""
+
+    def __init__(self):
+        self.epoch = time.perf_counter()
+        self.records: list[BulgingRecord] = []
+
+    def clear(self):
+        """Remove all records."""
+        self.epoch = time.perf_counter()
+        self.records = []
+
+    def summary(self) -> list[dict]:
+        """Aggregate the records per roll pass and branch."""
+        rows = {}
+
+        for r in self.records:
+            row = rows.setdefault((r.roll_pass, r.branch), dict(
+                roll_pass=r.roll_pass, branch=r.branch, calls=0, total_time=0.0, in_vertices=0, out_vertices=0,
+                fallbacks=0, no_intersection=0, cache_hits=0
+            ))
+            row["calls"] += 1
+            row["total_time"] += r.wall_time
+            row["in_vertices"] = r.in_vertices
+            row["out_vertices"] = r.out_vertices
+            row["fallbacks"] += r.fallbacks
+            row["no_intersection"] += r.no_intersection
+            row["cache_hits"] += r.cached
+
+        for row in rows.values():
+            row["mean_time"] = row["total_time"] / row["calls"]
+
+        return list(rows.values())
+
+    def summary_table(self) -> str:
+        """Format :py:meth:`summary` as plain text table."""
+        header = (
+            f"{'roll pass':20s} {'branch':60s} {'calls':>6s} {'total ms':>10s} {'mean ms':>9s} "
+            f"{'in vert':>8s} {'out vert':>8s} {'fallbacks':>9s} {'no isect':>8s} {'cached':>6s}"
+        )
+        lines = [header, "-" * len(header)]
+
+        for row in self.summary():
+            lines.append(
+                f"{row['roll_pass']:20.20s} {str(row['branch']):60.60s} {row['calls']:6d} "
+                f"{row['total_time'] * 1e3:10.3f} {row['mean_time'] * 1e3:9.3f} "
+                f"{row['in_vertices']:8d} {row['out_vertices']:8d} {row['fallbacks']:9d} {row['no_intersection']:8d} "
+                f"{row['cache_hits']:6d}"
+            )
+
+        total = sum(r.wall_time for r in self.records)
+        fallbacks = sum(r.fallbacks for r in self.records)
+        no_intersection = sum(r.no_intersection for r in self.records)
+        lines.append("-" * len(header))
+        lines.append(f"{'total':20s} {'':60s} {len(self.records):6d} {total * 1e3:10.3f} "
+                     f"{'':9s} {'':8s} {'':8s} {fallbacks:9d} {no_intersection:8d}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """Convert the records to the Chrome trace event format (viewable in ``chrome://tracing`` or Perfetto)."""
+        pid = os.getpid()
+        return dict(
+            traceEvents=[
+                dict(
+                    name=r.roll_pass,
+                    cat="bulging",
+                    ph="X",
+                    ts=r.start * 1e6,
+                    dur=r.wall_time * 1e6,
+                    pid=pid,
+                    tid=r.thread,
+                    args={k: v for k, v in asdict(r).items() if k not in ("roll_pass", "start", "wall_time", "thread")},
+                )
+                for r in self.records
+            ],
+            displayTimeUnit="ms",
+        )
+
+    def write_chrome_trace(self, path: Union[str, Path]):
+        """Write :py:meth:`chrome_trace` to a JSON file."""
+        Path(path).write_text(json.dumps(self.chrome_trace()))
+
+
+recorder = Recorder()
+"""Global recorder filled by :py:class:`BulgingModel` if :py:attr:`Config.INSTRUMENTATION` is enabled."""
+
+
+def vertex_count(geometry) -> int:
+    if geometry is None:
+        return 0
+    return int(shapely.get_num_coordinates(geometry))
+
+
+def count_fallback():
+    """Count a fallback of the constructive assembly to boolean operations for the currently instrumented step."""
+    record = _current.get()
+
+    if record is not None:
+        record.fallbacks += 1
+
+
+def count_no_intersection():
+    """Count a firing of the "No intersection point found" fallback for the currently instrumented step."""
+    record = _current.get()
+
+    if record is not None:
+        record.no_intersection += 1
+
+
+def count_cache_hit():
+    """Mark the cross-section of the currently instrumented step as taken from the cache."""
+    record = _current.get()
+
+    if record is not None:
+        record.cached = True
+
+
+def instrumented_solve(model, in_profile):
+    """Run ``model._solve(in_profile)`` and add a record of it to :py:data:`recorder`."""
+    roll_pass = model.symmetric_roll_pass
+    record = BulgingRecord(roll_pass=roll_pass.label or str(roll_pass), thread=threading.get_ident())
+    record.in_vertices = vertex_count(in_profile.cross_section)
+
+    token = _current.set(record)
+    start = time.perf_counter()
+    try:
+        out_profile = model._solve(in_profile)
+    finally:
+        end = time.perf_counter()
+        _current.reset(token)
+
+    record.start = start - recorder.epoch
+    record.wall_time = end - start
+    record.bulge_radius = out_profile.bulge_radius
+
+    cross_section = out_profile.__dict__.get("cross_section")
+    record.lazy = isinstance(cross_section, LazyBulgedCrossSection) and not cross_section.evaluated
+
+    if not record.lazy:
+        record.out_vertices = vertex_count(out_profile.cross_section)
+
+    if model.model_pair is not None:
+        if not record.lazy and getattr(out_profile, "bulged_contour", None) is not None:
+            record.branch = model.model_pair.contour.__name__
+        else:
+            record.branch = model.model_pair.cross_section.__name__
+
+    recorder.records.append(record)
+    return out_profile
+
+
+@contextlib.contextmanager
+def instrument():
+    """Context manager enabling :py:attr:`Config.INSTRUMENTATION` temporarily, yields the :py:data:`recorder`."""
+    previous = Config.INSTRUMENTATION
+    Config.INSTRUMENTATION = True
+    try:
+        yield recorder
+    finally:
+        Config.INSTRUMENTATION = previous
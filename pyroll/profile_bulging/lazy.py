@@ -0,0 +1,43 @@
+class LazyBulgedCrossSection:
+    """
+    Deferred construction of a bulged cross-section.
+
+    Instances are assigned as explicit hook values, which PyRolL calls on access of the hook.
+    The build function is run on first access only, its result ``(cross_section, contour, simplification_error)``
+    is kept afterwards.
+    """
+
+    def __init__(self, build):
+        """
+        :param build: function without arguments returning a tuple ``(cross_section, contour, simplification_error)``
+        """
+        self._build = build
+        self._result = None
+
+    @property
+    def evaluated(self) -> bool:
+        """Whether the cross-section was already built."""
+        return self._build is None
+
+    def result(self):
+        """Get the tuple ``(cross_section, contour, simplification_error)``, building it if necessary."""
+        if self._build is not None:
+            self._result = self._build()
+            self._build = None
+        return self._result
+
+    def __call__(self):
+        cross_section = self.result()[0]
+        # compact cross-sections are materialized on access as well
+        return cross_section() if callable(cross_section) else cross_section
+
+    def contour(self):
+        return self.result()[1]
+
+    def simplification_error(self):
+        return self.result()[2]
+
+    def __repr__(self):
+        if self.evaluated:
+            return f"LazyBulgedCrossSection({self._result[0]})"
+        return "LazyBulgedCrossSection(<not evaluated>)"
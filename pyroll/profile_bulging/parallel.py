@@ -0,0 +1,39 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+
+def _solve(job):
+    unit, in_profile = job
+    return unit.solve(in_profile)
+
+
+def solve_sequences(jobs: Iterable[tuple], threads: Optional[int] = None) -> list:
+    """
+    Solve independent units, for example the pass sequences of the strands of a multi-strand mill, in a thread pool.
+
+    The caches of the plugin (:py:data:`cross_section_cache`, :py:data:`pass_geometry_cache`,
+    :py:data:`incremental_memo`) and active export sinks are shared by the threads, so strands with the same grooves
+    reuse each others cross-sections. The results equal the ones of solving the units one after another.
+    Threads pay off as far as the solution spends its time in Shapely and NumPy, which release the GIL,
+    the speedup therefore depends on the sequences and is measured by ``benchmarks/bench_threads.py``.
+    Use :py:func:`pyroll.profile_bulging.sweep.run_sweep` for process based parallelism.
+
+    :param jobs: tuples ``(unit, in_profile)`` of distinct, unsolved units (usually :py:class:`PassSequence`)
+        and their incoming profiles, no unit may occur in more than one job
+    :param threads: number of worker threads, defaults to the CPU count, ``1`` solves in the current thread
+    :return: list of the outgoing profiles in the order of ``jobs``
+    :raises ValueError: if a unit occurs in more than one job
+    """
+    jobs = list(jobs)
+
+    if len({id(unit) for unit, _ in jobs}) < len(jobs):
+        raise ValueError("Each unit may occur only once, since units are mutated while solving.")
+
+    threads = threads or os.cpu_count() or 1
+
+    if threads == 1 or len(jobs) <= 1:
+        return [_solve(j) for j in jobs]
+
+    with ThreadPoolExecutor(max_workers=min(threads, len(jobs)), thread_name_prefix="bulging") as executor:
+        return list(executor.map(_solve, jobs))
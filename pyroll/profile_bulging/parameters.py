@@ -0,0 +1,75 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import Union
+
+
+@dataclass(frozen=True)
+class ParameterProfile:
+    """
+    Set of the empirical constants of the bulge radius models, for example fitted to the measurements of a mill
+    or a material by :py:func:`pyroll.profile_bulging.calibration.calibrate`.
+    The defaults are the constants published with the models.
+    """
+
+    byon_eccentricity_factor: float = 3.133
+    """Factor of the eccentricity in Byon's models of round-oval and oval-round three-roll passes."""
+
+    min_eccentricity_factor: float = 2.40
+    """Factor of the eccentricity in Min's model of three-roll passes."""
+
+    lee_weight_factor: float = 1.0
+    """Factor of the weight of the incoming profile's radius in Lee's interpolation for two-roll passes."""
+
+    def replace(self, **changes) -> "ParameterProfile":
+        """Copy of the profile with the given constants changed."""
+        return dataclasses.replace(self, **changes)
+
+    def values(self) -> tuple:
+        """Values of all constants in field order."""
+        return dataclasses.astuple(self)
+
+
+DEFAULT = ParameterProfile()
+"""Profile of the published constants, registered as ``"default"``."""
+
+_profiles = {"default": DEFAULT}
+
+
+def register_profile(name: str, profile: ParameterProfile):
+    """Register ``profile`` under ``name``, replacing an existing one."""
+    _profiles[name] = profile
+
+
+def unregister_profile(name: str):
+    """Remove a registered profile, does nothing if it is not registered. The default profile can not be removed."""
+    if name != "default":
+        _profiles.pop(name, None)
+
+
+def profile_names() -> list:
+    """Names of the registered profiles."""
+    return list(_profiles)
+
+
+def resolve(value: Union[str, ParameterProfile, None]) -> ParameterProfile:
+    """
+    Get the profile for a name or profile instance, ``None`` resolves to :py:attr:`Config.PARAMETER_PROFILE`.
+
+    :raises KeyError: if no profile is registered under the name
+    """
+    if isinstance(value, ParameterProfile):
+        return value
+
+    if value is None:
+        from .config import Config
+        value = Config.PARAMETER_PROFILE
+
+        if isinstance(value, ParameterProfile):
+            return value
+
+    try:
+        return _profiles[value]
+    except KeyError:
+        raise KeyError(
+            f"No bulging parameter profile registered as {value!r}, available are {profile_names()}."
+        ) from None
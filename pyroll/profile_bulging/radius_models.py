@@ -0,0 +1,38 @@
+import numpy as np
+
+
+def two_roll_bulge_radius_round_oval_lee(width, in_width, in_equivalent_radius, usable_width, r2, height,
+                                         weight_factor=1.0):
+    weight = weight_factor * (usable_width - width) / (usable_width - in_width)
+    usable_radius = (r2 * height - (usable_width ** 2 + height ** 2) / 4) / (2 * r2 - usable_width)
+    return in_equivalent_radius * weight + usable_radius * (1 - weight)
+
+
+def two_roll_bulge_radius_oval_round_lee(width, in_width, usable_width, r2, height, oval_radius, weight_factor=1.0):
+    weight = weight_factor * (usable_width - width) / (usable_width - in_width)
+    usable_radius = np.where(height == 2 * r2, 2 * r2, r2 + (height - 2 * r2))[()]
+    return oval_radius * weight + usable_radius * (1 - weight)
+
+
+def two_roll_bulge_radius_model_schmidt(width, r2, height):
+    return (height / 2 ** 2 + width / 2 ** 2 - 2 * r2 * height / 2) / (2 * (width / 2 - r2))
+
+
+def three_roll_bulge_radius_round_round_and_oval_oval_byon(width):
+    return width / 2
+
+
+def three_roll_bulge_radius_round_oval_byon(width, in_width, in_area, displaced_area, eccentricity_factor=3.133):
+    eccentricity = eccentricity_factor * displaced_area / in_area * in_width / 2
+    return np.abs(width / 2 - eccentricity)
+
+
+def three_roll_bulge_radius_oval_round_byon(in_width, in_area, displaced_area, inscribed_circle_diameter,
+                                            eccentricity_factor=3.133):
+    eccentricity = eccentricity_factor * displaced_area / in_area * in_width / 2
+    return inscribed_circle_diameter / 2 + eccentricity
+
+
+def three_roll_bulge_radius_model_min(width, in_width, in_area, displaced_area, eccentricity_factor=2.40):
+    eccentricity = eccentricity_factor * displaced_area / in_area * in_width / 2
+    return np.abs(width - eccentricity)
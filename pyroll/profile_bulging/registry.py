@@ -0,0 +1,107 @@
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+_FOLD_PATTERN = re.compile(r"^(\d+)fold$")
+
+
+@dataclass(frozen=True)
+class ModelPair:
+    """
+    Bulge radius model and cross-section builder to use for a combination of classifiers.
+    All callables are invoked as ``callable(bulging_model, profile)``.
+    """
+
+    bulge_radius: Callable
+    """Function computing the bulge radius."""
+
+    cross_section: Callable
+    """Function building the bulged cross-section polygon."""
+
+    contour: Optional[Callable] = None
+    """Function building the analytic bulged contour, if available."""
+
+
+_models: list = []
+
+
+def fold_count(pass_classifiers: Iterable[str]) -> int:
+    """Number of rolls of a roll pass derived from its ``"<n>fold"`` classifier, two if none is present."""
+    for classifier in pass_classifiers:
+        match = _FOLD_PATTERN.match(classifier)
+
+        if match:
+            return int(match.group(1))
+
+    return 2
+
+
+def register(
+        in_classifier: str,
+        pass_classifier: str,
+        fold: int,
+        bulge_radius: Callable,
+        cross_section: Callable,
+        contour: Optional[Callable] = None,
+        first: bool = False,
+):
+    """
+    Register a model pair for profiles classified ``in_classifier`` entering
+    roll passes classified ``pass_classifier`` with ``fold`` rolls.
+
+    Registrations are matched in order, the first one whose classifiers are both present wins.
+    Registering an existing key replaces the entry at its position.
+
+    The callables may be methods of :py:class:`BulgingModel` or plain functions taking it as first argument.
+    For example, passes with four rolls have no bulge radius model registered by default,
+    a custom one is used together with the n-fold cross-section builder by::
+
+        def four_roll_bulge_radius(model, profile):
+            return ...
+
+        registry.register("round", "oval", 4, four_roll_bulge_radius, BulgingModel.n_fold_bulged_cross_section)
+
+    :param in_classifier: classifier of the incoming profile
+    :param pass_classifier: classifier of the roll pass
+    :param fold: number of rolls of the roll pass
+    :param bulge_radius: function computing the bulge radius
+    :param cross_section: function building the bulged cross-section
+    :param contour: function building the analytic contour, optional
+    :param first: whether to insert a new entry before all existing ones instead of after them
+    """
+    key = (in_classifier, pass_classifier, fold)
+    pair = ModelPair(bulge_radius=bulge_radius, cross_section=cross_section, contour=contour)
+
+    for i, (k, _) in enumerate(_models):
+        if k == key:
+            _models[i] = (key, pair)
+            return
+
+    if first:
+        _models.insert(0, (key, pair))
+    else:
+        _models.append((key, pair))
+
+
+def unregister(in_classifier: str, pass_classifier: str, fold: int):
+    """Remove a registered model pair, does nothing if it is not registered."""
+    key = (in_classifier, pass_classifier, fold)
+    _models[:] = [(k, p) for k, p in _models if k != key]
+
+
+def registered():
+    """List of all registered keys ``(in_classifier, pass_classifier, fold)`` in matching order."""
+    return [k for k, _ in _models]
+
+
+def resolve(in_classifiers: Iterable[str], pass_classifiers: Iterable[str]) -> Optional[ModelPair]:
+    """Get the first model pair matching the classifiers or ``None`` if there is none."""
+    in_classifiers = set(in_classifiers)
+    pass_classifiers = set(pass_classifiers)
+    fold = fold_count(pass_classifiers)
+
+    for (in_classifier, pass_classifier, f), pair in _models:
+        if f == fold and in_classifier in in_classifiers and pass_classifier in pass_classifiers:
+            return pair
+
+    return None
@@ -0,0 +1,403 @@
+import copy
+import math
+import operator
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import shapely
+from shapely.geometry.polygon import orient
+
+from . import registry, symmetry
+from .cache import cross_section_cache
+from .tessellation import quad_segs
+
+TWO_ROLL_VARIABLES = ("width", "r2", "usable_width", "gap")
+"""Variables the results of two-roll passes are differentiated with respect to."""
+
+N_ROLL_VARIABLES = ("width", "r2", "usable_width", "inscribed_circle_diameter")
+"""Variables the results of passes with three or more rolls are differentiated with respect to."""
+
+_TOLERANCE = 1e-9
+
+
+class Dual:
+    """
+    Number carrying its gradient for forward-mode differentiation.
+    Supports the arithmetic operators, comparisons of the values and the NumPy ufuncs used by the bulge radius models.
+    """
+
+    __slots__ = ("value", "gradient")
+
+    def __init__(self, value: float, gradient):
+        self.value = float(value)
+        self.gradient = np.asarray(gradient, dtype=float)
+
+    @classmethod
+    def variable(cls, value: float, index: int, count: int) -> "Dual":
+        """Seed the ``index``-th of ``count`` independent variables."""
+        gradient = np.zeros(count)
+        gradient[index] = 1
+        return cls(value, gradient)
+
+    @staticmethod
+    def _parts(other):
+        if isinstance(other, Dual):
+            return other.value, other.gradient
+        return float(other), 0.0
+
+    def __add__(self, other):
+        value, gradient = self._parts(other)
+        return Dual(self.value + value, self.gradient + gradient)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        value, gradient = self._parts(other)
+        return Dual(self.value - value, self.gradient - gradient)
+
+    def __rsub__(self, other):
+        value, gradient = self._parts(other)
+        return Dual(value - self.value, gradient - self.gradient)
+
+    def __mul__(self, other):
+        value, gradient = self._parts(other)
+        return Dual(self.value * value, self.gradient * value + self.value * gradient)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        value, gradient = self._parts(other)
+        return Dual(self.value / value, (self.gradient * value - self.value * gradient) / value ** 2)
+
+    def __rtruediv__(self, other):
+        value, gradient = self._parts(other)
+        return Dual(value / self.value, (gradient * self.value - value * self.gradient) / self.value ** 2)
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Dual):
+            raise TypeError("Only constant exponents are supported.")
+        return Dual(self.value ** exponent, exponent * self.value ** (exponent - 1) * self.gradient)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.gradient)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.value < 0 else self
+
+    def sqrt(self):
+        value = math.sqrt(self.value)
+        return Dual(value, self.gradient / (2 * value))
+
+    def __eq__(self, other):
+        return self.value == self._parts(other)[0]
+
+    def __ne__(self, other):
+        return self.value != self._parts(other)[0]
+
+    def __lt__(self, other):
+        return self.value < self._parts(other)[0]
+
+    def __le__(self, other):
+        return self.value <= self._parts(other)[0]
+
+    def __gt__(self, other):
+        return self.value > self._parts(other)[0]
+
+    def __ge__(self, other):
+        return self.value >= self._parts(other)[0]
+
+    __hash__ = None
+
+    def __float__(self):
+        return self.value
+
+    def __repr__(self):
+        return f"Dual({self.value}, {self.gradient})"
+
+    _UFUNCS = {
+        np.add: operator.add,
+        np.subtract: operator.sub,
+        np.multiply: operator.mul,
+        np.true_divide: operator.truediv,
+        np.power: operator.pow,
+        np.negative: operator.neg,
+        np.absolute: operator.abs,
+        np.sqrt: lambda x: x.sqrt() if isinstance(x, Dual) else math.sqrt(x),
+        np.equal: operator.eq,
+        np.not_equal: operator.ne,
+        np.less: operator.lt,
+        np.less_equal: operator.le,
+        np.greater: operator.gt,
+        np.greater_equal: operator.ge,
+    }
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        function = self._UFUNCS.get(ufunc)
+
+        if method != "__call__" or kwargs or function is None or any(np.ndim(i) for i in inputs):
+            return NotImplemented
+
+        return function(*(i if isinstance(i, Dual) else float(i) for i in inputs))
+
+
+class _Seeded:
+    """Proxy of an object with some attributes replaced."""
+
+    def __init__(self, target, **overrides):
+        self._target = target
+        self._overrides = overrides
+
+    def __getattr__(self, name):
+        overrides = self.__dict__["_overrides"]
+
+        if name in overrides:
+            return overrides[name]
+        return getattr(self.__dict__["_target"], name)
+
+
+def axes(fold: int) -> np.ndarray:
+    """Unit vectors from the center of a roll pass with ``fold`` rolls towards the apexes of the bulges."""
+    if fold == 2:
+        return np.array([[1.0, 0.0], [-1.0, 0.0]])
+    return np.asarray(symmetry.directions(fold, symmetry.gap_angle(fold)))
+
+
+def _edges(geometry):
+    for polygon in getattr(geometry, "geoms", [geometry]):
+        if polygon is None or polygon.is_empty or polygon.geom_type != "Polygon":
+            continue
+
+        polygon = orient(polygon, 1.0)
+        for ring in (polygon.exterior, *polygon.interiors):
+            coords = np.asarray(ring.coords)
+            yield coords[:-1], coords[1:]
+
+
+def boundary_integral(geometry, velocity) -> float:
+    """
+    Rate of change of the area of ``geometry`` if its boundary moves with ``velocity``,
+    the integral of the normal velocity over the boundary.
+    The vertices of each edge are moved with the velocity of the edge and the edge in between linearly,
+    so the result is the exact derivative of the area of the polygon.
+
+    :param geometry: polygon or multi-polygon
+    :param velocity: function of the start and end points of the edges (arrays of shape ``(n, 2)``)
+        returning the velocities of both as tuple of arrays of shape ``(n, 2)``
+    """
+    result = 0.0
+
+    for starts, ends in _edges(geometry):
+        start_velocities, end_velocities = velocity(starts, ends)
+        normals = np.column_stack([ends[:, 1] - starts[:, 1], starts[:, 0] - ends[:, 0]])
+        result += np.sum((start_velocities + end_velocities) / 2 * normals)
+
+    return float(result)
+
+
+class _Motion:
+    """Velocity fields of the boundary of the bulged cross-section of a roll pass."""
+
+    def __init__(self, roll_pass, width: float, radius: Optional[float], fold: int, helper_factor=None):
+        """
+        :param radius: bulge radius, ``None`` for geometries without bulges
+        :param helper_factor: width factor of the helper cross-section in passes with three or more rolls
+        """
+        self.width = width
+        self.radius = radius
+        self.axes = axes(fold)
+        self.centers = (width / 2 - radius) * self.axes if radius is not None else np.empty((0, 2))
+        self.lines = list(roll_pass.contour_lines.geoms)
+        self.line_directions = []
+
+        for line in self.lines:
+            centroid = np.asarray(line.centroid.coords[0])
+            self.line_directions.append(centroid / np.linalg.norm(centroid))
+
+        self.ratios = [0.5] + ([helper_factor / 2] if helper_factor is not None else [])
+        self.tolerance = _TOLERANCE * max(width, radius or 0, *(np.max(np.abs(line.bounds)) for line in self.lines))
+
+    def _bulge_distances(self, points, k):
+        return np.linalg.norm(points - self.centers[k], axis=1) - self.radius
+
+    def _on_line(self, points, j):
+        return shapely.distance(shapely.points(points), self.lines[j]) <= self.tolerance
+
+    def _on_roll(self, starts, ends, j):
+        return self._on_line(starts, j) & self._on_line(ends, j) & self._on_line((starts + ends) / 2, j)
+
+    def _bulge_edges(self, starts, ends):
+        if self.radius is None:
+            return
+
+        # edges between vertices of the tessellated circle, or from one to a crossing with another contour,
+        # which lies on a chord of the circle
+        sagitta = self.radius * (1 - math.cos(math.pi / 4 / quad_segs(self.radius))) + self.tolerance
+        chord = 2 * self.radius * math.sin(math.pi / 4 / quad_segs(self.radius)) + self.tolerance
+        short = np.linalg.norm(ends - starts, axis=1) <= chord
+
+        for k in range(len(self.centers)):
+            start_distances = self._bulge_distances(starts, k)
+            end_distances = self._bulge_distances(ends, k)
+            on_start = np.abs(start_distances) <= self.tolerance
+            on_end = np.abs(end_distances) <= self.tolerance
+            near_start = (start_distances >= -sagitta) & (start_distances <= self.tolerance)
+            near_end = (end_distances >= -sagitta) & (end_distances <= self.tolerance)
+            yield k, (on_start & near_end | near_start & on_end) & short
+
+    def radius_velocity(self, starts, ends):
+        """Velocities of the boundary per bulge radius at constant width."""
+        velocities = np.zeros_like(starts), np.zeros_like(ends)
+
+        for k, selected in self._bulge_edges(starts, ends):
+            for points, result in zip((starts, ends), velocities):
+                result[selected] = (points[selected] - self.centers[k]) / self.radius - self.axes[k]
+
+        return velocities
+
+    def width_velocity(self, starts, ends):
+        """Velocities of the boundary per profile width at constant bulge radius."""
+        velocities = np.zeros_like(starts), np.zeros_like(ends)
+        moved = np.zeros(len(starts), dtype=bool)
+
+        for k, selected in self._bulge_edges(starts, ends):
+            for result in velocities:
+                result[selected] = self.axes[k] / 2
+            moved |= selected
+
+        # straight cuts perpendicular to the axes at a fixed fraction of the width, unless on the roll contour
+        for j in range(len(self.lines)):
+            moved |= self._on_roll(starts, ends, j)
+
+        for axis in self.axes:
+            for ratio in self.ratios:
+                distance = ratio * self.width
+                selected = (
+                        ~moved
+                        & (np.abs(starts @ axis - distance) <= self.tolerance)
+                        & (np.abs(ends @ axis - distance) <= self.tolerance)
+                )
+                for result in velocities:
+                    result[selected] = ratio * axis
+                moved |= selected
+
+        return velocities
+
+    def opening_velocity(self, starts, ends):
+        """Velocities of the boundary per roll gap (two rolls) or inscribed circle diameter (more rolls)."""
+        velocities = np.zeros_like(starts), np.zeros_like(ends)
+        moved = np.zeros(len(starts), dtype=bool)
+
+        for _, selected in self._bulge_edges(starts, ends):
+            moved |= selected
+
+        for j, direction in enumerate(self.line_directions):
+            selected = ~moved & self._on_roll(starts, ends, j)
+            for result in velocities:
+                result[selected] = direction / 2
+            moved |= selected
+
+        return velocities
+
+
+@dataclass(frozen=True)
+class Sensitivities:
+    """Derivatives of the results of the bulging step, created by :py:func:`sensitivities`."""
+
+    bulge_radius: float
+    """Value of the bulge radius."""
+
+    bulged_area: float
+    """Value of the area of the bulged cross-section."""
+
+    bulge_radius_gradient: dict
+    """Derivatives of the bulge radius per variable name."""
+
+    bulged_area_gradient: dict
+    """Derivatives of the bulged area per variable name."""
+
+
+def sensitivities(model, profile) -> Sensitivities:
+    """
+    Compute the bulge radius and the bulged area of ``profile`` in the roll pass of ``model`` together with their
+    derivatives with respect to the profile width, the groove radius ``r2`` and usable width and the roll gap
+    (two rolls) or inscribed circle diameter (three or more rolls) from a single evaluation.
+
+    The bulge radius is differentiated in forward mode by evaluating the registered model with :py:class:`Dual`
+    inputs, so any model built from arithmetic operations is supported.
+    The area is differentiated as integral of the normal velocity of the boundary of the bulged cross-section:
+    the bulges move with their radius and the width, the contour of the rolls moves rigidly with gap or inscribed
+    circle diameter. The same applies to the displaced cross-section used by the models of three-roll passes.
+
+    The derivatives are partial ones with respect to these variables: the incoming profile and the shape of the roll
+    contour are kept constant, so ``r2`` and ``usable_width`` act through the bulge radius model only, and
+    the width is an independent variable to be chained with the derivative of the spreading model.
+
+    :param model: the :py:class:`BulgingModel` of the roll pass
+    :param profile: the unbulged outgoing profile
+    :raises ValueError: if no bulging model is available for the roll pass
+    """
+    if model.model_pair is None:
+        raise ValueError(f"No bulging model available for roll pass '{model.symmetric_roll_pass.label}'.")
+
+    roll_pass = model.symmetric_roll_pass
+    groove = roll_pass.roll.groove
+    fold = registry.fold_count(roll_pass.classifiers)
+    names = TWO_ROLL_VARIABLES if fold == 2 else N_ROLL_VARIABLES
+    opening = names[-1]
+
+    if not hasattr(groove, "r2"):
+        names = tuple(n for n in names if n != "r2")
+
+    count = len(names)
+
+    def seed(name, value):
+        return Dual.variable(value, names.index(name), count) if name in names else value
+
+    helper_factor = None
+    if fold > 2:
+        from .symmetric_roll_pass import N_FOLD_HELPER_FACTORS
+        helper_factor = N_FOLD_HELPER_FACTORS.get(model.n_fold_classifiers())
+
+    # the roll contour moves rigidly with the opening, which shrinks the displaced cross-section
+    displaced = roll_pass.displaced_cross_section
+    displaced_rate = boundary_integral(displaced, _Motion(roll_pass, profile.width, None, fold).opening_velocity)
+    per_opening = np.eye(count)[names.index(opening)]
+
+    overrides = dict(
+        roll=_Seeded(roll_pass.roll, groove=_Seeded(
+            groove, **{n: seed(n, getattr(groove, n)) for n in ("r2", "usable_width") if n in names}
+        )),
+        height=Dual(roll_pass.height, per_opening),
+        displaced_cross_section=_Seeded(displaced, area=Dual(displaced.area, displaced_rate * per_opening)),
+    )
+    if opening == "inscribed_circle_diameter":
+        overrides[opening] = seed(opening, roll_pass.inscribed_circle_diameter)
+
+    seeded_pass = _Seeded(roll_pass, **overrides)
+    seeded_model = _Seeded(model, symmetric_roll_pass=seeded_pass)
+    radius = model.model_pair.bulge_radius(seeded_model, _Seeded(profile, width=seed("width", profile.width)))
+
+    if not isinstance(radius, Dual):
+        radius = Dual(radius, np.zeros(count))
+
+    bulged_profile = copy.copy(profile)
+    bulged_profile.bulge_radius = radius.value
+    (cross_section, _, _), _ = cross_section_cache.get_or_build(
+        cross_section_cache.key(roll_pass, bulged_profile), lambda: model.output_cross_section(bulged_profile)
+    )
+
+    motion = _Motion(roll_pass, profile.width, radius.value, fold, helper_factor)
+    area_gradient = boundary_integral(cross_section, motion.radius_velocity) * radius.gradient
+    area_gradient[names.index("width")] += boundary_integral(cross_section, motion.width_velocity)
+    area_gradient[names.index(opening)] += boundary_integral(cross_section, motion.opening_velocity)
+
+    return Sensitivities(
+        bulge_radius=radius.value,
+        bulged_area=cross_section.area,
+        bulge_radius_gradient=dict(zip(names, map(float, radius.gradient))),
+        bulged_area_gradient=dict(zip(names, map(float, area_gradient))),
+    )
@@ -0,0 +1,113 @@
+import heapq
+import math
+from typing import Tuple
+
+import numpy as np
+import shapely
+from shapely import Polygon
+
+from . import symmetry
+
+
+def _triangle_area(a, b, c) -> float:
+    return abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) / 2
+
+
+def visvalingam(coords: np.ndarray, keep: int, max_removed_area: float = math.inf) -> Tuple[np.ndarray, float]:
+    """
+    Simplify an open polyline by repeatedly removing the vertex spanning the smallest triangle with its neighbours.
+    The first and the last vertex are always kept.
+
+    :param coords: vertices of the polyline
+    :param keep: number of vertices to keep at least
+    :param max_removed_area: bound of the summed areas of the removed triangles
+    :return: tuple of the kept coordinates and the summed area of the removed triangles,
+        which bounds the area between the original and the simplified polyline
+    """
+    count = len(coords)
+    previous = list(range(-1, count - 1))
+    following = list(range(1, count + 1))
+    areas = [math.inf] * count
+    removed = np.zeros(count, dtype=bool)
+
+    for i in range(1, count - 1):
+        areas[i] = _triangle_area(coords[i - 1], coords[i], coords[i + 1])
+
+    heap = [(areas[i], i) for i in range(1, count - 1)]
+    heapq.heapify(heap)
+    total = 0.0
+    remaining = count
+
+    while heap and remaining > max(keep, 2):
+        area, i = heapq.heappop(heap)
+
+        if removed[i] or area != areas[i]:
+            continue
+
+        if total + area > max_removed_area:
+            break
+
+        removed[i] = True
+        total += area
+        remaining -= 1
+
+        p, f = previous[i], following[i]
+        following[p], previous[f] = f, p
+
+        for j in (p, f):
+            if 0 < j < count - 1:
+                areas[j] = _triangle_area(coords[previous[j]], coords[j], coords[following[j]])
+                heapq.heappush(heap, (areas[j], j))
+
+    return coords[~removed], total
+
+
+def simplify(cross_section: Polygon, fold: int, vertex_budget: int = 0,
+             max_area_error: float = 0.0) -> Tuple[Polygon, float]:
+    """
+    Simplify a bulged cross-section while preserving its symmetry.
+
+    Only the outer arc of the cross-section inside the first quadrant (two rolls) or the sector of the first roll gap
+    (three or more rolls) is simplified, the result is assembled from its mirrored or rotated copies.
+    Vertices are removed until the vertex budget is reached, but only as long as the area error stays within its bound.
+
+    :param cross_section: the bulged cross-section
+    :param fold: number of rolls of the roll pass
+    :param vertex_budget: number of vertices to aim for, ``0`` for no limit
+    :param max_area_error: bound of the area between original and simplified cross-section
+        relative to the area of the original, ``0`` for no bound (only if a vertex budget is given)
+    :return: tuple of the simplified cross-section and the achieved error as area of the symmetric difference
+        relative to the area of the original;
+        the cross-section is returned unchanged with an error of ``0`` if it is not symmetric as expected
+        or could not be simplified to a valid polygon
+    """
+    if cross_section is None or cross_section.is_empty or (vertex_budget <= 0 and max_area_error <= 0):
+        return cross_section, 0.0
+
+    if fold == 2:
+        copies = 4
+        arc = symmetry.outer_arc(symmetry.quadrant(cross_section), 4, 45)
+    else:
+        copies = fold
+        start_angle = symmetry.gap_angle(fold)
+        extent = 2 * np.max(np.abs(cross_section.bounds))
+        arc = symmetry.outer_arc(
+            shapely.intersection(cross_section, symmetry.sector(fold, start_angle, extent)), fold, start_angle
+        )
+
+    if arc is None:
+        return cross_section, 0.0
+
+    keep = vertex_budget // copies + 1 if vertex_budget > 0 else 2
+    max_removed_area = max_area_error * cross_section.area / copies if max_area_error > 0 else math.inf
+    simplified_arc, _ = visvalingam(arc, keep, max_removed_area)
+
+    if len(simplified_arc) == len(arc):
+        return cross_section, 0.0
+
+    result = symmetry.mirrored_ring(simplified_arc) if fold == 2 else symmetry.rotated_ring(simplified_arc, fold)
+
+    if result is None:
+        return cross_section, 0.0
+
+    return result, shapely.symmetric_difference(cross_section, result).area / cross_section.area
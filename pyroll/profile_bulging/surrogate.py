@@ -0,0 +1,266 @@
+import copy
+import struct
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from . import symmetry
+from .cache import _quantize, groove_values
+from .config import Config
+
+FIELDS = ("area", "width", "height")
+"""Quantities of the bulged cross-section tabulated by a :py:class:`SurrogateTable`."""
+
+
+@dataclass
+class SurrogateTable:
+    """
+    Bulged area, width and height of the cross-sections of a roll pass sampled over a regular grid
+    of profile widths and bulge radii.
+    """
+
+    groove: str
+    """Class name of the groove the table was sampled for."""
+
+    groove_values: np.ndarray
+    """Numeric parameters of the groove, sorted by name."""
+
+    gap: float
+    """Roll gap of the roll pass."""
+
+    builder: str
+    """Name of the cross-section builder selected for the sampled roll pass."""
+
+    in_classifiers: tuple
+    """Sorted classifiers of the incoming profile of the sampled roll pass."""
+
+    pass_classifiers: tuple
+    """Sorted classifiers of the sampled roll pass."""
+
+    widths: np.ndarray
+    """Ascending profile widths of the grid."""
+
+    radii: np.ndarray
+    """Ascending bulge radii of the grid."""
+
+    area: np.ndarray
+    """Bulged areas of shape ``(len(widths), len(radii))``, NaN where no cross-section could be built."""
+
+    width: np.ndarray
+    """Bulged widths, shaped like :py:attr:`area`."""
+
+    height: np.ndarray
+    """Bulged heights, shaped like :py:attr:`area`."""
+
+    def key(self) -> tuple:
+        """Key of the roll pass, its classifiers and builder the table is valid for."""
+        return _key(self.groove, self.groove_values, self.gap, self.builder, self.in_classifiers, self.pass_classifiers)
+
+    def lookup(self, width, radius) -> dict:
+        """
+        Bilinear interpolation of the tabulated quantities.
+        Arguments may be scalars or arrays and are broadcast against each other.
+
+        :return: dict of :py:data:`FIELDS` to values, NaN outside the grid or next to failed samples
+        """
+        width, radius = np.broadcast_arrays(np.asarray(width, dtype=float), np.asarray(radius, dtype=float))
+        i, u, inside_w = _cell(self.widths, width)
+        j, v, inside_r = _cell(self.radii, radius)
+        outside = ~(inside_w & inside_r)
+
+        result = {}
+        for name in FIELDS:
+            table = np.asarray(getattr(self, name))
+            value = (
+                    table[i, j] * (1 - u) * (1 - v) + table[i + 1, j] * u * (1 - v)
+                    + table[i, j + 1] * (1 - u) * v + table[i + 1, j + 1] * u * v
+            )
+            result[name] = np.where(outside, np.nan, value)[()]
+
+        return result
+
+    def save(self, path: Union[str, Path]):
+        """Write the table to an uncompressed ``.npz`` file, which can be memory-mapped by :py:meth:`load`."""
+        np.savez(
+            path,
+            groove=np.array(self.groove), groove_values=self.groove_values, gap=np.array(self.gap),
+            builder=np.array(self.builder), in_classifiers=np.array(self.in_classifiers, dtype=str),
+            pass_classifiers=np.array(self.pass_classifiers, dtype=str), widths=self.widths, radii=self.radii,
+            **{name: getattr(self, name) for name in FIELDS}
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> "SurrogateTable":
+        """
+        Read a table written by :py:meth:`save`.
+
+        :param mmap: whether to memory-map the tabulated arrays instead of reading them into memory
+        """
+        if mmap:
+            arrays = _memmap_npz(path)
+        else:
+            with np.load(path) as archive:
+                arrays = dict(archive)
+
+        return cls(
+            groove=str(arrays["groove"][()]),
+            groove_values=np.asarray(arrays["groove_values"]),
+            gap=float(arrays["gap"][()]),
+            builder=str(arrays["builder"][()]),
+            in_classifiers=tuple(str(c) for c in arrays["in_classifiers"]),
+            pass_classifiers=tuple(str(c) for c in arrays["pass_classifiers"]),
+            widths=arrays["widths"],
+            radii=arrays["radii"],
+            **{name: arrays[name] for name in FIELDS}
+        )
+
+
+def _key(groove: str, values, gap: float, builder: str, in_classifiers, pass_classifiers) -> tuple:
+    tolerance = Config.CROSS_SECTION_CACHE_TOLERANCE
+    return (
+        groove, tuple(_quantize(v, tolerance) for v in values), _quantize(gap, tolerance), builder,
+        tuple(sorted(in_classifiers)), tuple(sorted(pass_classifiers)),
+    )
+
+
+def _cell(grid, values):
+    inside = (values >= grid[0]) & (values <= grid[-1])
+    index = np.clip(np.searchsorted(grid, values, side="right") - 1, 0, len(grid) - 2)
+    fraction = (values - grid[index]) / (grid[index + 1] - grid[index])
+    return index, fraction, inside
+
+
+def _memmap_npz(path: Union[str, Path]) -> dict:
+    """Memory-map the members of an uncompressed ``.npz`` file, compressed members are read into memory."""
+    arrays = {}
+
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename[:-len(".npy")]
+
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+
+            # the data of a stored member follows its local file header of 30 bytes, name and extra field
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", file.read(4))
+            file.seek(info.header_offset + 30 + name_length + extra_length)
+
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+
+            if dtype.hasobject:
+                raise ValueError(f"Member '{name}' of '{path}' contains Python objects.")
+
+            arrays[name] = np.memmap(
+                path, dtype=dtype, mode="r", offset=file.tell(), shape=shape, order="F" if fortran_order else "C"
+            )
+
+    return arrays
+
+
+def sample_table(roll_pass, widths: Sequence[float], radii: Sequence[float]) -> SurrogateTable:
+    """
+    Sample ``BulgingModel.cross_section`` of a solved roll pass over a grid of profile widths and bulge radii.
+
+    All other inputs of the builders, like the unbulged cross-section, are taken from the outgoing profile
+    of the roll pass, so the table is representative for roll passes with similar incoming profiles.
+
+    :param roll_pass: solved roll pass to sample
+    :param widths: ascending profile widths of the grid
+    :param radii: ascending bulge radii of the grid
+    :raises ValueError: if no bulging model is available for the roll pass or a grid is not ascending
+    """
+    from pyroll.core import Profile as BaseProfile
+    from .symmetric_roll_pass import BulgingModel
+
+    widths = np.asarray(widths, dtype=float)
+    radii = np.asarray(radii, dtype=float)
+
+    for grid in (widths, radii):
+        if grid.ndim != 1 or len(grid) < 2 or np.any(np.diff(grid) <= 0):
+            raise ValueError("Grids must be one-dimensional, ascending and of at least two values.")
+
+    model = BulgingModel(roll_pass)
+    if model.model_pair is None:
+        raise ValueError(f"No bulging model available for roll pass '{roll_pass.label}'.")
+
+    template = BaseProfile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+    three_fold = "3fold" in roll_pass.classifiers
+    values = np.full((len(FIELDS), len(widths), len(radii)), np.nan)
+
+    for i, width in enumerate(widths):
+        for j, radius in enumerate(radii):
+            profile = copy.copy(template)
+            profile.width = width
+            profile.bulge_radius = radius
+
+            try:
+                cross_section = model.cross_section(profile)
+            except (ValueError, ArithmeticError):
+                continue
+
+            values[:, i, j] = symmetry.dimensions(cross_section, three_fold)
+
+    return SurrogateTable(
+        groove=type(roll_pass.roll.groove).__name__,
+        groove_values=np.array([v for _, v in groove_values(roll_pass.roll.groove)]),
+        gap=float(roll_pass.gap),
+        builder=model.model_pair.cross_section.__name__,
+        in_classifiers=tuple(sorted(roll_pass.in_profile.classifiers)),
+        pass_classifiers=tuple(sorted(roll_pass.classifiers)),
+        widths=widths,
+        radii=radii,
+        **dict(zip(FIELDS, values))
+    )
+
+
+class SurrogateTables:
+    """Collection of :py:class:`SurrogateTable` instances keyed by groove, gap, classifiers and builder."""
+
+    def __init__(self):
+        self._tables = {}
+
+    def add(self, table: SurrogateTable):
+        """Add a table, replacing one of the same key."""
+        self._tables[table.key()] = table
+
+    def load(self, path: Union[str, Path], mmap: bool = True) -> SurrogateTable:
+        """Load a table from a file and add it."""
+        table = SurrogateTable.load(path, mmap=mmap)
+        self.add(table)
+        return table
+
+    def find(self, model) -> Optional[SurrogateTable]:
+        """
+        Get the table valid for the roll pass, the classifiers of it and its incoming profile and the builder
+        of ``model``, ``None`` if there is none.
+        """
+        if not self._tables or model.model_pair is None:
+            return None
+
+        roll_pass = model.symmetric_roll_pass
+        groove = roll_pass.roll.groove
+        return self._tables.get(_key(
+            type(groove).__name__, [v for _, v in groove_values(groove)], roll_pass.gap,
+            model.model_pair.cross_section.__name__, roll_pass.in_profile.classifiers, roll_pass.classifiers
+        ))
+
+    def clear(self):
+        """Remove all tables."""
+        self._tables.clear()
+
+    def __len__(self):
+        return len(self._tables)
+
+
+surrogate_tables = SurrogateTables()
+"""Global tables used by :py:class:`BulgingModel` if :py:attr:`Config.SURROGATE` is enabled."""
@@ -0,0 +1,193 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .compact import CompactCrossSection, pack
+
+RESULT_FIELDS = ("bulge_radius", "area", "width", "height")
+"""Quantities of the bulged profiles collected per roll pass."""
+
+
+@dataclass
+class SweepResult:
+    """Result of :py:func:`run_sweep`."""
+
+    parameters: list
+    """Parameter dicts of the variants, indexed by variant number."""
+
+    table: np.ndarray
+    """Structured array with one row per variant and roll pass with the fields ``variant``, ``index``
+    (index of the roll pass in the sequence), ``roll_pass`` (label) and :py:data:`RESULT_FIELDS`."""
+
+    errors: dict = field(default_factory=dict)
+    """Error messages of failed variants, keyed by variant number."""
+
+    cross_sections: Optional[list] = None
+    """Bulged cross-sections per row of :py:attr:`table` if collected, ``None`` where they have no compact form.
+    Their arcs are views into :py:attr:`coordinates`."""
+
+    coordinates: Optional[np.ndarray] = None
+    """Single buffer holding the coordinates of all collected cross-sections."""
+
+    def variant(self, number: int) -> np.ndarray:
+        """Rows of a single variant."""
+        return self.table[self.table["variant"] == number]
+
+
+def expand_grid(grid: Union[Mapping[str, Sequence], Iterable[Mapping]]) -> list:
+    """
+    Expand a parameter grid to a list of parameter dicts.
+    A mapping of names to value sequences yields its cartesian product, an iterable of mappings is taken as is.
+    """
+    if isinstance(grid, Mapping):
+        names = list(grid.keys())
+        return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+    return [dict(p) for p in grid]
+
+
+def bulged_profiles(sequence):
+    """
+    Yield the roll passes of a solved sequence together with their bulged outgoing profile.
+
+    The bulged profile is read from the incoming profile of the following unit, so the results of the solution are
+    taken as they are. PyRolL does not keep the post-processed profile of the last unit of a sequence,
+    so the bulging step is run once more for a roll pass ending the sequence.
+    """
+    from pyroll.core import Profile as BaseProfile, BaseRollPass
+    from .symmetric_roll_pass import BulgingModel
+
+    units = sequence.units
+
+    for roll_pass, following in zip(units, units[1:] + [None]):
+        if not isinstance(roll_pass, BaseRollPass):
+            continue
+
+        if following is not None:
+            yield roll_pass, following.in_profile
+            continue
+
+        profile = BaseProfile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+        model = BulgingModel(roll_pass)
+        yield roll_pass, model._solve(profile) if model.enabled() else profile
+
+
+def _row_values(profile):
+    bulge_radius = getattr(profile, "bulge_radius", None)
+    cross_section = profile.__dict__.get("cross_section")
+
+    # compact cross-sections provide the values without materializing the polygon
+    if not profile.bulged_scalars_only and isinstance(cross_section, CompactCrossSection):
+        bounds = cross_section.bounds
+        return bulge_radius, cross_section.area, bounds[2] - bounds[0], bounds[3] - bounds[1]
+
+    # the hooks hold the values of scalar-only and surrogate results, whose cross-section is the unbulged one
+    try:
+        return bulge_radius, profile.bulged_area, profile.bulged_width, profile.bulged_height
+    except (AttributeError, ValueError):
+        return bulge_radius, np.nan, np.nan, np.nan
+
+
+def _compact_cross_section(roll_pass, profile) -> Optional[CompactCrossSection]:
+    from . import registry
+
+    cross_section = profile.__dict__.get("cross_section")
+    if isinstance(cross_section, CompactCrossSection):
+        return cross_section
+
+    return CompactCrossSection.from_polygon(
+        profile.cross_section, registry.fold_count(roll_pass.classifiers), profile.bulge_radius
+    )
+
+
+def solve_variant(factory: Callable, parameters: dict, cross_sections: bool = False):
+    """
+    Solve a single variant created by ``factory(**parameters)``.
+
+    :param cross_sections: whether to append the compact cross-section (or ``None``) to each row
+    :return: tuple of a list of rows ``(index, label, bulge_radius, area, width, height)`` and an error message
+    """
+    try:
+        sequence, in_profile = factory(**parameters)
+        sequence.solve(in_profile)
+        rows = []
+
+        for i, (roll_pass, profile) in enumerate(bulged_profiles(sequence)):
+            values = tuple(float(v) if v is not None else np.nan for v in _row_values(profile))
+            row = (i, str(roll_pass.label)) + values
+            rows.append(row + (_compact_cross_section(roll_pass, profile),) if cross_sections else row)
+
+        return rows, None
+    except Exception as e:
+        return [], f"{type(e).__name__}: {e}"
+
+
+def _solve_task(task):
+    return solve_variant(*task)
+
+
+def _table(results) -> np.ndarray:
+    # strip the cross-sections appended if collected
+    size = 2 + len(RESULT_FIELDS)
+    rows = [(v,) + row[:size] for v, (variant_rows, _) in enumerate(results) for row in variant_rows]
+    label_length = max((len(r[2]) for r in rows), default=1)
+    dtype = [("variant", int), ("index", int), ("roll_pass", f"U{max(label_length, 1)}")]
+    dtype += [(name, float) for name in RESULT_FIELDS]
+    return np.array(rows, dtype=dtype)
+
+
+def run_sweep(
+        factory: Callable,
+        grid: Union[Mapping[str, Sequence], Iterable[Mapping]],
+        processes: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        initializer: Optional[Callable] = None,
+        initargs: tuple = (),
+        cross_sections: bool = False,
+) -> SweepResult:
+    """
+    Solve variants of a pass sequence in a process pool and collect the bulging results.
+
+    The variants are created by ``factory(**parameters)``, which has to return a tuple ``(sequence, in_profile)``
+    of a fresh, unsolved :py:class:`PassSequence` and its incoming profile.
+    Since the variants are created in the worker processes, ``factory`` must be picklable (a module-level function)
+    and its module should import all required PyRolL plugins.
+
+    :param factory: function creating a variant from keyword parameters
+    :param grid: mapping of parameter names to value sequences (expanded to their cartesian product)
+        or an iterable of parameter dicts
+    :param processes: number of worker processes, defaults to the CPU count, ``1`` solves in the current process
+    :param chunksize: number of variants sent to a worker at once, by default about four chunks per worker
+    :param initializer: callable run at start of each worker process
+    :param initargs: arguments of ``initializer``
+    :param cross_sections: whether to collect the bulged cross-sections in compact form,
+        see :py:attr:`SweepResult.cross_sections`
+    """
+    parameters = expand_grid(grid)
+    processes = processes or os.cpu_count() or 1
+    tasks = [(factory, p, cross_sections) for p in parameters]
+
+    if processes == 1 or len(tasks) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        results = [_solve_task(t) for t in tasks]
+    else:
+        chunksize = chunksize or max(1, len(tasks) // (processes * 4))
+        with ProcessPoolExecutor(max_workers=processes, initializer=initializer, initargs=initargs) as executor:
+            results = list(executor.map(_solve_task, tasks, chunksize=chunksize))
+
+    result = SweepResult(
+        parameters=parameters,
+        table=_table(results),
+        errors={v: error for v, (_, error) in enumerate(results) if error is not None},
+    )
+
+    if cross_sections:
+        result.cross_sections = [row[-1] for variant_rows, _ in results for row in variant_rows]
+        result.coordinates, _ = pack(result.cross_sections)
+
+    return result
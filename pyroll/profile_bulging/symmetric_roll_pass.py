@@ -1,259 +1,807 @@
+import copy
+import functools
 import math
 import logging
+import sys
+import warnings
 import numpy as np
+from typing import Optional
 
-from shapely import Point, intersection, unary_union
-from pyroll.core import Hook, Unit, Profile as BaseProfile, SymmetricRollPass
-from pyroll.core.roll_pass.hookimpls.helpers import out_cross_section, out_cross_section3
+from shapely import Point, clip_by_rect, intersection, intersects, unary_union
+from pyroll.core import Hook, Unit, PassSequence, Profile as BaseProfile, SymmetricRollPass
+
+from . import incremental, parameters, radius_models, registry, simplification, symmetry
+from .assembly import Curve, polygon_crossings
+from .cache import PassGeometry, cross_section_cache, pass_geometry_cache
+from .config import Config
+from .incremental import incremental_memo
+from .contour import Contour, Envelope, circle_intersections
+from .lazy import LazyBulgedCrossSection
+from .tessellation import quad_segs
 
 SymmetricRollPass.OutProfile.bulge_radius = Hook[float]()
+BaseProfile.bulged_contour = Hook[Contour]()
+BaseProfile.bulged_area = Hook[float]()
+BaseProfile.bulged_width = Hook[float]()
+BaseProfile.bulged_height = Hook[float]()
+BaseProfile.bulged_simplification_error = Hook[float]()
+BaseProfile.bulged_scalars_only = Hook[bool]()
+"""Whether the bulging step computed only ``bulged_area``, ``bulged_width`` and ``bulged_height`` of the profile,
+while its ``cross_section`` stays unbulged, like with :py:attr:`Config.SCALAR_ONLY` or on a hit of a surrogate table."""
+BaseProfile.bulge_radius_gradient = Hook[dict]()
+"""Derivatives of the bulge radius per variable name, set if :py:attr:`Config.SENSITIVITIES` is enabled."""
+BaseProfile.bulged_area_gradient = Hook[dict]()
+"""Derivatives of the bulged area per variable name, set if :py:attr:`Config.SENSITIVITIES` is enabled."""
+SymmetricRollPass.bulging = Hook[bool]()
+"""Whether to run the bulging post-processor for this roll pass, overrides the setting of enclosing sequences
+and :py:attr:`Config.OPT_IN`."""
+PassSequence.bulging = Hook[bool]()
+"""Whether to run the bulging post-processor for the roll passes in this sequence,
+overrides :py:attr:`Config.OPT_IN`."""
+PassSequence.bulging_scalar_only = Hook[bool]()
+"""Whether to compute only the scalar bulging results of the roll passes in this sequence,
+overrides :py:attr:`Config.SCALAR_ONLY`."""
+SymmetricRollPass.bulging_parameter_profile = Hook[str]()
+"""Name (or instance) of the parameter profile of the bulge radius models for this roll pass,
+overrides the setting of enclosing sequences and :py:attr:`Config.PARAMETER_PROFILE`."""
+PassSequence.bulging_parameter_profile = Hook[str]()
+"""Name (or instance) of the parameter profile of the bulge radius models for the roll passes in this sequence,
+overrides :py:attr:`Config.PARAMETER_PROFILE`."""
+
+
+@BaseProfile.bulged_area
+def bulged_area(self: BaseProfile):
+    return self.cross_section.area
+
+
+@BaseProfile.bulged_width
+def bulged_width(self: BaseProfile):
+    return self.width
+
+
+@BaseProfile.bulged_height
+def bulged_height(self: BaseProfile):
+    return self.height
+
+
+@BaseProfile.bulged_scalars_only
+def bulged_scalars_only(self: BaseProfile):
+    return False
+
+
+_RESULT_ATTRIBUTES = (
+    "bulge_radius", "cross_section", "bulged_contour", "bulged_area", "bulged_width", "bulged_height",
+    "bulged_simplification_error", "bulged_scalars_only", "bulge_radius_gradient", "bulged_area_gradient",
+)
+
+N_FOLD_HELPER_FACTORS = {
+    ("round", "flat"): 0.7,
+    ("flat", "flat"): None,
+    ("round", "oval"): 0.9,
+    ("round", "round"): 0.9,
+    ("oval", "oval"): 0.9,
+    ("oval", "round"): None,
+}
+"""
+Width factors of the helper cross-section united with the bulges in passes with three or more rolls
+per classifiers of the incoming profile and the roll pass in matching order.
+``None`` means the bulged cross-section is the intersection of the bulges with the unbulged one.
+
+Only three-roll passes are registered by default, since no bulge radius model is validated for more rolls.
+:py:meth:`BulgingModel.n_fold_bulged_cross_section` builds the cross-section for any number of rolls,
+so passes with more rolls are enabled by registering it together with a bulge radius model,
+see :py:func:`pyroll.profile_bulging.registry.register`.
+"""
+
+
+def unit_setting(unit: Optional[Unit], name: str):
+    """Value of the hook ``name`` explicitly set on ``unit`` or its nearest parent, ``None`` if set on none."""
+    while unit is not None:
+        if unit.has_set(name):
+            return getattr(unit, name)
+        unit = unit.parent
+
+    return None
+
+
+def _instrument(name: str):
+    """Call ``name`` of :py:mod:`pyroll.profile_bulging.instrumentation` if :py:attr:`Config.INSTRUMENTATION` is set."""
+    if Config.INSTRUMENTATION:
+        from . import instrumentation
+        getattr(instrumentation, name)()
+
+
+def _no_intersection(consequence: str):
+    logging.getLogger(__name__).info("No intersection point found. %s", consequence)
+    _instrument("count_no_intersection")
 
 
 class BulgingModel(Unit):
     def __init__(self, symmetric_roll_pass: SymmetricRollPass):
         self.symmetric_roll_pass = symmetric_roll_pass
         super().__init__(label=f"Bulging Model for {self.symmetric_roll_pass}")
+        self.model_pair = registry.resolve(
+            self.symmetric_roll_pass.in_profile.classifiers, self.symmetric_roll_pass.classifiers
+        )
+
+    @functools.cached_property
+    def parameter_profile(self) -> parameters.ParameterProfile:
+        """
+        Empirical constants of the bulge radius models, selected by ``bulging_parameter_profile`` of the roll pass
+        or an enclosing pass sequence or else by :py:attr:`Config.PARAMETER_PROFILE`.
+        """
+        return parameters.resolve(unit_setting(self.symmetric_roll_pass, "bulging_parameter_profile"))
 
     def two_roll_bulge_radius_round_oval_lee(self, profile: BaseProfile):
-
-        weight = (self.symmetric_roll_pass.roll.groove.usable_width - profile.width) / (
-                self.symmetric_roll_pass.roll.groove.usable_width - self.symmetric_roll_pass.in_profile.width)
-        usable_radius = (self.symmetric_roll_pass.roll.groove.r2 * self.symmetric_roll_pass.height - (
-                self.symmetric_roll_pass.roll.groove.usable_width ** 2 + self.symmetric_roll_pass.height ** 2) / 4) / (
-                                2 * self.symmetric_roll_pass.roll.groove.r2 - self.symmetric_roll_pass.roll.groove.usable_width)
-        return self.symmetric_roll_pass.in_profile.equivalent_radius * weight + usable_radius * (1 - weight)
-
+        return radius_models.two_roll_bulge_radius_round_oval_lee(
+            width=profile.width,
+            in_width=self.symmetric_roll_pass.in_profile.width,
+            in_equivalent_radius=self.symmetric_roll_pass.in_profile.equivalent_radius,
+            usable_width=self.symmetric_roll_pass.roll.groove.usable_width,
+            r2=self.symmetric_roll_pass.roll.groove.r2,
+            height=self.symmetric_roll_pass.height,
+            weight_factor=self.parameter_profile.lee_weight_factor
+        )
 
     def two_roll_bulge_radius_oval_round_lee(self, profile: BaseProfile):
-
-        weight = (self.symmetric_roll_pass.roll.groove.usable_width - profile.width) / (
-                self.symmetric_roll_pass.roll.groove.usable_width - self.symmetric_roll_pass.in_profile.width)
-        oval_radius = self.symmetric_roll_pass.prev_of(SymmetricRollPass).roll.groove.r2
-
-        if self.symmetric_roll_pass.height == 2 * self.symmetric_roll_pass.roll.groove.r2:
-            usable_radius = 2 * self.symmetric_roll_pass.roll.groove.r2
-        else:
-            usable_radius = self.symmetric_roll_pass.roll.groove.r2 + (
-                    self.symmetric_roll_pass.height - 2 * self.symmetric_roll_pass.roll.groove.r2)
-
-        return oval_radius * weight + usable_radius * (1 - weight)
+        return radius_models.two_roll_bulge_radius_oval_round_lee(
+            width=profile.width,
+            in_width=self.symmetric_roll_pass.in_profile.width,
+            usable_width=self.symmetric_roll_pass.roll.groove.usable_width,
+            r2=self.symmetric_roll_pass.roll.groove.r2,
+            height=self.symmetric_roll_pass.height,
+            oval_radius=self.symmetric_roll_pass.prev_of(SymmetricRollPass).roll.groove.r2,
+            weight_factor=self.parameter_profile.lee_weight_factor
+        )
 
     def two_roll_bulge_radius_model_schmidt(self, profile: BaseProfile):
-        return (
-                self.symmetric_roll_pass.height / 2 ** 2 + profile.width / 2 ** 2 - 2 * self.symmetric_roll_pass.roll.groove.r2 * self.symmetric_roll_pass.height / 2) / (
-                2 * (profile.width / 2 - self.symmetric_roll_pass.roll.groove.r2))
+        return radius_models.two_roll_bulge_radius_model_schmidt(
+            width=profile.width,
+            r2=self.symmetric_roll_pass.roll.groove.r2,
+            height=self.symmetric_roll_pass.height
+        )
 
     def three_roll_bulge_radius_round_round_and_oval_oval_byon(self, profile: BaseProfile):
-        return profile.width / 2
+        return radius_models.three_roll_bulge_radius_round_round_and_oval_oval_byon(width=profile.width)
 
     def three_roll_bulge_radius_round_oval_byon(self, profile: BaseProfile):
-        eccentricity = 3.133 * self.symmetric_roll_pass.displaced_cross_section.area / self.symmetric_roll_pass.in_profile.cross_section.area * self.symmetric_roll_pass.in_profile.width / 2
-        return np.abs(profile.width / 2 - eccentricity)
+        return radius_models.three_roll_bulge_radius_round_oval_byon(
+            width=profile.width,
+            in_width=self.symmetric_roll_pass.in_profile.width,
+            in_area=self.symmetric_roll_pass.in_profile.cross_section.area,
+            displaced_area=self.symmetric_roll_pass.displaced_cross_section.area,
+            eccentricity_factor=self.parameter_profile.byon_eccentricity_factor
+        )
 
     def three_roll_bulge_radius_oval_round_byon(self, profile: BaseProfile):
-        eccentricity = 3.133 * self.symmetric_roll_pass.displaced_cross_section.area / self.symmetric_roll_pass.in_profile.cross_section.area * self.symmetric_roll_pass.in_profile.width / 2
-        return self.symmetric_roll_pass.inscribed_circle_diameter / 2 + eccentricity
+        return radius_models.three_roll_bulge_radius_oval_round_byon(
+            in_width=self.symmetric_roll_pass.in_profile.width,
+            in_area=self.symmetric_roll_pass.in_profile.cross_section.area,
+            displaced_area=self.symmetric_roll_pass.displaced_cross_section.area,
+            inscribed_circle_diameter=self.symmetric_roll_pass.inscribed_circle_diameter,
+            eccentricity_factor=self.parameter_profile.byon_eccentricity_factor
+        )
 
     def three_roll_bulge_radius_model_min(self, profile: BaseProfile):
-        eccentricity = 2.40 * self.symmetric_roll_pass.displaced_cross_section.area / self.symmetric_roll_pass.in_profile.cross_section.area * self.symmetric_roll_pass.in_profile.width / 2
-        return np.abs(profile.width - eccentricity)
+        return radius_models.three_roll_bulge_radius_model_min(
+            width=profile.width,
+            in_width=self.symmetric_roll_pass.in_profile.width,
+            in_area=self.symmetric_roll_pass.in_profile.cross_section.area,
+            displaced_area=self.symmetric_roll_pass.displaced_cross_section.area,
+            eccentricity_factor=self.parameter_profile.min_eccentricity_factor
+        )
 
     def bulge_radius(self, profile: BaseProfile):
+        if self.model_pair is not None:
+            return self.model_pair.bulge_radius(self, profile)
+
+    def pass_geometry(self) -> PassGeometry:
+        """The cached helper geometries of the roll pass."""
+        return pass_geometry_cache.get(self.symmetric_roll_pass)
+
+    def _quadrant_circle(self, center: float, radius: float):
+        circle = Point(center, 0).buffer(radius, quad_segs=quad_segs(radius))
+        return symmetry.quadrant(circle)
+
+    @staticmethod
+    def _quadrant_strip(geometry: PassGeometry, half_width: float):
+        return geometry.clipped(
+            "quadrant", half_width, lambda: clip_by_rect(geometry.max_quadrant, 0, 0, half_width, math.inf)
+        )
+
+    def _mirrored(self, piece):
+        bulged_cross_section = symmetry.assemble_mirrored(piece)
+
+        if bulged_cross_section is None:
+            return unary_union(symmetry.mirrored_copies(piece))
+
+        return bulged_cross_section
 
-        if not "3fold" in self.symmetric_roll_pass.classifiers:
-            if "round" in self.symmetric_roll_pass.in_profile.classifiers and "oval" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulge_radius_round_oval_lee(profile)
-            elif "oval" in self.symmetric_roll_pass.in_profile.classifiers and "round" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulge_radius_oval_round_lee(profile)
-            elif "square" in self.symmetric_roll_pass.in_profile.classifiers and "diamond" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulge_radius_model_schmidt(profile)
-            elif "diamond" in self.symmetric_roll_pass.in_profile.classifiers and "square" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulge_radius_model_schmidt(profile)
-            elif "oval" in self.symmetric_roll_pass.in_profile.classifiers and "square" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulge_radius_model_schmidt(profile)
-            elif "square" in self.symmetric_roll_pass.in_profile.classifiers and "oval" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulge_radius_model_schmidt(profile)
-
-        elif "3fold" in self.symmetric_roll_pass.classifiers:
-            if "round" in self.symmetric_roll_pass.in_profile.classifiers and "round" in self.symmetric_roll_pass.classifiers:
-                return self.three_roll_bulge_radius_round_round_and_oval_oval_byon(profile)
-            elif "round" in self.symmetric_roll_pass.in_profile.classifiers and "flat" in self.symmetric_roll_pass.classifiers:
-                return self.three_roll_bulge_radius_model_min(profile)
-            elif "round" in self.symmetric_roll_pass.in_profile.classifiers and "oval" in self.symmetric_roll_pass.classifiers:
-                return self.three_roll_bulge_radius_round_oval_byon(profile)
-            elif "oval" in self.symmetric_roll_pass.in_profile.classifiers and "oval" in self.symmetric_roll_pass.classifiers:
-                return self.three_roll_bulge_radius_round_round_and_oval_oval_byon(profile)
-            elif "oval" in self.symmetric_roll_pass.in_profile.classifiers and "round" in self.symmetric_roll_pass.classifiers:
-                return self.three_roll_bulge_radius_oval_round_byon(profile)
-            elif "flat" in self.symmetric_roll_pass.in_profile.classifiers and "flat" in self.symmetric_roll_pass.classifiers:
-                return self.three_roll_bulge_radius_model_min(profile)
+    @staticmethod
+    def _assembled_quadrant(piece: Optional[Curve]):
+        arc = piece.quadrant_arc() if piece is not None else None
+        return symmetry.mirrored_ring(arc) if arc is not None else None
+
+    def _constructive_round_oval_round(self, profile: BaseProfile):
+        geometry = self.pass_geometry()
+        groove = geometry.quadrant_curve
+        if groove is None:
+            return None
+
+        radius = profile.bulge_radius
+        circle_center = profile.width / 2 - radius
+        segments = quad_segs(radius)
+        bounds = geometry.max_cross_section.bounds
+
+        # without crossings the boolean operations decide whether the contour and the circle touch
+        intersection_points = polygon_crossings(geometry.upper_boundary_coords, (circle_center, 0), radius, segments)
+        if len(intersection_points) == 0:
+            return None
+
+        if (radius * 2) > (abs(bounds[0]) + bounds[2]):
+            circle = Curve.circle(-abs(circle_center), radius, segments)
+            return self._assembled_quadrant(groove.minimum(circle))
+
+        first_intersection_point = intersection_points[np.argmin(np.abs(intersection_points[:, 1]))]
+        strip = groove.restrict(0, abs(first_intersection_point[0]))
+        if strip is None:
+            return None
+
+        # inside the first quadrant the union of the left and right circle is the one centered right
+        side = groove.minimum(Curve.circle(abs(circle_center), radius, segments))
+        return self._assembled_quadrant(strip.maximum(side) if side is not None else strip)
 
     def two_roll_bulged_cross_section_polygon_round_oval_round(self, profile: BaseProfile):
+        if Config.CONSTRUCTIVE_CROSS_SECTION:
+            bulged_cross_section = self._constructive_round_oval_round(profile)
+            if bulged_cross_section is not None:
+                return bulged_cross_section
+            _instrument("count_fallback")
+
         circle_center = profile.width / 2 - profile.bulge_radius
-        right_circle = Point(circle_center, 0).buffer(profile.bulge_radius)
-        left_circle = Point(-circle_center, 0).buffer(profile.bulge_radius)
-        max_cross_section = out_cross_section(self.symmetric_roll_pass, math.inf)
-        intersection_points = max_cross_section.boundary.intersection(right_circle.boundary)
+        right_circle = Point(circle_center, 0).buffer(profile.bulge_radius, quad_segs=quad_segs(profile.bulge_radius))
+        geometry = self.pass_geometry()
+        max_cross_section = geometry.max_cross_section
 
-        if intersection_points.is_empty:
-            logging.getLogger(__name__).info("No intersection point found. Continuing without bulging.")
+        if not intersects(geometry.max_boundary, right_circle.boundary):
+            _no_intersection("Continuing without bulging.")
             return None
 
-        elif (profile.bulge_radius * 2) > (
-                abs(max_cross_section.bounds[0]) + max_cross_section.bounds[2]):
-            circle_intersection = intersection(left_circle, right_circle)
-            return intersection(circle_intersection, max_cross_section)
+        # inside the first quadrant the intersection of the left and right circle is the one centered left
+        # and their union the one centered right
+        max_quadrant = geometry.max_quadrant
+
+        if (profile.bulge_radius * 2) > (abs(max_cross_section.bounds[0]) + max_cross_section.bounds[2]):
+            circle_intersection = self._quadrant_circle(-abs(circle_center), profile.bulge_radius)
+            return self._mirrored(intersection(circle_intersection, max_quadrant))
 
         else:
-            intersection_points = list(intersection_points.geoms)
+            intersection_points = geometry.max_boundary.intersection(right_circle.boundary)
+            intersection_points = list(getattr(intersection_points, "geoms", [intersection_points]))
             first_intersection_point = min(intersection_points, key=lambda point: abs(point.y))
-            cross_section_till_intersection = out_cross_section(self.symmetric_roll_pass,
-                                                                abs(first_intersection_point.x) * 2)
-            left_side_cross_section = intersection(max_cross_section, left_circle)
-            right_side_cross_section = intersection(max_cross_section, right_circle)
-            bulged_cross_section = unary_union(
-                [left_side_cross_section, cross_section_till_intersection, right_side_cross_section])
+            cross_section_till_intersection = self._quadrant_strip(geometry, abs(first_intersection_point.x))
+            side_cross_section = intersection(
+                max_quadrant, self._quadrant_circle(abs(circle_center), profile.bulge_radius)
+            )
+            return self._mirrored(unary_union([cross_section_till_intersection, side_cross_section]))
+
+    def _constructive_square(self, profile: BaseProfile, separation_point_z_coordinate, bulge_center,
+                             union_bulges: bool):
+        below_height = (2 * profile.bulge_radius) < self.symmetric_roll_pass.height
+        if below_height and not np.isfinite(separation_point_z_coordinate):
+            return None
+
+        groove = self.pass_geometry().quadrant_curve
+        if groove is None:
+            return None
 
-            return bulged_cross_section
+        segments = quad_segs(profile.bulge_radius)
 
-    def two_roll_bulged_cross_section_polygon_square_diamond_square(self, profile: BaseProfile):
+        if below_height:
+            bulge = Curve.circle(bulge_center, profile.bulge_radius, segments)
+            bulge = bulge.restrict(0, math.inf) if bulge is not None else None
+            strip = groove.restrict(0, abs(separation_point_z_coordinate))
+
+            if bulge is None or strip is None:
+                return None
+            return self._assembled_quadrant(strip.maximum(bulge))
+
+        bulge = Curve.circle(bulge_center if union_bulges else -bulge_center, profile.bulge_radius, segments)
+        strip = groove.restrict(0, profile.width / 2)
+        return self._assembled_quadrant(strip.minimum(bulge) if strip is not None else None)
 
+    def _two_roll_bulged_cross_section_polygon_square(self, profile: BaseProfile, union_bulges: bool):
         separation_point_angle = np.arcsin(
             (profile.width / 2 - profile.bulge_radius) / (
                     self.symmetric_roll_pass.roll.groove.r2 - profile.bulge_radius))
         separation_point_z_coordinate = self.symmetric_roll_pass.roll.groove.r2 * np.sin(separation_point_angle)
 
-        left_bulge = Point(
-            -profile.width / 2 + profile.bulge_radius,
-            0).buffer(profile.bulge_radius)
-        right_bulge = Point(
-            profile.width / 2 - profile.bulge_radius,
-            0).buffer(profile.bulge_radius)
-        intersection_cross_section = out_cross_section(self.symmetric_roll_pass,
-                                                       2 * np.abs(separation_point_z_coordinate))
+        # inside the first quadrant the union of the left and right bulge is the one centered right
+        # and their intersection the one centered left
+        bulge_center = abs(profile.width / 2 - profile.bulge_radius)
+
+        if Config.CONSTRUCTIVE_CROSS_SECTION:
+            bulged_cross_section = self._constructive_square(
+                profile, separation_point_z_coordinate, bulge_center, union_bulges
+            )
+            if bulged_cross_section is not None:
+                return bulged_cross_section
+            _instrument("count_fallback")
+
+        geometry = self.pass_geometry()
 
         if (2 * profile.bulge_radius) < self.symmetric_roll_pass.height:
-            bulged_cross_section = unary_union([left_bulge, intersection_cross_section, right_bulge])
-            return bulged_cross_section
+            if not np.isfinite(separation_point_z_coordinate):
+                _no_intersection("Continuing with the bulges only.")
+
+            bulge = self._quadrant_circle(bulge_center, profile.bulge_radius)
+            intersection_cross_section = self._quadrant_strip(geometry, np.abs(separation_point_z_coordinate))
+            return self._mirrored(unary_union([bulge, intersection_cross_section]))
 
         else:
-            helper_cs = out_cross_section(self.symmetric_roll_pass, profile.width)
-            left_bulge_with_intersection = left_bulge.intersection(helper_cs)
-            right_bulge_with_intersection = right_bulge.intersection(helper_cs)
-            bulged_cross_section = unary_union([left_bulge_with_intersection, right_bulge_with_intersection])
-            return bulged_cross_section
+            bulge = self._quadrant_circle(bulge_center if union_bulges else -bulge_center, profile.bulge_radius)
+            helper_cs = self._quadrant_strip(geometry, profile.width / 2)
+            return self._mirrored(intersection(bulge, helper_cs))
+
+    def two_roll_bulged_cross_section_polygon_square_diamond_square(self, profile: BaseProfile):
+        return self._two_roll_bulged_cross_section_polygon_square(profile, union_bulges=True)
 
     def two_roll_bulged_cross_section_polygon_square_oval_square(self, profile: BaseProfile):
+        return self._two_roll_bulged_cross_section_polygon_square(profile, union_bulges=False)
+
+    def n_fold_classifiers(self):
+        """
+        Get the key into :py:data:`N_FOLD_HELPER_FACTORS` matching the classifiers of the incoming profile
+        and the roll pass, ``None`` if none matches.
+        """
+        in_profile = self.symmetric_roll_pass.in_profile
+
+        for in_classifier, pass_classifier in N_FOLD_HELPER_FACTORS:
+            if in_classifier in in_profile.classifiers and pass_classifier in self.symmetric_roll_pass.classifiers:
+                return in_classifier, pass_classifier
+
+        return None
+
+    def _sector_helper(self, fold: int, start_angle: float, width: float):
+        geometry = self.pass_geometry()
+
+        def build():
+            extent = 2 * np.max(np.abs(geometry.max_cross_section.bounds))
+            return intersection(
+                geometry.max_cross_section, symmetry.sector(fold, start_angle, extent, depth=width / 2)
+            )
+
+        return geometry.clipped(("sector", fold, start_angle), width, build)
+
+    def n_fold_bulged_cross_section(self, profile: BaseProfile):
+        key = self.n_fold_classifiers()
+        if key is None:
+            return profile.cross_section
+
+        helper_factor = N_FOLD_HELPER_FACTORS[key]
+        fold = registry.fold_count(self.symmetric_roll_pass.classifiers)
+        start_angle = symmetry.gap_angle(fold)
+        offset_distance = profile.width / 2 - profile.bulge_radius
+
+        bounds = profile.cross_section.bounds
+        extent = 2 * max(np.max(np.abs(bounds)), profile.width, profile.bulge_radius)
+        cross_section = intersection(profile.cross_section, symmetry.sector(fold, start_angle, extent))
+
+        # inside the sector of the first gap the union of all bulges equals the first bulge for positive offsets,
+        # the intersection of all bulges for negative ones, as long as the bulges contain the origin
+        contain_origin = abs(offset_distance) < profile.bulge_radius
+        if contain_origin and (offset_distance >= 0) == (helper_factor is not None):
+            centers = symmetry.directions(fold, start_angle)[:1]
+        else:
+            centers = symmetry.directions(fold, start_angle)
+
+        bulges = [
+            Point(*(offset_distance * center)).buffer(profile.bulge_radius, quad_segs=quad_segs(profile.bulge_radius))
+            for center in centers
+        ]
+
+        if helper_factor is None:
+            piece = cross_section
+            for bulge in bulges:
+                piece = intersection(piece, bulge)
+        else:
+            helper_cs = self._sector_helper(fold, start_angle, profile.width * helper_factor)
+            piece = unary_union([helper_cs] + [intersection(cross_section, bulge) for bulge in bulges])
+
+        if piece.is_empty:
+            _no_intersection("Continuing with an empty cross-section.")
+            return piece
+
+        bulged_cross_section = symmetry.assemble(piece, fold, start_angle)
+
+        if bulged_cross_section is None:
+            bulged_cross_section = unary_union(symmetry.rotated_copies(piece, fold))
+
+        return bulged_cross_section
+
+    def three_roll_pass_bulged_cross_section(self, profile: BaseProfile):
+        return self.n_fold_bulged_cross_section(profile)
+
+    def cross_section(self, profile: BaseProfile):
+        if self.model_pair is not None:
+            return self.model_pair.cross_section(self, profile)
+        return profile.cross_section
+
+    def upper_contour_coords(self):
+        return self.pass_geometry().upper_contour_coords
+
+    def max_envelope(self):
+        """Polar envelope of the cross-section enclosed by the contour lines of the roll pass."""
+        return self.pass_geometry().max_envelope
+
+    def groove_envelope(self):
+        return self.pass_geometry().groove_envelope
+
+    def two_roll_bulged_contour_round_oval_round(self, profile: BaseProfile):
+        upper_contour = self.upper_contour_coords()
+        groove = Envelope.from_line(upper_contour)
+        if groove is None:
+            return None
+
+        circle_center = profile.width / 2 - profile.bulge_radius
+        right_circle = Envelope.circle((circle_center, 0), profile.bulge_radius, polar=False)
+        left_circle = Envelope.circle((-circle_center, 0), profile.bulge_radius, polar=False)
+        max_contour = np.concatenate([upper_contour, upper_contour[::-1] * [1, -1], upper_contour[:1]])
+        intersection_points = circle_intersections(max_contour, (circle_center, 0), profile.bulge_radius)
+
+        if len(intersection_points) == 0:
+            return None
+
+        elif (profile.bulge_radius * 2) > (upper_contour[-1, 0] - upper_contour[0, 0]):
+            return groove.minimum(left_circle, right_circle).to_contour()
+
+        else:
+            first_intersection_point = min(intersection_points, key=lambda point: abs(point[1]))
+            strip = Envelope.strip(abs(first_intersection_point[0]))
+            return groove.minimum(strip.maximum(left_circle, right_circle)).to_contour()
+
+    def _two_roll_bulged_contour_square(self, profile: BaseProfile, union_bulges: bool):
+        groove = self.groove_envelope()
+        if groove is None:
+            return None
 
         separation_point_angle = np.arcsin(
             (profile.width / 2 - profile.bulge_radius) / (
                     self.symmetric_roll_pass.roll.groove.r2 - profile.bulge_radius))
         separation_point_z_coordinate = self.symmetric_roll_pass.roll.groove.r2 * np.sin(separation_point_angle)
 
-        left_bulge = Point(
-            -profile.width / 2 + profile.bulge_radius,
-            0).buffer(profile.bulge_radius)
-        right_bulge = Point(
-            profile.width / 2 - profile.bulge_radius,
-            0).buffer(profile.bulge_radius)
-        intersection_cross_section = out_cross_section(self.symmetric_roll_pass,
-                                                       2 * np.abs(separation_point_z_coordinate))
+        left_bulge = Envelope.circle((-profile.width / 2 + profile.bulge_radius, 0), profile.bulge_radius, polar=False)
+        right_bulge = Envelope.circle((profile.width / 2 - profile.bulge_radius, 0), profile.bulge_radius, polar=False)
 
         if (2 * profile.bulge_radius) < self.symmetric_roll_pass.height:
-            bulged_cross_section = unary_union([left_bulge, intersection_cross_section, right_bulge])
-            return bulged_cross_section
+            if not np.isfinite(separation_point_z_coordinate):
+                return None
 
-        else:
-            helper_cs = out_cross_section(self.symmetric_roll_pass, profile.width)
-            left_bulge_with_intersection = left_bulge.intersection(helper_cs)
-            right_bulge_with_intersection = right_bulge.intersection(helper_cs)
-            bulged_cross_section = left_bulge_with_intersection.intersection(right_bulge_with_intersection)
-            return bulged_cross_section
+            intersection_cross_section = groove.minimum(Envelope.strip(np.abs(separation_point_z_coordinate)))
+            return intersection_cross_section.maximum(left_bulge, right_bulge).to_contour()
 
-    def three_roll_pass_bulged_cross_section(self, profile: BaseProfile):
-        in_profile = self.symmetric_roll_pass.in_profile
+        helper_cs = groove.minimum(Envelope.strip(profile.width / 2))
+
+        if union_bulges:
+            return helper_cs.minimum(left_bulge.maximum(right_bulge)).to_contour()
+        return helper_cs.minimum(left_bulge, right_bulge).to_contour()
+
+    def two_roll_bulged_contour_square_diamond_square(self, profile: BaseProfile):
+        return self._two_roll_bulged_contour_square(profile, union_bulges=True)
+
+    def two_roll_bulged_contour_square_oval_square(self, profile: BaseProfile):
+        return self._two_roll_bulged_contour_square(profile, union_bulges=False)
+
+    def three_roll_pass_bulged_contour(self, profile: BaseProfile):
+        cross_section = Envelope.from_polygon(profile.cross_section)
 
         offset_distance = profile.width / 2 - profile.bulge_radius
+        bulges = [
+            Envelope.circle(tuple(offset_distance * center), profile.bulge_radius, polar=True)
+            for center in symmetry.directions(3, symmetry.gap_angle(3))
+        ]
+
+        if cross_section is None or any(b is None for b in bulges):
+            return None
+
+        key = self.n_fold_classifiers()
+        if key is None:
+            return None
+
+        helper_factor = N_FOLD_HELPER_FACTORS[key]
+
+        if helper_factor is None:
+            return cross_section.minimum(*bulges).to_contour()
 
-        x_offset_lower_right = offset_distance * np.cos(np.deg2rad(-30))
-        y_offset_lower_right = offset_distance * np.sin(np.deg2rad(-30))
-
-        x_offset_lower_left = offset_distance * np.cos(np.deg2rad(210))
-        y_offset_lower_left = offset_distance * np.sin(np.deg2rad(210))
-
-        upper_bulge = Point(0,
-                            profile.width / 2 - profile.bulge_radius).buffer(
-            profile.bulge_radius)
-        lower_right_bulge = Point(x_offset_lower_right, y_offset_lower_right).buffer(
-            profile.bulge_radius)
-        lower_left_bulge = Point(x_offset_lower_left, y_offset_lower_left).buffer(
-            profile.bulge_radius)
-
-        upper_with_bulge = profile.cross_section.intersection(upper_bulge)
-        lower_left_with_bulge = profile.cross_section.intersection(lower_left_bulge)
-        lower_right_with_bulge = profile.cross_section.intersection(lower_right_bulge)
-
-        if "round" in in_profile.classifiers and "flat" in self.symmetric_roll_pass.classifiers:
-            intermediate_cs = out_cross_section3(self.symmetric_roll_pass,
-                                                 profile.width * 0.7)
-            bulged_cross_section = unary_union(
-                [intermediate_cs, upper_with_bulge, lower_left_with_bulge, lower_right_with_bulge])
-
-        elif "flat" in in_profile.classifiers and "flat" in self.symmetric_roll_pass.classifiers:
-            intermediate_cs = upper_with_bulge.intersection(lower_left_with_bulge)
-            bulged_cross_section = intermediate_cs.intersection(lower_right_with_bulge)
-
-        elif "round" in in_profile.classifiers and "oval" in self.symmetric_roll_pass.classifiers:
-            helper_cs = out_cross_section3(self.symmetric_roll_pass, profile.width * 0.9)
-            bulged_cross_section = unary_union(
-                [helper_cs, upper_with_bulge, lower_left_with_bulge, lower_right_with_bulge])
-
-        elif "round" in in_profile.classifiers and "round" in self.symmetric_roll_pass.classifiers:
-            helper_cs = out_cross_section3(self.symmetric_roll_pass, profile.width * 0.9)
-            bulged_cross_section = unary_union(
-                [helper_cs, upper_with_bulge, lower_left_with_bulge, lower_right_with_bulge])
-
-        elif "oval" in in_profile.classifiers and "oval" in self.symmetric_roll_pass.classifiers:
-            helper_cs = out_cross_section3(self.symmetric_roll_pass, profile.width * 0.9)
-            bulged_cross_section = unary_union(
-                [helper_cs, upper_with_bulge, lower_left_with_bulge, lower_right_with_bulge])
-
-        elif "oval" in in_profile.classifiers and "round" in self.symmetric_roll_pass.classifiers:
-            intermediate_cs = upper_with_bulge.intersection(lower_left_with_bulge)
-            bulged_cross_section = intermediate_cs.intersection(lower_right_with_bulge)
+        max_envelope = self.max_envelope()
+        if max_envelope is None:
+            return None
+
+        width = profile.width * helper_factor
+        helper_cs = self.pass_geometry().clipped("helper_envelope", width, lambda: max_envelope.minimum(*[
+            Envelope.half_plane(math.atan2(center[1], center[0]), width / 2)
+            for center in symmetry.directions(3, symmetry.gap_angle(3))
+        ]))
+
+        return helper_cs.maximum(cross_section.minimum(bulges[0].maximum(*bulges[1:]))).to_contour()
+
+    def bulged_contour(self, profile: BaseProfile):
+        if self.model_pair is not None and self.model_pair.contour is not None:
+            return self.model_pair.contour(self, profile)
+
+    def bulged_cross_section(self, profile: BaseProfile):
+        if Config.ANALYTIC_CROSS_SECTION:
+            contour = self.bulged_contour(profile=profile)
+
+            if contour is not None:
+                return contour.to_polygon(max_chord_deviation=Config.MAX_CHORD_DEVIATION), contour
+
+        return self.cross_section(profile=profile), None
+
+    def output_cross_section(self, profile: BaseProfile):
+        """
+        Build the bulged cross-section and simplify it according to :py:attr:`Config.OUTPUT_VERTEX_BUDGET`
+        and :py:attr:`Config.OUTPUT_MAX_AREA_ERROR`.
+
+        :return: tuple of the cross-section, the analytic contour (if available) and the relative area error
+            of the simplification
+        """
+        cross_section, contour = self.bulged_cross_section(profile=profile)
+        cross_section, error = simplification.simplify(
+            cross_section, registry.fold_count(self.symmetric_roll_pass.classifiers),
+            vertex_budget=Config.OUTPUT_VERTEX_BUDGET, max_area_error=Config.OUTPUT_MAX_AREA_ERROR
+        )
+        return cross_section, contour, error
+
+    def compact_output_cross_section(self, profile: BaseProfile):
+        """
+        Like :py:meth:`output_cross_section`, but with the cross-section as
+        :py:class:`pyroll.profile_bulging.compact.CompactCrossSection` where it is reproduced by its outer arc.
+        """
+        from .compact import CompactCrossSection
+
+        cross_section, contour, error = self.output_cross_section(profile=profile)
+
+        if self.model_pair is None:
+            branch = None
+        elif contour is not None:
+            branch = self.model_pair.contour.__name__
         else:
-            bulged_cross_section = profile.cross_section
-        return bulged_cross_section
+            branch = self.model_pair.cross_section.__name__
+
+        compact = CompactCrossSection.from_polygon(
+            cross_section, registry.fold_count(self.symmetric_roll_pass.classifiers), profile.bulge_radius, branch,
+            dtype=Config.COMPACT_CROSS_SECTION_DTYPE
+        )
+        return compact if compact is not None else cross_section, contour, error
+
+    def enabled(self) -> bool:
+        """
+        Whether bulging is enabled for the roll pass by its ``bulging`` attribute, the one of an enclosing
+        pass sequence or, if none is set, by :py:attr:`Config.OPT_IN`.
+        """
+        value = unit_setting(self.symmetric_roll_pass, "bulging")
+        return not Config.OPT_IN if value is None else value
 
-    def cross_section(self, profile: BaseProfile):
+    def solve(self, in_profile: BaseProfile) -> BaseProfile:
+        if not self.enabled():
+            return in_profile
+
+        roll_pass = self.symmetric_roll_pass
+        if roll_pass.in_profile.bulged_scalars_only:
+            warnings.warn(
+                f"Roll pass '{roll_pass.label}' was solved with the unbulged cross-section of a profile bulged with "
+                f"scalar results only, restrict scalar-only bulging to the last roll pass to avoid this.",
+                stacklevel=2,
+            )
+
+        # optional modules are imported on first use to keep the import of the plugin light
+        if Config.INSTRUMENTATION:
+            from . import instrumentation
+            out_profile = instrumentation.instrumented_solve(self, in_profile)
+        else:
+            out_profile = self._solve(in_profile)
+
+        # sinks can only be active once the export module was imported by the user
+        export = sys.modules.get(f"{__package__}.export")
+        if export is not None and export.active():
+            export.emit(self.symmetric_roll_pass, out_profile)
+
+        return out_profile
+
+    def scalar_only(self) -> bool:
+        """
+        Whether to compute only the scalar results, either set as ``bulging_scalar_only`` on an enclosing
+        pass sequence or by :py:attr:`Config.SCALAR_ONLY`.
+        """
+        value = unit_setting(self.symmetric_roll_pass.parent, "bulging_scalar_only")
+        return Config.SCALAR_ONLY if value is None else value
+
+    def _solve(self, in_profile: BaseProfile) -> BaseProfile:
+        # PyRolL copies the incoming profile of a roll pass to the outgoing one, including the results of the
+        # bulging step of preceding passes
+        for name in _RESULT_ATTRIBUTES:
+            if name != "cross_section":
+                in_profile.__dict__.pop(name, None)
+
+        if not Config.INCREMENTAL_SOLVE:
+            return self._bulge(in_profile)
+
+        current_inputs = incremental.inputs(self, in_profile)
+        previous = incremental_memo.lookup(self.symmetric_roll_pass, current_inputs)
+
+        if previous is not None:
+            in_profile.__dict__.update(previous)
+            return in_profile
+
+        self._bulge(in_profile)
+        incremental_memo.store(
+            self.symmetric_roll_pass, current_inputs,
+            {name: in_profile.__dict__[name] for name in _RESULT_ATTRIBUTES if name in in_profile.__dict__}
+        )
+        return in_profile
 
-        if not "3fold" in self.symmetric_roll_pass.classifiers:
-            if "square" in self.symmetric_roll_pass.in_profile.classifiers and "diamond" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulged_cross_section_polygon_square_diamond_square(profile)
+    def _bulge_scalars(self, in_profile: BaseProfile) -> BaseProfile:
+        contour = self.bulged_contour(profile=in_profile)
+        in_profile.bulged_contour = contour
+        in_profile.bulged_scalars_only = True
 
-            elif "diamond" in self.symmetric_roll_pass.in_profile.classifiers and "square" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulged_cross_section_polygon_square_diamond_square(profile)
+        if contour is None:
+            return in_profile
 
-            elif "round" in self.symmetric_roll_pass.in_profile.classifiers and "oval" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulged_cross_section_polygon_round_oval_round(profile)
+        min_x, min_y, max_x, max_y = contour.bounds
+        in_profile.bulged_area = contour.area
 
-            elif "oval" in self.symmetric_roll_pass.in_profile.classifiers and "round" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulged_cross_section_polygon_round_oval_round(profile)
+        if "3fold" in in_profile.classifiers:
+            centroid_y = contour.centroid[1]
+            in_profile.bulged_width = (max_y - centroid_y) * 2
+            in_profile.bulged_height = (centroid_y - min_y) * 2
+        else:
+            in_profile.bulged_width = max_x - min_x
+            in_profile.bulged_height = max_y - min_y
 
-            elif "square" in self.symmetric_roll_pass.in_profile.classifiers and "oval" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulged_cross_section_polygon_square_oval_square(profile)
+        return in_profile
 
-            elif "oval" in self.symmetric_roll_pass.in_profile.classifiers and "square" in self.symmetric_roll_pass.classifiers:
-                return self.two_roll_bulged_cross_section_polygon_square_oval_square(profile)
-            else:
-                return profile.cross_section
-        elif "3fold" in self.symmetric_roll_pass.classifiers:
-            return self.three_roll_pass_bulged_cross_section(profile)
+    def _bulge_surrogate(self, in_profile: BaseProfile) -> bool:
+        from .surrogate import surrogate_tables
+        table = surrogate_tables.find(self)
+        if table is None:
+            return False
+
+        values = table.lookup(in_profile.width, in_profile.bulge_radius)
+        if not all(np.isfinite(v) for v in values.values()):
+            return False
+
+        in_profile.bulged_area = float(values["area"])
+        in_profile.bulged_width = float(values["width"])
+        in_profile.bulged_height = float(values["height"])
+        in_profile.bulged_scalars_only = True
+        return True
+
+    def sensitivities(self, profile: BaseProfile):
+        """
+        Bulge radius and bulged area of the unbulged ``profile`` with their derivatives,
+        see :py:func:`pyroll.profile_bulging.sensitivities.sensitivities`.
+        """
+        from . import sensitivities
+        return sensitivities.sensitivities(self, profile)
+
+    def _bulge(self, in_profile: BaseProfile) -> BaseProfile:
+        if Config.SENSITIVITIES:
+            result = self.sensitivities(copy.copy(in_profile))
+            in_profile.bulge_radius_gradient = result.bulge_radius_gradient
+            in_profile.bulged_area_gradient = result.bulged_area_gradient
 
-    def solve(self, in_profile: BaseProfile) -> BaseProfile:
         in_profile.bulge_radius = self.bulge_radius(profile=in_profile)
-        in_profile.cross_section = self.cross_section(profile=in_profile)
+
+        if Config.SURROGATE and self._bulge_surrogate(in_profile):
+            return in_profile
+
+        if self.scalar_only():
+            return self._bulge_scalars(in_profile)
+
+        key = cross_section_cache.key(self.symmetric_roll_pass, in_profile)
+        simplify = Config.OUTPUT_VERTEX_BUDGET > 0 or Config.OUTPUT_MAX_AREA_ERROR > 0
+        # compacting inside the cached build shares the coordinates between profiles hitting the same entry
+        build = self.compact_output_cross_section if Config.COMPACT_CROSS_SECTION else self.output_cross_section
+
+        if Config.LAZY_CROSS_SECTION:
+            unbulged_profile = copy.copy(in_profile)
+            lazy = LazyBulgedCrossSection(
+                lambda: cross_section_cache.get_or_build(key, lambda: build(unbulged_profile))[0]
+            )
+            in_profile.bulged_contour = lazy.contour
+            in_profile.cross_section = lazy
+
+            if simplify:
+                in_profile.bulged_simplification_error = lazy.simplification_error
+            return in_profile
+
+        (cross_section, contour, error), hit = cross_section_cache.get_or_build(key, lambda: build(in_profile))
+        if hit:
+            _instrument("count_cache_hit")
+
+        in_profile.bulged_contour = contour
+        in_profile.cross_section = cross_section
+
+        if simplify:
+            in_profile.bulged_simplification_error = error
         return in_profile
 
 
+registry.register(
+    "round", "oval", 2,
+    BulgingModel.two_roll_bulge_radius_round_oval_lee,
+    BulgingModel.two_roll_bulged_cross_section_polygon_round_oval_round,
+    BulgingModel.two_roll_bulged_contour_round_oval_round
+)
+registry.register(
+    "oval", "round", 2,
+    BulgingModel.two_roll_bulge_radius_oval_round_lee,
+    BulgingModel.two_roll_bulged_cross_section_polygon_round_oval_round,
+    BulgingModel.two_roll_bulged_contour_round_oval_round
+)
+registry.register(
+    "square", "diamond", 2,
+    BulgingModel.two_roll_bulge_radius_model_schmidt,
+    BulgingModel.two_roll_bulged_cross_section_polygon_square_diamond_square,
+    BulgingModel.two_roll_bulged_contour_square_diamond_square
+)
+registry.register(
+    "diamond", "square", 2,
+    BulgingModel.two_roll_bulge_radius_model_schmidt,
+    BulgingModel.two_roll_bulged_cross_section_polygon_square_diamond_square,
+    BulgingModel.two_roll_bulged_contour_square_diamond_square
+)
+registry.register(
+    "oval", "square", 2,
+    BulgingModel.two_roll_bulge_radius_model_schmidt,
+    BulgingModel.two_roll_bulged_cross_section_polygon_square_oval_square,
+    BulgingModel.two_roll_bulged_contour_square_oval_square
+)
+registry.register(
+    "square", "oval", 2,
+    BulgingModel.two_roll_bulge_radius_model_schmidt,
+    BulgingModel.two_roll_bulged_cross_section_polygon_square_oval_square,
+    BulgingModel.two_roll_bulged_contour_square_oval_square
+)
+
+registry.register(
+    "round", "round", 3,
+    BulgingModel.three_roll_bulge_radius_round_round_and_oval_oval_byon,
+    BulgingModel.three_roll_pass_bulged_cross_section,
+    BulgingModel.three_roll_pass_bulged_contour
+)
+registry.register(
+    "round", "flat", 3,
+    BulgingModel.three_roll_bulge_radius_model_min,
+    BulgingModel.three_roll_pass_bulged_cross_section,
+    BulgingModel.three_roll_pass_bulged_contour
+)
+registry.register(
+    "round", "oval", 3,
+    BulgingModel.three_roll_bulge_radius_round_oval_byon,
+    BulgingModel.three_roll_pass_bulged_cross_section,
+    BulgingModel.three_roll_pass_bulged_contour
+)
+registry.register(
+    "oval", "oval", 3,
+    BulgingModel.three_roll_bulge_radius_round_round_and_oval_oval_byon,
+    BulgingModel.three_roll_pass_bulged_cross_section,
+    BulgingModel.three_roll_pass_bulged_contour
+)
+registry.register(
+    "oval", "round", 3,
+    BulgingModel.three_roll_bulge_radius_oval_round_byon,
+    BulgingModel.three_roll_pass_bulged_cross_section,
+    BulgingModel.three_roll_pass_bulged_contour
+)
+registry.register(
+    "flat", "flat", 3,
+    BulgingModel.three_roll_bulge_radius_model_min,
+    BulgingModel.three_roll_pass_bulged_cross_section,
+    BulgingModel.three_roll_pass_bulged_contour
+)
+
+
 SymmetricRollPass.post_processors.append(BulgingModel)
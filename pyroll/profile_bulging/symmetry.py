@@ -0,0 +1,240 @@
+import functools
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+import shapely
+from shapely import Polygon
+from shapely.geometry.polygon import orient
+
+
+def gap_angle(fold: int) -> float:
+    """
+    Direction in degrees of the first roll gap of a roll pass with ``fold`` rolls,
+    assuming one roll at the bottom like in the roll passes of PyRolL core.
+    """
+    return (270 + 180 / fold) % (360 / fold)
+
+
+@functools.lru_cache(maxsize=None)
+def directions(fold: int, start_angle: float) -> np.ndarray:
+    """Unit vectors pointing into the ``fold`` roll gaps, starting at ``start_angle`` in degrees (read-only)."""
+    angles = np.deg2rad(start_angle) + np.arange(fold) * (2 * np.pi / fold)
+    result = np.column_stack([np.cos(angles), np.sin(angles)])
+    result.flags.writeable = False
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _rotation_matrices(fold: int) -> np.ndarray:
+    angles = np.arange(fold) * (2 * np.pi / fold)
+    cos, sin = np.cos(angles), np.sin(angles)
+    result = np.stack([np.stack([cos, sin], axis=-1), np.stack([-sin, cos], axis=-1)], axis=1)
+    result.flags.writeable = False
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _sector_outline(fold: int, start_angle: float) -> np.ndarray:
+    half_angle = math.pi / fold
+    center = math.radians(start_angle)
+    steps = max(2, math.ceil(2 * half_angle / (math.pi / 4)))
+    angles = np.linspace(center - half_angle, center + half_angle, steps + 1)
+    result = np.concatenate([[(0, 0)], np.column_stack([np.cos(angles), np.sin(angles)])])
+    result.flags.writeable = False
+    return result
+
+
+def sector(fold: int, start_angle: float, radius: float, depth: Optional[float] = None) -> Polygon:
+    """
+    Wedge of the opening angle ``360° / fold`` centered around ``start_angle`` in degrees,
+    covering at least a circle of ``radius`` around the origin.
+
+    :param depth: if given, the wedge is truncated at this distance from the origin in direction of ``start_angle``
+    """
+    center = math.radians(start_angle)
+    reach = radius / math.cos(math.pi / 4 / 2)
+    coords = _sector_outline(fold, start_angle) * reach
+
+    if depth is None:
+        return Polygon(coords)
+
+    direction = np.array([math.cos(center), math.sin(center)])
+    normal = np.array([-direction[1], direction[0]])
+    half_plane = Polygon([
+        depth * direction - 2 * reach * normal,
+        depth * direction + 2 * reach * normal,
+        -2 * reach * direction + 2 * reach * normal,
+        -2 * reach * direction - 2 * reach * normal,
+    ])
+    return shapely.intersection(Polygon(coords), half_plane)
+
+
+def sectors(fold: int, start_angle: float, radii) -> np.ndarray:
+    """Vectorized :py:func:`sector` without truncation for an array of ``radii``."""
+    reach = np.asarray(radii, dtype=float) / math.cos(math.pi / 4 / 2)
+    return shapely.polygons(_sector_outline(fold, start_angle) * reach[:, np.newaxis, np.newaxis])
+
+
+def rotated_copies(geometry, fold: int) -> list:
+    """The ``fold`` copies of ``geometry`` rotated by multiples of ``360° / fold`` around the origin."""
+    return [
+        shapely.transform(geometry, lambda coords, m=m: coords @ m)
+        for m in _rotation_matrices(fold)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _edge_projections(fold: int, start_angle: float) -> np.ndarray:
+    half_angle = math.pi / fold
+    center = math.radians(start_angle)
+    (x0, y0), (x1, y1) = [(math.cos(a), math.sin(a)) for a in (center - half_angle, center + half_angle)]
+    result = np.array([[x0, x1, -y0, -y1], [y0, y1, x0, x1]])
+    result.flags.writeable = False
+    return result
+
+
+def outer_arc(piece, fold: int, start_angle: float, rtol: float = 1e-9) -> Optional[np.ndarray]:
+    """
+    Coordinates of the boundary of ``piece`` not lying on the edges of the :py:func:`sector`,
+    ``None`` if ambiguous.
+    """
+    if not isinstance(piece, Polygon) or piece.is_empty or piece.interiors:
+        return None
+
+    coords = shapely.get_coordinates(orient(piece, 1.0).exterior)[:-1]
+    tolerance = rtol * np.abs(coords).max()
+
+    # dot and cross products with the unit vectors along both sector edges
+    projections = coords @ _edge_projections(fold, start_angle)
+    on_edge = (np.abs(projections[:, 2:]) <= tolerance) & (projections[:, :2] >= -tolerance)
+    at_origin = on_edge[:, 0] & on_edge[:, 1]
+
+    following = np.concatenate([on_edge[1:], on_edge[:1]])
+    if fold == 2:  # both edges lie on the same straight line
+        cut = np.any(on_edge, axis=1) & np.any(following, axis=1)
+    else:
+        cut = np.any(on_edge & following, axis=1)
+
+    starts = np.flatnonzero(~cut[1:] & cut[:-1]) + 1
+    if not cut[0] and cut[-1]:
+        starts = np.append(starts, 0)
+    if len(starts) != 1:
+        return None
+
+    order = (np.arange(len(coords)) + starts[0]) % len(coords)
+    indices = order[:np.argmax(cut[order]) + 1]
+
+    if not (on_edge[indices[0], 0] and on_edge[indices[-1], 1]) or at_origin[indices[0]] or at_origin[indices[-1]]:
+        return None
+
+    return coords[indices]
+
+
+def assemble(piece, fold: int, start_angle: float, rtol: float = 1e-9) -> Optional[Polygon]:
+    """
+    Assemble a ``fold``-fold rotationally symmetric polygon from its ``piece`` inside of the :py:func:`sector`
+    around ``start_angle``.
+
+    The outer arc of the piece, running from one sector edge to the other, is rotated ``fold`` times and
+    the copies are joined to a single ring, which avoids any boolean operation.
+
+    :return: the assembled polygon or ``None`` if the piece is not a single polygon bounded by a single arc,
+        or the result is invalid
+    """
+    arc = outer_arc(piece, fold, start_angle, rtol)
+    if arc is None:
+        return None
+
+    return rotated_ring(arc, fold)
+
+
+def rotated_ring(arc: np.ndarray, fold: int) -> Optional[Polygon]:
+    """
+    Polygon made of ``fold`` rotated copies of ``arc`` running counter-clockwise from one sector edge to the other,
+    ``None`` if it is invalid.
+    """
+    result = Polygon(rotated_coords(arc, fold))
+
+    if not result.is_valid:
+        return None
+
+    return result
+
+
+_QUADRANT_MIRRORS = np.array([[1, 1], [-1, 1], [-1, -1], [1, -1]])
+
+
+def quadrant(geometry):
+    """Clip ``geometry`` to the first quadrant."""
+    return shapely.clip_by_rect(geometry, 0, 0, math.inf, math.inf)
+
+
+def mirrored_copies(geometry) -> list:
+    """The four copies of ``geometry`` mirrored at none, one and both axes."""
+    return [shapely.transform(geometry, lambda coords, m=m: coords * m) for m in _QUADRANT_MIRRORS]
+
+
+def assemble_mirrored(piece, rtol: float = 1e-9) -> Optional[Polygon]:
+    """
+    Assemble a polygon symmetric to both axes from its ``piece`` inside the first quadrant
+    by mirroring the outer arc of the piece, running from the x-axis to the y-axis.
+
+    :return: the assembled polygon or ``None`` if the piece is not a single polygon bounded by a single arc,
+        or the result is invalid
+    """
+    arc = outer_arc(piece, 4, 45, rtol)
+    if arc is None:
+        return None
+
+    return mirrored_ring(arc)
+
+
+def mirrored_ring(arc: np.ndarray) -> Optional[Polygon]:
+    """
+    Polygon made of ``arc`` running counter-clockwise from the x-axis to the y-axis and its mirror images,
+    ``None`` if it is invalid.
+    """
+    result = Polygon(mirrored_coords(arc))
+
+    if not result.is_valid:
+        return None
+
+    return result
+
+
+def rotated_coords(arc: np.ndarray, fold: int) -> np.ndarray:
+    """Coordinates of the ring of :py:func:`rotated_ring`, not closed."""
+    return np.concatenate([arc[:-1] @ m for m in _rotation_matrices(fold)])
+
+
+def mirrored_coords(arc: np.ndarray) -> np.ndarray:
+    """Coordinates of the ring of :py:func:`mirrored_ring`, not closed."""
+    return np.concatenate([
+        arc,
+        arc[-2::-1] * [-1, 1],
+        arc[1:] * [-1, -1],
+        arc[-2:0:-1] * [1, -1],
+    ])
+
+
+def dimensions(cross_section, three_fold: bool) -> Tuple[float, float, float]:
+    """
+    Area, width and height of a bulged cross-section, measured like the ``bulged_area``, ``bulged_width`` and
+    ``bulged_height`` hooks. For three-roll passes width and height are twice the extents above and below
+    the centroid. NaN for ``None`` or empty cross-sections.
+
+    :param cross_section: shapely geometry, :py:class:`pyroll.profile_bulging.contour.Contour` or
+        :py:class:`pyroll.profile_bulging.compact.CompactCrossSection`
+    """
+    if cross_section is None or getattr(cross_section, "is_empty", False):
+        return np.nan, np.nan, np.nan
+
+    min_x, min_y, max_x, max_y = cross_section.bounds
+
+    if three_fold:
+        centroid = cross_section.centroid
+        centroid_y = centroid[1] if isinstance(centroid, tuple) else centroid.y
+        return cross_section.area, (max_y - centroid_y) * 2, (centroid_y - min_y) * 2
+
+    return cross_section.area, max_x - min_x, max_y - min_y
@@ -0,0 +1,36 @@
+import math
+
+import numpy as np
+
+from .config import Config
+
+DEFAULT_QUAD_SEGS = 16
+"""Number of segments per quarter circle used by shapely's ``buffer`` by default."""
+
+
+def max_segment_angle(radius, max_chord_deviation):
+    """
+    Maximum angle subtended by a chord of a circle of ``radius``
+    whose distance to the arc does not exceed ``max_chord_deviation``.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = 1 - max_chord_deviation / np.abs(radius)
+    return 2 * np.arccos(np.clip(np.nan_to_num(ratio, nan=-1), -1, 1))
+
+
+def quad_segs(radius, max_chord_deviation=None) -> int:
+    """
+    Number of segments per quarter circle needed to tessellate a circle of ``radius``
+    with a chord deviation of at most ``max_chord_deviation``.
+
+    :param radius: radius of the circle
+    :param max_chord_deviation: maximum chord deviation in metres,
+        defaults to :py:attr:`Config.MAX_CHORD_DEVIATION`, non-positive values yield :py:data:`DEFAULT_QUAD_SEGS`
+    """
+    if max_chord_deviation is None:
+        max_chord_deviation = Config.MAX_CHORD_DEVIATION
+
+    if max_chord_deviation <= 0:
+        return DEFAULT_QUAD_SEGS
+
+    return max(math.ceil(math.pi / 2 / max_segment_angle(radius, max_chord_deviation)), 1)
@@ -0,0 +1,433 @@
+import contextlib
+import copy
+import time
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+
+from . import symmetry
+from .cache import pass_geometry_cache
+from .config import Config
+from .surrogate import FIELDS
+
+KINDS = ("nominal", "scaled", "half_height", "arcsin_limit", "extreme")
+"""Kinds of the cases generated by :py:func:`generate_corpus`."""
+
+METHODS = ("cross_section", "contour", "batch", "surrogate")
+"""Ways of evaluating a :py:class:`Configuration`."""
+
+
+@dataclass(frozen=True)
+class Configuration:
+    """A way of computing the bulged cross-section to compare against the reference."""
+
+    name: str
+    """Name shown in the tables."""
+
+    overrides: Mapping = field(default_factory=dict)
+    """Values of :py:class:`Config` attributes set while the configuration is evaluated."""
+
+    method: str = "cross_section"
+    """
+    One of :py:data:`METHODS`: ``BulgingModel.output_cross_section`` as used by the solve step,
+    the analytic contour only as with :py:attr:`Config.SCALAR_ONLY`,
+    :py:func:`pyroll.profile_bulging.batch.bulged_cross_sections`
+    or the lookup in surrogate tables sampled beforehand.
+    """
+
+    surrogate_radii: int = 64
+    """Count of bulge radii of the surrogate tables, sampled geometrically between the extreme radii of each pass."""
+
+
+REFERENCE = Configuration("reference", {"ANALYTIC_CROSS_SECTION": True, "MAX_CHORD_DEVIATION": 1e-8})
+"""High-resolution reference: analytic contours tessellated to 10 nm, falling back to finely tessellated polygons."""
+
+CONFIGURATIONS = (
+    Configuration("polygon"),
+    Configuration("boolean", {"CONSTRUCTIVE_CROSS_SECTION": False}),
+    Configuration("polygon 1 um", {"MAX_CHORD_DEVIATION": 1e-6}),
+    Configuration("polygon 10 um", {"MAX_CHORD_DEVIATION": 1e-5}),
+    Configuration("polygon 100 um", {"MAX_CHORD_DEVIATION": 1e-4}),
+    Configuration("analytic", {"ANALYTIC_CROSS_SECTION": True}),
+    Configuration("analytic 10 um", {"ANALYTIC_CROSS_SECTION": True, "MAX_CHORD_DEVIATION": 1e-5}),
+    Configuration("analytic 100 um", {"ANALYTIC_CROSS_SECTION": True, "MAX_CHORD_DEVIATION": 1e-4}),
+    Configuration("simplified 48", {"OUTPUT_VERTEX_BUDGET": 48}),
+    Configuration("simplified 24", {"OUTPUT_VERTEX_BUDGET": 24}),
+    Configuration("simplified 1e-4", {"OUTPUT_MAX_AREA_ERROR": 1e-4}),
+    Configuration("scalar only", method="contour"),
+    Configuration("batch", method="batch"),
+    Configuration("surrogate", method="surrogate"),
+)
+"""Default configurations compared by :py:func:`validate`, covering the tessellation settings and the fast paths."""
+
+
+@dataclass
+class ValidationCase:
+    """An unbulged profile with given bulge radius behind a solved roll pass."""
+
+    roll_pass: object
+    """Solved roll pass."""
+
+    profile: object
+    """Unbulged profile with ``width`` and ``bulge_radius`` set."""
+
+    kind: str
+    """One of :py:data:`KINDS`."""
+
+    builder: str
+    """Name of the cross-section builder selected for the roll pass."""
+
+
+@dataclass
+class ValidationRow:
+    """Accuracy and speed of one configuration, created by :py:func:`validate`."""
+
+    configuration: Configuration
+    """The evaluated configuration."""
+
+    time: float
+    """Best wall time per case in seconds."""
+
+    speedup: float
+    """Time of the reference divided by :py:attr:`time`."""
+
+    max_errors: dict
+    """Maximum relative deviation from the reference per name in :py:data:`FIELDS`."""
+
+    mean_errors: dict
+    """Mean relative deviation from the reference per name in :py:data:`FIELDS`."""
+
+    kind_errors: dict
+    """Maximum relative deviation of any quantity per case kind."""
+
+    mismatches: int
+    """Count of cases where either the configuration or the reference found no bulged cross-section."""
+
+    setup_time: float = 0
+    """Preparation time not included in :py:attr:`time`, like the sampling of surrogate tables."""
+
+    pareto: bool = False
+    """Whether no other configuration is at least as fast and accurate and better in one of these."""
+
+    @property
+    def max_error(self) -> float:
+        """Maximum relative deviation of any quantity."""
+        return max(self.max_errors.values())
+
+
+def _template(roll_pass):
+    from pyroll.core import Profile as BaseProfile
+    return BaseProfile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+
+def _edge_radii(model, profile) -> list:
+    from .symmetric_roll_pass import BulgingModel
+
+    roll_pass = model.symmetric_roll_pass
+    result = []
+
+    if "3fold" not in roll_pass.classifiers:
+        result.append(("half_height", roll_pass.height / 2))
+
+    if model.model_pair.cross_section in (
+            BulgingModel.two_roll_bulged_cross_section_polygon_square_diamond_square,
+            BulgingModel.two_roll_bulged_cross_section_polygon_square_oval_square,
+    ):
+        r2 = roll_pass.roll.groove.r2
+        # the argument of the arcsin in the square builders leaves [-1, 1] at these radii
+        result.append(("arcsin_limit", (profile.width / 2 + r2) / 2))
+        result.append(("arcsin_limit", r2))
+
+    return result
+
+
+def generate_corpus(
+        roll_passes: Sequence,
+        radius_factors: Sequence[float] = (0.5, 2),
+        extreme_factors: Sequence[float] = (0.02, 50),
+        margin: float = 1e-3,
+) -> list:
+    """
+    Generate validation cases for solved roll passes.
+
+    Every roll pass contributes its outgoing profile with the bulge radius of the model (``"nominal"``)
+    and scaled by ``radius_factors`` (``"scaled"``) and ``extreme_factors`` (``"extreme"``),
+    the latter running into the fallbacks for missing intersections.
+    Around the branch points of the builders the radius is placed at ``1 - margin`` and ``1 + margin``
+    times the critical value: twice the radius equal to the height of two-roll passes (``"half_height"``)
+    and the limits of the ``arcsin`` domain of the square builders (``"arcsin_limit"``).
+
+    :param roll_passes: solved roll passes, passes without bulging model are skipped;
+        their pass sequences must be kept referenced, as some models look up the previous roll pass
+    :return: list of :py:class:`ValidationCase`
+    """
+    from .symmetric_roll_pass import BulgingModel
+
+    cases = []
+
+    for roll_pass in roll_passes:
+        model = BulgingModel(roll_pass)
+        if model.model_pair is None:
+            continue
+
+        template = _template(roll_pass)
+        nominal = abs(model.bulge_radius(template))
+        radii = [("nominal", nominal)]
+        radii += [("scaled", nominal * f) for f in radius_factors]
+        radii += [("extreme", nominal * f) for f in extreme_factors]
+        radii += [
+            (kind, radius * (1 + sign * margin))
+            for kind, radius in _edge_radii(model, template) for sign in (-1, 1)
+        ]
+
+        for kind, radius in radii:
+            profile = copy.copy(template)
+            profile.bulge_radius = radius
+            cases.append(ValidationCase(roll_pass, profile, kind, model.model_pair.cross_section.__name__))
+
+    return cases
+
+
+@contextlib.contextmanager
+def overridden(overrides: Mapping):
+    """
+    Context manager setting attributes of :py:class:`Config` temporarily.
+
+    :raises ValueError: if a name is not a configuration value
+    """
+    names = Config.to_dict()
+    unknown = set(overrides) - set(names)
+    if unknown:
+        raise ValueError(f"Unknown configuration values {sorted(unknown)}.")
+
+    previous = {name: getattr(Config, name) for name in overrides}
+    try:
+        for name, value in overrides.items():
+            setattr(Config, name, value)
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(Config, name, value)
+
+
+def _by_roll_pass(cases) -> dict:
+    groups = {}
+    for i, case in enumerate(cases):
+        groups.setdefault(id(case.roll_pass), []).append(i)
+    return groups
+
+
+def _surrogate_tables(cases, radius_count: int) -> dict:
+    from .surrogate import sample_table
+
+    tables = {}
+
+    for key, indices in _by_roll_pass(cases).items():
+        roll_pass = cases[indices[0]].roll_pass
+        width = cases[indices[0]].profile.width
+        radii = [cases[i].profile.bulge_radius for i in indices]
+        tables[key] = sample_table(
+            roll_pass,
+            [width * (1 - 1e-6), width * (1 + 1e-6)],
+            np.geomspace(min(radii) * (1 - 1e-6), max(radii) * (1 + 1e-6), radius_count),
+        )
+
+    return tables
+
+
+def _scalars_or_nan(cross_section, three_fold: bool):
+    try:
+        return symmetry.dimensions(cross_section, three_fold)
+    except (ValueError, ArithmeticError):
+        return np.nan, np.nan, np.nan
+
+
+def evaluate(
+        configuration: Configuration, cases: Sequence[ValidationCase], tables: Optional[dict] = None
+) -> np.ndarray:
+    """
+    Compute the bulged area, width and height of all cases with ``configuration``.
+    The cross-section cache is disabled, so every case is built, and the pass geometry cache is cleared,
+    so every configuration starts without the helper geometries built by the ones evaluated before.
+
+    :param tables: surrogate tables by roll pass id for the ``"surrogate"`` method, see :py:func:`validate`
+    :return: array of shape ``(len(cases), len(FIELDS))``, NaN where no bulged cross-section was found
+    """
+    from . import batch
+    from .symmetric_roll_pass import BulgingModel
+
+    if configuration.method not in METHODS:
+        raise ValueError(f"Unknown method '{configuration.method}', expected one of {METHODS}.")
+
+    values = np.full((len(cases), len(FIELDS)), np.nan)
+
+    # the edge cases leave the domain of the arcsin in the square builders on purpose
+    with overridden({"CROSS_SECTION_CACHE_SIZE": 0, **configuration.overrides}), np.errstate(invalid="ignore"):
+        pass_geometry_cache.clear()
+
+        for key, indices in _by_roll_pass(cases).items():
+            roll_pass = cases[indices[0]].roll_pass
+            three_fold = "3fold" in roll_pass.classifiers
+
+            if configuration.method == "batch":
+                try:
+                    cross_sections = batch.bulged_cross_sections(roll_pass, [cases[i].profile for i in indices])
+                except (ValueError, ArithmeticError):
+                    continue
+
+                for i, cross_section in zip(indices, cross_sections):
+                    values[i] = _scalars_or_nan(cross_section, three_fold)
+                continue
+
+            if configuration.method == "surrogate":
+                table = tables[key]
+                for i in indices:
+                    result = table.lookup(cases[i].profile.width, cases[i].profile.bulge_radius)
+                    values[i] = [result[name] for name in FIELDS]
+                continue
+
+            model = BulgingModel(roll_pass)
+
+            for i in indices:
+                profile = cases[i].profile
+
+                try:
+                    if configuration.method == "contour":
+                        values[i] = _scalars_or_nan(model.bulged_contour(profile), three_fold)
+                    else:
+                        values[i] = _scalars_or_nan(model.output_cross_section(profile)[0], three_fold)
+                except (ValueError, ArithmeticError):
+                    pass
+
+    return values
+
+
+def _timed(configuration, cases, repeat: int):
+    setup_time = 0
+    tables = None
+
+    if configuration.method == "surrogate":
+        start = time.perf_counter()
+        with overridden({"CROSS_SECTION_CACHE_SIZE": 0, **configuration.overrides}):
+            pass_geometry_cache.clear()
+            tables = _surrogate_tables(cases, configuration.surrogate_radii)
+        setup_time = time.perf_counter() - start
+
+    durations = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        values = evaluate(configuration, cases, tables)
+        durations.append(time.perf_counter() - start)
+
+    return values, min(durations) / max(len(cases), 1), setup_time
+
+
+def _relative_errors(values, reference) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        errors = np.abs(values - reference) / np.abs(reference)
+    return np.where(np.isfinite(values) & np.isfinite(reference), errors, np.nan)
+
+
+def _max(values) -> float:
+    values = np.asarray(values)
+    values = values[np.isfinite(values)]
+    return float(values.max()) if len(values) else 0.0
+
+
+def _mean(values) -> float:
+    values = np.asarray(values)
+    values = values[np.isfinite(values)]
+    return float(values.mean()) if len(values) else 0.0
+
+
+def pareto_front(rows: Sequence[ValidationRow]):
+    """
+    Set :py:attr:`ValidationRow.pareto` of rows not dominated by another row in time, maximum error and mismatches.
+    """
+    def objectives(row):
+        return row.time, row.max_error, row.mismatches
+
+    for row in rows:
+        own = objectives(row)
+        row.pareto = not any(
+            all(o <= s for o, s in zip(objectives(other), own)) and objectives(other) != own
+            for other in rows if other is not row
+        )
+
+
+def validate(
+        cases: Sequence[ValidationCase],
+        configurations: Sequence[Configuration] = CONFIGURATIONS,
+        reference: Configuration = REFERENCE,
+        repeat: int = 3,
+) -> list:
+    """
+    Compare the configurations against the reference on the cases.
+    Every configuration is evaluated ``repeat`` times and the fastest run is reported.
+
+    :param cases: cases created by :py:func:`generate_corpus`
+    :return: list of :py:class:`ValidationRow`, the reference first, with the Pareto front marked
+    """
+    cases = list(cases)
+    kinds = [k for k in KINDS if any(c.kind == k for c in cases)]
+    kinds += sorted({c.kind for c in cases} - set(kinds))
+
+    evaluate(reference, cases)  # warm up the lazy imports
+    reference_values, reference_time, _ = _timed(reference, cases, repeat)
+    rows = []
+
+    for configuration in [reference, *configurations]:
+        if configuration is reference:
+            values, elapsed, setup_time = reference_values, reference_time, 0
+        else:
+            values, elapsed, setup_time = _timed(configuration, cases, repeat)
+
+        errors = _relative_errors(values, reference_values)
+        found = np.isfinite(values).all(axis=1)
+        reference_found = np.isfinite(reference_values).all(axis=1)
+
+        rows.append(ValidationRow(
+            configuration=configuration,
+            time=elapsed,
+            speedup=reference_time / elapsed if elapsed > 0 else np.inf,
+            max_errors={name: _max(errors[:, j]) for j, name in enumerate(FIELDS)},
+            mean_errors={name: _mean(errors[:, j]) for j, name in enumerate(FIELDS)},
+            kind_errors={
+                kind: _max(errors[[c.kind == kind for c in cases]]) for kind in kinds
+            },
+            mismatches=int(np.count_nonzero(found != reference_found)),
+            setup_time=setup_time,
+        ))
+
+    pareto_front(rows)
+    return rows
+
+
+def format_table(rows: Sequence[ValidationRow]) -> str:
+    """Format the rows as plain text table, Pareto-optimal configurations are marked with ``*``."""
+    lines = [
+        f"{'':1s} {'configuration':18s} {'ms/case':>8s} {'speedup':>7s} "
+        + " ".join(f"{'max ' + name:>10s}" for name in FIELDS)
+        + f" {'mean area':>10s} {'mismatch':>8s} {'setup s':>7s}"
+    ]
+
+    for row in rows:
+        lines.append(
+            f"{'*' if row.pareto else '':1s} {row.configuration.name:18s} {row.time * 1e3:8.3f} {row.speedup:7.2f} "
+            + " ".join(f"{row.max_errors[name]:10.2e}" for name in FIELDS)
+            + f" {row.mean_errors['area']:10.2e} {row.mismatches:8d} {row.setup_time:7.2f}"
+        )
+
+    return "\n".join(lines)
+
+
+def format_kind_table(rows: Sequence[ValidationRow]) -> str:
+    """Format the maximum relative errors per case kind of the rows as plain text table."""
+    kinds = list(rows[0].kind_errors) if rows else []
+    lines = [f"{'configuration':18s} " + " ".join(f"{kind:>12s}" for kind in kinds)]
+
+    for row in rows:
+        lines.append(f"{row.configuration.name:18s} " + " ".join(f"{row.kind_errors[k]:12.2e}" for k in kinds))
+
+    return "\n".join(lines)
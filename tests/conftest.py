@@ -0,0 +1,180 @@
+import pytest
+from pyroll.core import (
+    Profile, Roll, RollPass, ThreeRollPass, Transport, PassSequence, RoundGroove, SquareGroove, CircularOvalGroove
+)
+
+
+def build_round_oval_round(oval_r2=40e-3, oval_depth=8e-3, oval_gap=2e-3, round_gap=4e-3):
+    """
+    Create the round-oval-round pass sequence shared by the tests and its incoming profile.
+
+    :return: tuple of the unsolved sequence and a fresh incoming profile
+    """
+    import pyroll.wusatowski_spreading
+
+    in_profile = Profile.round(
+        diameter=30e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C20", "steel"],
+        flow_stress=100e6
+    )
+
+    sequence = PassSequence(
+        [
+            RollPass(
+                label="Oval I",
+                roll=Roll(
+                    groove=CircularOvalGroove(
+                        depth=oval_depth,
+                        r1=6e-3,
+                        r2=oval_r2
+                    ),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1
+                ),
+                gap=oval_gap,
+            ),
+            Transport(
+                label="I => II",
+                duration=1
+            ),
+            RollPass(
+                label="Round II",
+                roll=Roll(
+                    groove=RoundGroove(
+                        r1=1e-3,
+                        r2=12.5e-3,
+                        depth=11.5e-3
+                    ),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1
+                ),
+                gap=round_gap,
+            ),
+        ]
+    )
+
+    return sequence, in_profile
+
+
+@pytest.fixture
+def round_oval_round():
+    """Factory of fresh round-oval-round pass sequences, see :py:func:`build_round_oval_round`."""
+    return build_round_oval_round
+
+
+def build_square_oval_square():
+    """
+    Create the square-oval-square pass sequence shared by the tests and its incoming profile.
+
+    :return: tuple of the unsolved sequence and a fresh incoming profile
+    """
+    import pyroll.wusatowski_spreading
+
+    in_profile = Profile.square(
+        side=45e-3,
+        corner_radius=3e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C20", "steel"],
+        flow_stress=100e6
+    )
+
+    sequence = PassSequence([
+        RollPass(
+            label="Oval I",
+            roll=Roll(
+                groove=CircularOvalGroove(depth=7.25e-3, r1=6e-3, r2=44.5e-3),
+                nominal_radius=(324e-3 + 320e-3) / 2 / 2,
+            ),
+            velocity=1,
+            gap=3e-3,
+        ),
+        Transport(duration=1),
+        RollPass(
+            label="Quadrat II",
+            roll=Roll(
+                groove=SquareGroove(usable_width=29.64e-3, tip_depth=14.625e-3, r1=6e-3, r2=4e-3),
+                nominal_radius=(328e-3 + 324e-3) / 2 / 2
+            ),
+            velocity=1,
+            gap=3e-3,
+        ),
+    ])
+
+    return sequence, in_profile
+
+
+@pytest.fixture
+def square_oval_square():
+    """Factory of fresh square-oval-square pass sequences, see :py:func:`build_square_oval_square`."""
+    return build_square_oval_square
+
+
+def build_three_roll_oval_oval(pass_count=1, diameter=71e-3, inscribed_circle_diameter=59.9e-3):
+    """
+    Create the leading oval passes of the three-roll round-oval-oval pass sequence shared by the tests
+    and its incoming profile.
+
+    :param pass_count: number of oval passes, one or two
+    :param diameter: diameter of the incoming round profile
+    :param inscribed_circle_diameter: inscribed circle diameter of the first oval pass
+    :return: tuple of the unsolved sequence and a fresh incoming profile
+    """
+    import pyroll.wusatowski_spreading
+
+    in_profile = Profile.round(
+        diameter=diameter,
+        temperature=1000 + 273.15,
+        strain=0,
+        material=["S304", "steel"],
+        flow_stress=100e6,
+        length=1,
+        density=7.5e3,
+        specific_heat_capacity=690,
+        thermal_conductivity=23
+    )
+
+    units = [
+        ThreeRollPass(
+            label="Oval I",
+            roll=Roll(
+                groove=CircularOvalGroove(
+                    usable_width=67.12e-3,
+                    r1=0.1e-3,
+                    r2=129e-3 / 2,
+                    pad_angle=30
+                ),
+                nominal_radius=195e-3 / 2,
+                rotational_frequency=130 * 1 / 60
+            ),
+            inscribed_circle_diameter=inscribed_circle_diameter,
+        ),
+        Transport(
+            label="I => II",
+            duration=1
+        ),
+        ThreeRollPass(
+            label="Oval II",
+            roll=Roll(
+                groove=CircularOvalGroove(
+                    usable_width=62.37e-3,
+                    r1=0.1e-3,
+                    r2=129e-3 / 2,
+                    pad_angle=30
+                ),
+                nominal_radius=197e-3 / 2,
+                rotational_frequency=100 * 1 / 60
+            ),
+            inscribed_circle_diameter=54.4e-3,
+        ),
+    ]
+
+    return PassSequence(units[:2 * pass_count - 1]), in_profile
+
+
+@pytest.fixture
+def three_roll_oval_oval():
+    """Factory of fresh three-roll oval pass sequences, see :py:func:`build_three_roll_oval_oval`."""
+    return build_three_roll_oval_oval
@@ -0,0 +1,62 @@
+import numpy as np
+from pyroll.core import Profile
+
+
+def _compare_with_polygon(sequence):
+    from pyroll.profile_bulging import symmetry
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    for rp in sequence.roll_passes:
+        model = BulgingModel(rp)
+        profile = Profile(**{k: v for k, v in rp.out_profile.__dict__.items() if not k.startswith("_")})
+        profile.bulge_radius = model.bulge_radius(profile)
+
+        polygon = model.cross_section(profile)
+        contour = model.bulged_contour(profile)
+
+        assert contour is not None
+        tessellated = contour.to_polygon()
+
+        assert tessellated.is_valid
+        assert np.isclose(contour.area, polygon.area, rtol=2e-3)
+        assert np.isclose(contour.width, polygon.bounds[2] - polygon.bounds[0], rtol=1e-3)
+        assert polygon.symmetric_difference(tessellated).area < 2e-3 * polygon.area
+        assert np.isclose(contour.area, tessellated.area, rtol=2e-3)
+        assert np.allclose(contour.centroid, tessellated.centroid.coords[0], atol=1e-3 * contour.width)
+        assert np.isclose(contour.perimeter, tessellated.length, rtol=2e-3)
+
+        three_fold = "3fold" in rp.classifiers
+        expected = symmetry.dimensions(polygon, three_fold)
+        assert np.allclose(symmetry.dimensions(contour, three_fold), expected, rtol=2e-3)
+
+
+def test_analytic_contour_two_roll(round_oval_round):
+    import pyroll.wusatowski_spreading
+    import pyroll.profile_bulging
+
+    sequence, in_profile = round_oval_round()
+    sequence.solve(in_profile)
+    _compare_with_polygon(sequence)
+
+
+def test_analytic_contour_three_roll(three_roll_oval_oval):
+    import pyroll.wusatowski_spreading
+    import pyroll.profile_bulging
+
+    sequence, in_profile = three_roll_oval_oval()
+    sequence.solve(in_profile)
+    _compare_with_polygon(sequence)
+
+
+def test_analytic_cross_section_solve(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+
+    monkeypatch.setattr(Config, "ANALYTIC_CROSS_SECTION", True)
+
+    sequence, in_profile = round_oval_round()
+    sequence.solve(in_profile)
+    out_profile = sequence.units[1].in_profile
+
+    assert np.isclose(out_profile.cross_section.area, out_profile.bulged_contour.area, rtol=2e-3)
+    assert np.isclose(out_profile.width, out_profile.bulged_contour.width, rtol=1e-3)
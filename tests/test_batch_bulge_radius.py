@@ -0,0 +1,76 @@
+import numpy as np
+
+
+def test_batch_bulge_radius_two_roll(round_oval_round):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging.batch import bulge_radii
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = round_oval_round()
+    sequence.solve(in_profile)
+
+    for rp in sequence.roll_passes:
+        scalar = BulgingModel(rp).bulge_radius(rp.out_profile)
+        widths = rp.out_profile.width * np.linspace(0.95, 1.05, 11)
+        batch = bulge_radii(
+            rp.in_profile.classifiers,
+            rp.classifiers,
+            width=widths,
+            in_width=rp.in_profile.width,
+            in_area=rp.in_profile.cross_section.area,
+            r2=rp.roll.groove.r2,
+            usable_width=rp.roll.groove.usable_width,
+            height=rp.height,
+            oval_radius=sequence.roll_passes[0].roll.groove.r2,
+        )
+
+        assert batch.shape == widths.shape
+        assert np.isclose(batch[5], scalar, rtol=1e-12)
+
+
+def test_batch_bulge_radius_three_roll(three_roll_oval_oval):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging.batch import bulge_radii
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = three_roll_oval_oval(pass_count=2)
+    sequence.solve(in_profile)
+
+    for rp in sequence.roll_passes:
+        scalar = BulgingModel(rp).bulge_radius(rp.out_profile)
+        batch = bulge_radii(
+            rp.in_profile.classifiers,
+            rp.classifiers,
+            width=[rp.out_profile.width] * 3,
+            in_width=rp.in_profile.width,
+            in_area=rp.in_profile.cross_section.area,
+            displaced_area=rp.displaced_cross_section.area,
+            inscribed_circle_diameter=rp.inscribed_circle_diameter,
+        )
+
+        assert np.allclose(batch, scalar, rtol=1e-12)
+
+
+def test_batch_bulge_radius_registry():
+    import pytest
+    from pyroll.profile_bulging import registry
+    from pyroll.profile_bulging.batch import bulge_radii
+    from pyroll.profile_bulging.radius_models import two_roll_bulge_radius_model_schmidt
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    arguments = dict(width=[20e-3, 21e-3], in_width=18e-3, in_area=2.5e-4, r2=40e-3, usable_width=30e-3, height=12e-3)
+    lee = bulge_radii("round", {"oval"}, **arguments)
+
+    # the model is resolved by the registry, so replacing a registration changes the batch results as well
+    pair = registry.resolve({"round"}, {"oval"})
+    registry.register("round", "oval", 2, BulgingModel.two_roll_bulge_radius_model_schmidt, pair.cross_section)
+    try:
+        schmidt = bulge_radii("round", {"oval"}, **arguments)
+    finally:
+        registry.register("round", "oval", 2, pair.bulge_radius, pair.cross_section, pair.contour)
+
+    assert np.allclose(schmidt, two_roll_bulge_radius_model_schmidt(np.array([20e-3, 21e-3]), 40e-3, 12e-3))
+    assert not np.allclose(schmidt, lee)
+
+    with pytest.raises(ValueError):
+        bulge_radii("box", {"box"}, **arguments)
@@ -0,0 +1,93 @@
+import copy
+
+import numpy as np
+import pytest
+import shapely
+from pyroll.core import Profile, Roll, RollPass, DiamondGroove
+
+
+@pytest.mark.parametrize("factory", ["round_oval_round", "three_roll_oval_oval"])
+def test_batch_cross_sections_match_scalar_builders(factory, request):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging.batch import bulged_cross_sections
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = request.getfixturevalue(factory)()
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+
+    model = BulgingModel(roll_pass)
+    template = Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+    radius = model.bulge_radius(template)
+
+    profiles = []
+    for width_factor in (0.95, 1, 1.05):
+        for radius_factor in (0.5, 1, 2):
+            profile = copy.copy(template)
+            profile.width = template.width * width_factor
+            profile.bulge_radius = radius * radius_factor
+            profiles.append(profile)
+
+    results = bulged_cross_sections(roll_pass, profiles)
+
+    assert len(results) == len(profiles)
+    for result, profile in zip(results, profiles):
+        expected = model.cross_section(profile)
+
+        if expected is None:
+            assert result is None
+            continue
+
+        assert np.isclose(result.area, expected.area, rtol=1e-12)
+        assert shapely.symmetric_difference(result, expected).area <= 1e-9 * expected.area
+
+
+def test_batch_cross_sections_square_outside_arcsin_domain():
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging.batch import bulged_cross_sections
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    roll_pass = RollPass(
+        label="Diamond I",
+        roll=Roll(
+            groove=DiamondGroove(usable_width=76.55e-3, tip_depth=22.1e-3, r1=12e-3, r2=8e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=3e-3,
+    )
+    roll_pass.solve(Profile.square(
+        side=45e-3,
+        corner_radius=3e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C20", "steel"],
+        flow_stress=100e6
+    ))
+
+    model = BulgingModel(roll_pass)
+    template = Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+    # bulge radii below half the height, but above r2, so no separation point exists
+    profiles = []
+    for radius in (10e-3, 15e-3, 20e-3):
+        profile = copy.copy(template)
+        profile.bulge_radius = radius
+        profiles.append(profile)
+
+    with np.errstate(invalid="ignore"):
+        results = bulged_cross_sections(roll_pass, profiles)
+        expected = [model.cross_section(p) for p in profiles]
+
+    for result, cross_section in zip(results, expected):
+        assert result.area > 0
+        assert result.equals(cross_section)
+
+
+def test_batch_cross_sections_length_mismatch(round_oval_round):
+    from pyroll.profile_bulging.batch import bulged_cross_sections
+
+    roll_pass = round_oval_round()[0].roll_passes[0]
+
+    with pytest.raises(ValueError):
+        bulged_cross_sections([roll_pass, roll_pass], [Profile.round(diameter=1)])
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from pyroll.core import Profile
+
+
+def _roll_pass(three_roll_oval_oval, diameter):
+    sequence, in_profile = three_roll_oval_oval(diameter=diameter)
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+    return roll_pass
+
+
+def _bulged_area(roll_pass, parameter_profile):
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    model = BulgingModel(roll_pass)
+    model.parameter_profile = parameter_profile
+    profile = Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+    return model.solve(profile).cross_section.area
+
+
+def test_calibrate_recovers_constant(three_roll_oval_oval, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config, parameters
+    from pyroll.profile_bulging.calibration import FAILED_RESIDUAL, _residuals, collect_samples, calibrate
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    roll_passes = [_roll_pass(three_roll_oval_oval, d) for d in (70e-3, 71e-3, 72e-3)]
+    truth = parameters.DEFAULT.replace(byon_eccentricity_factor=2.8)
+    measured = [_bulged_area(rp, truth) for rp in roll_passes]
+
+    samples = collect_samples(roll_passes, dict(area=measured))
+    assert len(samples) == 1 and len(samples[0]) == 3
+
+    try:
+        result = calibrate(samples, name="mill")
+        assert result.fitted == ("byon_eccentricity_factor",)
+        assert result.profile.byon_eccentricity_factor == pytest.approx(2.8, rel=1e-2)
+        assert result.rms < 1e-4 < result.initial_rms
+
+        # the fitted profile plugs back into the model by name
+        roll_passes[0].bulging_parameter_profile = "mill"
+        assert BulgingModel(roll_passes[0]).parameter_profile is result.profile
+        monkeypatch.setattr(Config, "PARAMETER_PROFILE", "mill")
+        assert _bulged_area(roll_passes[1], BulgingModel(roll_passes[1]).parameter_profile) == pytest.approx(
+            measured[1], rel=1e-4
+        )
+    finally:
+        parameters.unregister_profile("mill")
+
+    # failed predictions are penalized instead of counting as perfect matches
+    samples[0].responses["area"][0] = np.nan
+    residuals = _residuals(samples, parameters.DEFAULT)
+    assert residuals[0] == FAILED_RESIDUAL
+    assert np.all(np.isfinite(residuals))
+
+
+def test_unknown_parameter_profile(monkeypatch):
+    from pyroll.profile_bulging import Config, parameters
+
+    monkeypatch.setattr(Config, "PARAMETER_PROFILE", "unknown")
+
+    with pytest.raises(KeyError):
+        parameters.resolve(None)
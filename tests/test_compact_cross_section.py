@@ -0,0 +1,84 @@
+import pickle
+
+import numpy as np
+import pytest
+from shapely import Point
+from pyroll.core import Profile
+
+
+def test_compact_cross_section(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+    from pyroll.profile_bulging.compact import CompactCrossSection
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = round_oval_round()
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+
+    def out_profile():
+        return Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    eager = BulgingModel(roll_pass).solve(out_profile())
+
+    monkeypatch.setattr(Config, "COMPACT_CROSS_SECTION", True)
+    compact = BulgingModel(roll_pass).solve(out_profile())
+
+    stored = compact.__dict__["cross_section"]
+    assert isinstance(stored, CompactCrossSection)
+    assert stored.fold == 2
+    assert stored.bulge_radius == eager.bulge_radius
+    assert stored.branch == "two_roll_bulged_cross_section_polygon_round_oval_round"
+    assert stored.area == eager.cross_section.area
+    assert stored.nbytes < len(eager.cross_section.exterior.coords) * 16 / 3
+
+    assert compact.cross_section.equals(eager.cross_section)
+    assert compact.cross_section is compact.cross_section
+    assert np.allclose(stored.bounds, eager.cross_section.bounds, rtol=0, atol=1e-15)
+    assert compact.width == eager.width
+
+    monkeypatch.setattr(Config, "COMPACT_CROSS_SECTION_DTYPE", "float32")
+    single = BulgingModel(roll_pass).solve(out_profile()).__dict__["cross_section"]
+    assert single.arc.dtype == np.float32
+    assert single.area == stored.area
+    assert single().symmetric_difference(eager.cross_section).area < 1e-6 * stored.area
+
+    restored = pickle.loads(pickle.dumps(stored))
+    assert np.array_equal(restored.arc, stored.arc) and restored.area == stored.area
+
+
+def test_compact_n_fold_and_unsymmetric():
+    from pyroll.profile_bulging import symmetry
+    from pyroll.profile_bulging.compact import CompactCrossSection
+
+    arc = np.array([(np.cos(a), np.sin(a)) for a in np.deg2rad(np.linspace(-60, 60, 9) + symmetry.gap_angle(3))])
+    arc[[0, -1]] *= 0.8
+    polygon = symmetry.rotated_ring(arc, 3)
+
+    compact = CompactCrossSection.from_polygon(polygon, 3)
+    assert compact is not None
+    assert len(compact.arc) == len(arc)
+    assert compact().symmetric_difference(polygon).area < 1e-12
+    assert compact.area == pytest.approx(polygon.area, rel=1e-12)
+    assert compact.centroid == pytest.approx((polygon.centroid.x, polygon.centroid.y), abs=1e-12)
+    assert symmetry.dimensions(compact, True) == pytest.approx(symmetry.dimensions(polygon, True), rel=1e-12)
+
+    assert CompactCrossSection.from_polygon(Point(0.1, 0).buffer(1), 2) is None
+
+
+def test_pack():
+    from pyroll.profile_bulging import symmetry
+    from pyroll.profile_bulging.compact import CompactCrossSection, pack
+
+    arc = np.array([(1, 0), (0.9, 0.5), (0, 0.6)])
+    first, second = CompactCrossSection(arc.copy(), 2), CompactCrossSection(arc * 2, 2)
+    shared = CompactCrossSection(first.arc, 2)
+
+    buffer, offsets = pack([first, None, second, shared], dtype=np.float32)
+
+    assert buffer.shape == (6, 2) and buffer.dtype == np.float32
+    assert list(offsets) == [0, -1, 3, 0]
+    assert all(np.shares_memory(c.arc, buffer) for c in (first, second, shared))
+    assert first.arc is not shared.arc and np.array_equal(first.arc, shared.arc)
+    assert second().equals_exact(symmetry.mirrored_ring(arc * 2), 1e-6)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from shapely import Point, Polygon, box
+
+
+def _region(curve):
+    return Polygon(np.concatenate([[(curve.start, 0)], curve.coords, [(curve.end, 0)]]))
+
+
+def test_curve_minimum_and_maximum():
+    from pyroll.profile_bulging.assembly import Curve
+
+    groove = Curve.vertical([(0, 2), (1, 2), (3, 0.5), (4, 0)])
+    circle = Curve.circle(2, 1.5, 16)
+    quadrant = box(0, 0, 4, 3)
+    bulge = Point(2, 0).buffer(1.5, quad_segs=16).intersection(quadrant)
+
+    minimum = groove.minimum(circle)
+    assert _region(minimum).symmetric_difference(_region(groove).intersection(bulge)).area < 1e-12
+
+    strip = groove.restrict(0, 1.5)
+    maximum = strip.maximum(circle)
+    expected = _region(strip).union(bulge)
+    assert _region(maximum).is_valid
+    assert _region(maximum).symmetric_difference(expected).area < 1e-12
+
+    assert groove.restrict(0, 0.2).maximum(circle) is None
+    assert Curve.vertical([(0, 1), (0, 2)]) is None
+
+
+@pytest.mark.parametrize("factory", ["round_oval_round", "square_oval_square"])
+def test_constructive_matches_boolean(factory, request):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config, validation
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = request.getfixturevalue(factory)()
+    sequence.solve(in_profile)
+    cases = validation.generate_corpus(sequence.roll_passes)
+    assert cases
+
+    for case in cases:
+        model = BulgingModel(case.roll_pass)
+
+        with validation.overridden({"CROSS_SECTION_CACHE_SIZE": 0}), np.errstate(invalid="ignore"):
+            constructive = model.cross_section(case.profile)
+            with validation.overridden({"CONSTRUCTIVE_CROSS_SECTION": False}):
+                boolean = model.cross_section(case.profile)
+
+        assert (constructive is None) == (boolean is None)
+        if boolean is None or boolean.is_empty:
+            continue
+
+        assert constructive.geom_type == boolean.geom_type
+        assert constructive.is_valid
+        assert constructive.area == pytest.approx(boolean.area, rel=1e-12)
+        assert constructive.symmetric_difference(boolean).area / boolean.area < 1e-12
+
+    assert Config.CONSTRUCTIVE_CROSS_SECTION
@@ -0,0 +1,43 @@
+def test_cross_section_cache_hits(round_oval_round):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import cross_section_cache
+
+    cross_section_cache.clear()
+
+    first, in_profile = round_oval_round()
+    first.solve(in_profile)
+    misses = cross_section_cache.stats().misses
+    assert misses >= 2
+
+    second, in_profile = round_oval_round()
+    second.solve(in_profile)
+    stats = cross_section_cache.stats()
+    assert stats.misses == misses
+    assert stats.hits >= 2
+    assert stats.size == misses
+
+    assert second.units[1].in_profile.cross_section.equals(first.units[1].in_profile.cross_section)
+
+
+def test_cross_section_cache_eviction():
+    from pyroll.profile_bulging.cache import CrossSectionCache
+
+    cache = CrossSectionCache(max_size=2, tolerance=1e-6)
+
+    assert cache.get_or_build("a", lambda: 1) == (1, False)
+    assert cache.get_or_build("b", lambda: 2) == (2, False)
+    assert cache.get_or_build("a", lambda: 0) == (1, True)
+    assert cache.get_or_build("c", lambda: 3) == (3, False)
+    assert cache.get_or_build("b", lambda: 4) == (4, False)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 4, 2, 2)
+
+
+def test_cross_section_cache_disabled():
+    from pyroll.profile_bulging.cache import CrossSectionCache
+
+    cache = CrossSectionCache(max_size=0)
+    assert cache.key(None, None) is None
+    assert cache.get_or_build(None, lambda: 1) == (1, False)
+    assert len(cache) == 0
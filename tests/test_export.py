@@ -0,0 +1,109 @@
+def test_streaming_export(round_oval_round, tmp_path):
+    import numpy as np
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging.export import streaming_export, read_chunks, read_export
+
+    path = tmp_path / "results.pbex"
+    sequence, in_profile = round_oval_round()
+
+    with streaming_export(path, chunk_size=1) as sink:
+        sequence.solve(in_profile)
+        # only the final solution of each pass is kept, although the sequence is iterated
+        assert sink.written == 2
+
+        sequence.roll_passes[1].solve(sequence.roll_passes[0].out_profile)
+        assert sink.written == 2
+
+    assert sink.written == 3
+
+    table, cross_sections = read_export(path)
+    assert len(table) == sink.written
+    assert list(table["roll_pass"]) == ["Oval I", "Round II", "Round II"]
+    assert np.allclose([cs.area for cs in cross_sections], table["area"])
+
+    bulged = sequence.units[1].in_profile
+    assert table["bulge_radius"][0] == bulged.bulge_radius
+    assert cross_sections[0].equals(bulged.cross_section)
+
+    # an incomplete chunk at the end of the file is skipped
+    with open(path, "ab") as file:
+        file.write(path.read_bytes()[:40])
+    assert len(list(read_chunks(path))) == sink.written
+
+
+def test_streaming_export_does_not_change_results(round_oval_round, tmp_path):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging.export import streaming_export
+
+    reference, in_profile = round_oval_round()
+    reference.solve(in_profile)
+
+    sequence, in_profile = round_oval_round()
+    with streaming_export(tmp_path / "results.pbex"):
+        sequence.solve(in_profile)
+
+    assert sequence.out_profile.cross_section.equals(reference.out_profile.cross_section)
+    assert sequence.units[1].in_profile.cross_section.equals(reference.units[1].in_profile.cross_section)
+
+
+def test_streaming_export_drop_cross_sections(round_oval_round, tmp_path):
+    import numpy as np
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging.export import streaming_export, read_export
+
+    reference, in_profile = round_oval_round()
+    with streaming_export(tmp_path / "reference.pbex"):
+        reference.solve(in_profile)
+
+    sequence, in_profile = round_oval_round()
+    with streaming_export(tmp_path / "dropped.pbex", drop_cross_sections=True):
+        sequence.solve(in_profile)
+
+    # the following pass is solved with the bulged cross-section, the drop happens only after the solution
+    expected, expected_cross_sections = read_export(tmp_path / "reference.pbex")
+    table, cross_sections = read_export(tmp_path / "dropped.pbex")
+    assert np.array_equal(table, expected)
+    assert all(cs.equals(e) for cs, e in zip(cross_sections, expected_cross_sections))
+    assert sequence.roll_passes[1].out_profile.cross_section.equals(reference.roll_passes[1].out_profile.cross_section)
+
+    bulged = reference.units[1].in_profile
+    transport = sequence.units[1]
+    for profile in (transport.in_profile, transport.out_profile):
+        assert profile.bulged_scalars_only
+        assert "bulged_contour" not in profile.__dict__
+        assert profile.bulged_area == bulged.cross_section.area
+        assert profile.cross_section.equals(sequence.roll_passes[0].out_profile.cross_section)
+
+    # the incoming profile of the following pass is kept as it was solved with
+    assert sequence.roll_passes[1].in_profile.cross_section.equals(reference.roll_passes[1].in_profile.cross_section)
+
+
+def test_streaming_export_compact(round_oval_round, tmp_path, monkeypatch):
+    import numpy as np
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config, symmetry
+    from pyroll.profile_bulging.compact import CompactCrossSection
+    from pyroll.profile_bulging.export import streaming_export, read_export
+
+    monkeypatch.setattr(Config, "COMPACT_CROSS_SECTION", True)
+    sequence, in_profile = round_oval_round()
+    sequence.solve(in_profile)
+
+    compact = sequence.units[1].in_profile.__dict__["cross_section"]
+    assert isinstance(compact, CompactCrossSection)
+
+    # the values are taken from the compact cross-section without materializing the polygon
+    def materialize(self):
+        raise AssertionError("polygon materialized")
+
+    with monkeypatch.context() as m, streaming_export(tmp_path / "results.pbex") as sink:
+        m.setattr(CompactCrossSection, "polygon", materialize)
+        sink.write(sequence.roll_passes[0], sequence.units[1].in_profile)
+        sink.commit(sequence)
+
+    table, cross_sections = read_export(tmp_path / "results.pbex")
+    assert table["area"][0] == compact.area
+    assert np.allclose(
+        [table["width"][0], table["height"][0]], symmetry.dimensions(compact(), False)[1:], rtol=1e-12, atol=0
+    )
+    assert cross_sections[0].equals(compact())
@@ -0,0 +1,47 @@
+from pyroll.core import Profile
+
+
+def test_incremental_solve(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config, incremental_memo, parameters
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = round_oval_round()
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+
+    def out_profile():
+        return Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    monkeypatch.setattr(Config, "INCREMENTAL_SOLVE", True)
+    incremental_memo.clear()
+
+    first = BulgingModel(roll_pass).solve(out_profile())
+    second = BulgingModel(roll_pass).solve(out_profile())
+
+    assert incremental_memo.stats().computed == 1
+    assert incremental_memo.stats().avoided == 1
+    assert second.bulge_radius == first.bulge_radius
+    assert second.cross_section is first.cross_section
+
+    roll_pass.roll.groove.r2 = 41e-3
+    third = BulgingModel(roll_pass).solve(out_profile())
+
+    assert incremental_memo.stats().computed == 2
+    assert third.cross_section is not first.cross_section
+
+    # settings changing the result invalidate the memory as well
+    monkeypatch.setattr(Config, "MAX_CHORD_DEVIATION", 1e-5)
+    fourth = BulgingModel(roll_pass).solve(out_profile())
+
+    assert incremental_memo.stats().computed == 3
+    assert fourth.cross_section.area != third.cross_section.area
+
+    roll_pass.bulging_parameter_profile = parameters.DEFAULT.replace(lee_weight_factor=0.5)
+    fifth = BulgingModel(roll_pass).solve(out_profile())
+
+    assert incremental_memo.stats().computed == 4
+    assert fifth.bulge_radius != fourth.bulge_radius
+
+    incremental_memo.clear()
@@ -0,0 +1,100 @@
+import json
+
+import numpy as np
+from pyroll.core import Profile, Roll, RollPass, DiamondGroove
+
+
+def test_instrumentation(round_oval_round, tmp_path, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config, cross_section_cache
+    from pyroll.profile_bulging.instrumentation import instrument
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = round_oval_round()
+    cross_section_cache.clear()
+
+    with instrument() as recorder:
+        recorder.clear()
+        sequence.solve(in_profile)
+
+    assert not Config.INSTRUMENTATION
+    assert {r.roll_pass for r in recorder.records} == {"Oval I", "Round II"}
+
+    for r in recorder.records:
+        assert r.branch == "two_roll_bulged_cross_section_polygon_round_oval_round"
+        assert r.wall_time > 0
+        assert r.in_vertices > 0
+        assert r.out_vertices > 0
+        assert r.fallbacks == 0
+        assert r.no_intersection == 0
+        assert not r.cached
+
+    assert "Oval I" in recorder.summary_table()
+    assert "no isect" in recorder.summary_table()
+
+    trace_file = tmp_path / "trace.json"
+    recorder.write_chrome_trace(trace_file)
+    trace = json.loads(trace_file.read_text())
+    assert len(trace["traceEvents"]) == len(recorder.records)
+    assert all(e["ph"] == "X" for e in trace["traceEvents"])
+    assert all("no_intersection" in e["args"] for e in trace["traceEvents"])
+
+    count = len(recorder.records)
+    sequence.solve(in_profile)
+    assert len(recorder.records) == count
+
+    with instrument() as recorder:
+        recorder.clear()
+        sequence, in_profile = round_oval_round()
+        sequence.solve(in_profile)
+
+    assert recorder.records and all(r.cached for r in recorder.records)
+
+    cross_section_cache.clear()
+    monkeypatch.setattr(BulgingModel, "_constructive_round_oval_round", lambda self, profile: None)
+
+    with instrument() as recorder:
+        recorder.clear()
+        sequence, in_profile = round_oval_round()
+        sequence.solve(in_profile)
+
+    assert recorder.records and all(r.fallbacks == 1 and not r.cached for r in recorder.records)
+    assert all(r.no_intersection == 0 for r in recorder.records)
+
+
+def test_instrumentation_no_intersection(monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+    from pyroll.profile_bulging.instrumentation import instrument
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    roll_pass = RollPass(
+        label="Diamond I",
+        roll=Roll(
+            groove=DiamondGroove(usable_width=76.55e-3, tip_depth=22.1e-3, r1=12e-3, r2=8e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1
+        ),
+        gap=3e-3,
+    )
+    roll_pass.solve(Profile.square(
+        side=45e-3,
+        corner_radius=3e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C20", "steel"],
+        flow_stress=100e6
+    ))
+    profile = Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+    # a bulge radius below half the height, but above r2, has no separation point with the groove flank
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    monkeypatch.setattr(BulgingModel, "bulge_radius", lambda self, profile: 15e-3)
+
+    with instrument() as recorder, np.errstate(invalid="ignore"):
+        recorder.clear()
+        BulgingModel(roll_pass).solve(profile)
+
+    (record,) = recorder.records
+    assert record.no_intersection == 1
+    assert record.fallbacks == 1
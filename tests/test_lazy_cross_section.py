@@ -0,0 +1,31 @@
+from pyroll.core import Profile
+
+
+def test_lazy_cross_section(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+    from pyroll.profile_bulging.lazy import LazyBulgedCrossSection
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = round_oval_round()
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+
+    def out_profile():
+        return Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    eager = BulgingModel(roll_pass).solve(out_profile())
+
+    monkeypatch.setattr(Config, "LAZY_CROSS_SECTION", True)
+    lazy = BulgingModel(roll_pass).solve(out_profile())
+
+    deferred = lazy.__dict__["cross_section"]
+    assert isinstance(deferred, LazyBulgedCrossSection)
+    assert not deferred.evaluated
+    assert lazy.bulge_radius == eager.bulge_radius
+
+    assert lazy.cross_section.equals(eager.cross_section)
+    assert deferred.evaluated
+    assert lazy.cross_section is lazy.cross_section
+    assert lazy.width == eager.width
@@ -0,0 +1,65 @@
+import numpy as np
+from shapely import Point, intersection, unary_union
+from pyroll.core import Profile
+
+
+def test_assemble_four_fold():
+    from pyroll.profile_bulging import symmetry
+
+    square = Point(0, 0).buffer(1, quad_segs=1)
+    start_angle = symmetry.gap_angle(4)
+    piece = intersection(square, symmetry.sector(4, start_angle, 2))
+
+    assert start_angle == 45
+    assert symmetry.assemble(piece, 4, start_angle).symmetric_difference(square).area < 1e-12
+    assert unary_union(symmetry.rotated_copies(piece, 4)).symmetric_difference(square).area < 1e-12
+
+
+def test_n_fold_three_roll_pass(three_roll_oval_oval):
+    import pyroll.wusatowski_spreading
+    from pyroll.core.roll_pass.hookimpls.helpers import out_cross_section3
+    from pyroll.profile_bulging import symmetry
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = three_roll_oval_oval()
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+
+    model = BulgingModel(roll_pass)
+    profile = Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+    profile.bulge_radius = model.bulge_radius(profile)
+
+    offset_distance = profile.width / 2 - profile.bulge_radius
+    bulges = [
+        Point(*(offset_distance * center)).buffer(profile.bulge_radius, quad_segs=64)
+        for center in symmetry.directions(3, 90)
+    ]
+    expected = unary_union(
+        [out_cross_section3(roll_pass, profile.width * 0.9)]
+        + [profile.cross_section.intersection(b) for b in bulges]
+    )
+
+    bulged = model.n_fold_bulged_cross_section(profile)
+
+    assert bulged.is_valid
+    assert bulged.geom_type == "Polygon"
+    assert bulged.symmetric_difference(expected).area / expected.area < 1e-3
+    assert np.isclose(bulged.area, expected.area, rtol=1e-3)
+
+
+def test_n_fold_custom_registration():
+    from pyroll.profile_bulging import registry
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    assert registry.resolve({"round"}, {"oval", "4fold"}) is None
+
+    def four_roll_bulge_radius(model, profile):
+        return profile.width
+
+    registry.register("round", "oval", 4, four_roll_bulge_radius, BulgingModel.n_fold_bulged_cross_section)
+    try:
+        pair = registry.resolve({"round"}, {"oval", "4fold"})
+        assert pair.bulge_radius is four_roll_bulge_radius
+        assert pair.cross_section is BulgingModel.n_fold_bulged_cross_section
+    finally:
+        registry.unregister("round", "oval", 4)
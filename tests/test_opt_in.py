@@ -0,0 +1,73 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def _solve(round_oval_round, bulging=None, oval_bulging=None):
+    sequence, in_profile = round_oval_round()
+    if bulging is not None:
+        sequence.bulging = bulging
+    if oval_bulging is not None:
+        sequence.roll_passes[0].bulging = oval_bulging
+
+    sequence.solve(in_profile)
+    return sequence
+
+
+def _bulged(sequence):
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+    return [BulgingModel(roll_pass).enabled() for roll_pass in sequence.roll_passes]
+
+
+def test_opt_in(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+
+    monkeypatch.setattr(Config, "OPT_IN", True)
+
+    sequence = _solve(round_oval_round)
+    assert _bulged(sequence) == [False, False]
+    assert "bulge_radius" not in sequence.units[1].in_profile.__dict__
+
+    assert _bulged(_solve(round_oval_round, bulging=True)) == [True, True]
+    assert _bulged(_solve(round_oval_round, oval_bulging=True)) == [True, False]
+
+
+def test_opt_out(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+
+    monkeypatch.setattr(Config, "OPT_IN", False)
+
+    assert _bulged(_solve(round_oval_round)) == [True, True]
+    assert _bulged(_solve(round_oval_round, bulging=False, oval_bulging=True)) == [True, False]
+
+
+def test_remove_post_processor(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.core import SymmetricRollPass
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    monkeypatch.setattr(SymmetricRollPass, "post_processors", list(SymmetricRollPass.post_processors))
+    SymmetricRollPass.post_processors.remove(BulgingModel)
+
+    sequence = _solve(round_oval_round)
+    assert "bulge_radius" not in sequence.units[1].in_profile.__dict__
+
+
+def test_optional_modules_imported_lazily():
+    code = (
+        "import sys, pyroll.profile_bulging as pb; "
+        "assert 'pyroll.profile_bulging.sweep' not in sys.modules; "
+        "assert pb.sweep.run_sweep and pb.surrogate_tables is pb.surrogate.surrogate_tables"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    # solving does not import the export module
+    code = (
+        "import sys, pyroll.wusatowski_spreading, pyroll.profile_bulging; "
+        "sys.path.insert(0, sys.argv[1]); import conftest, test_opt_in; "
+        "test_opt_in._solve(conftest.build_round_oval_round); "
+        "assert 'pyroll.profile_bulging.export' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code, str(Path(__file__).parent)], check=True)
@@ -0,0 +1,37 @@
+from pyroll.core import Profile
+
+
+def test_pass_geometry_cache(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config, pass_geometry_cache
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = round_oval_round()
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+
+    def bulged():
+        profile = Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+        return BulgingModel(roll_pass).solve(profile)
+
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    pass_geometry_cache.clear()
+
+    first = bulged()
+    geometry = pass_geometry_cache.get(roll_pass)
+    second = bulged()
+
+    assert pass_geometry_cache.get(roll_pass) is geometry
+    assert geometry.max_quadrant is geometry.max_quadrant
+    assert pass_geometry_cache.stats().hits >= 2
+    assert second.cross_section.equals(first.cross_section)
+
+    roll_pass.gap = 3e-3
+    roll_pass.reevaluate_cache()
+    assert pass_geometry_cache.get(roll_pass) is not geometry
+    assert pass_geometry_cache.get(roll_pass).max_cross_section.bounds[3] > geometry.max_cross_section.bounds[3]
+
+    monkeypatch.setattr(Config, "PASS_GEOMETRY_CACHE_WIDTHS", 0)
+    assert pass_geometry_cache.get(roll_pass) is not pass_geometry_cache.get(roll_pass)
+
+    pass_geometry_cache.clear()
@@ -0,0 +1,65 @@
+import numpy as np
+from shapely import Point, unary_union
+from shapely.affinity import scale
+from pyroll.core import Profile, Roll, RollPass, DiamondGroove
+
+
+def test_assemble_mirrored():
+    from pyroll.profile_bulging import symmetry
+
+    ellipse = scale(Point(0, 0).buffer(1, quad_segs=16), 2, 1)
+    piece = symmetry.quadrant(ellipse)
+    assembled = symmetry.assemble_mirrored(piece)
+
+    assert assembled.is_valid
+    assert assembled.symmetric_difference(ellipse).area < 1e-12
+    assert symmetry.assemble_mirrored(symmetry.quadrant(Point(2, 0).buffer(1))) is None
+    assert unary_union(symmetry.mirrored_copies(piece)).symmetric_difference(ellipse).area < 1e-12
+
+
+def test_quadrant_square_diamond():
+    import pyroll.wusatowski_spreading
+    from pyroll.core.roll_pass.hookimpls.helpers import out_cross_section
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    in_profile = Profile.square(
+        side=45e-3,
+        corner_radius=3e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C20", "steel"],
+        flow_stress=100e6
+    )
+
+    roll_pass = RollPass(
+        label="Raute I",
+        roll=Roll(
+            groove=DiamondGroove(
+                usable_width=76.55e-3,
+                tip_depth=22.1e-3,
+                r1=12e-3,
+                r2=8e-3
+            ),
+            nominal_radius=(324e-3 + 320e-3) / 2 / 2
+        ),
+        velocity=1,
+        gap=3e-3,
+    )
+    roll_pass.solve(in_profile)
+
+    model = BulgingModel(roll_pass)
+    profile = Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+    profile.bulge_radius = model.bulge_radius(profile)
+
+    center = profile.width / 2 - profile.bulge_radius
+    left_bulge = Point(-center, 0).buffer(profile.bulge_radius)
+    right_bulge = Point(center, 0).buffer(profile.bulge_radius)
+    helper_cs = out_cross_section(roll_pass, profile.width)
+    expected = unary_union([left_bulge.intersection(helper_cs), right_bulge.intersection(helper_cs)])
+
+    bulged = model.two_roll_bulged_cross_section_polygon_square_diamond_square(profile)
+
+    assert bulged.geom_type == "Polygon"
+    assert bulged.is_valid
+    assert np.isclose(bulged.area, expected.area, rtol=1e-9)
+    assert bulged.symmetric_difference(expected).area / expected.area < 1e-9
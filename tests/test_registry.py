@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+
+def test_registry_default_dispatch():
+    from pyroll.profile_bulging import registry
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    pair = registry.resolve({"round"}, {"oval", "circular_oval"})
+    assert pair.bulge_radius is BulgingModel.two_roll_bulge_radius_round_oval_lee
+
+    pair = registry.resolve({"oval"}, {"round", "3fold"})
+    assert pair.bulge_radius is BulgingModel.three_roll_bulge_radius_oval_round_byon
+
+    assert registry.resolve({"box"}, {"box"}) is None
+    assert registry.fold_count({"round", "3fold"}) == 3
+    assert registry.fold_count({"round"}) == 2
+
+
+def test_registry_third_party_model():
+    from pyroll.profile_bulging import registry
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    registry.register(
+        "box", "box", 2,
+        bulge_radius=lambda model, profile: profile.width,
+        cross_section=lambda model, profile: "bulged",
+    )
+
+    try:
+        roll_pass = SimpleNamespace(in_profile=SimpleNamespace(classifiers={"box"}), classifiers={"box", "upset"})
+        model = BulgingModel(roll_pass)
+        profile = SimpleNamespace(width=2.0, cross_section="unbulged")
+
+        assert model.bulge_radius(profile) == 2.0
+        assert model.cross_section(profile) == "bulged"
+        assert model.bulged_contour(profile) is None
+    finally:
+        registry.unregister("box", "box", 2)
+
+    assert ("box", "box", 2) not in registry.registered()
+    model = BulgingModel(roll_pass)
+    assert model.bulge_radius(profile) is None
+    assert model.cross_section(profile) == "unbulged"
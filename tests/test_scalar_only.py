@@ -0,0 +1,55 @@
+import warnings
+
+import numpy as np
+import pytest
+from pyroll.core import Profile
+
+
+def _out_profile(roll_pass):
+    return Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+
+@pytest.mark.parametrize("factory", ["round_oval_round", "three_roll_oval_oval"])
+def test_scalar_only_matches_polygon_path(factory, request, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    monkeypatch.setattr(Config, "SCALAR_ONLY", False)
+    sequence, in_profile = request.getfixturevalue(factory)()
+    sequence.solve(in_profile)
+
+    for roll_pass in sequence.roll_passes:
+        Config.SCALAR_ONLY = False
+        full = BulgingModel(roll_pass).solve(_out_profile(roll_pass))
+
+        Config.SCALAR_ONLY = True
+        fast = BulgingModel(roll_pass).solve(_out_profile(roll_pass))
+
+        assert fast.bulge_radius == full.bulge_radius
+        assert fast.__dict__["cross_section"] is roll_pass.out_profile.cross_section
+        assert np.isclose(fast.bulged_area, full.bulged_area, rtol=2e-3)
+        assert np.isclose(fast.bulged_width, full.bulged_width, rtol=1e-3)
+        assert np.isclose(fast.bulged_height, full.bulged_height, rtol=1e-3)
+
+
+def test_scalar_only_per_sequence(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    import pyroll.profile_bulging
+    from pyroll.profile_bulging import Config
+
+    monkeypatch.setattr(Config, "SCALAR_ONLY", False)
+
+    sequence, in_profile = round_oval_round()
+    sequence.bulging_scalar_only = True
+    # the second roll pass is solved with the unbulged cross-section of the first
+    with pytest.warns(UserWarning, match="Round II"):
+        sequence.solve(in_profile)
+    assert "bulged_area" in sequence.units[1].in_profile.__dict__
+
+    sequence, in_profile = round_oval_round()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        sequence.solve(in_profile)
+    assert "bulged_area" not in sequence.units[1].in_profile.__dict__
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from pyroll.core import Profile, ThreeRollPass
+from pyroll.core.roll_pass.hookimpls import helpers
+
+
+def _roll_pass(factory, **kwargs):
+    sequence, in_profile = factory(**kwargs)
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+    return roll_pass
+
+
+def _profile(roll_pass, width=None):
+    profile = Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+    if width is not None:
+        profile.width = width
+        if isinstance(roll_pass, ThreeRollPass):
+            profile.cross_section = helpers.out_cross_section3(roll_pass, width)
+
+    return profile
+
+
+def _evaluate(roll_pass, width):
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    model = BulgingModel(roll_pass)
+    profile = _profile(roll_pass, width)
+    profile.bulge_radius = model.bulge_radius(profile)
+    return np.array([profile.bulge_radius, model.output_cross_section(profile)[0].area])
+
+
+@pytest.mark.parametrize("factory,argument,opening", [
+    ("round_oval_round", "oval_gap", "gap"),
+    ("three_roll_oval_oval", "inscribed_circle_diameter", "inscribed_circle_diameter"),
+])
+def test_sensitivities_match_finite_differences(factory, argument, opening, request, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    factory = request.getfixturevalue(factory)
+    roll_pass = _roll_pass(factory)
+    width = roll_pass.out_profile.width
+    result = BulgingModel(roll_pass).sensitivities(_profile(roll_pass, width))
+
+    step = 1e-6
+    by_width = (_evaluate(roll_pass, width + step) - _evaluate(roll_pass, width - step)) / (2 * step)
+    value = getattr(roll_pass, opening)
+    by_opening = (
+        _evaluate(_roll_pass(factory, **{argument: value + step}), width)
+        - _evaluate(_roll_pass(factory, **{argument: value - step}), width)
+    ) / (2 * step)
+
+    assert result.bulge_radius_gradient["width"] == pytest.approx(by_width[0], rel=1e-5)
+    assert result.bulged_area_gradient["width"] == pytest.approx(by_width[1], rel=1e-3)
+    assert result.bulge_radius_gradient[opening] == pytest.approx(by_opening[0], rel=1e-5)
+    assert result.bulged_area_gradient[opening] == pytest.approx(by_opening[1], rel=1e-3)
+
+
+def test_sensitivities_stored_on_profile(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+    from pyroll.profile_bulging.sensitivities import Dual
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    monkeypatch.setattr(Config, "SENSITIVITIES", True)
+    roll_pass = _roll_pass(round_oval_round)
+    profile = BulgingModel(roll_pass).solve(_profile(roll_pass))
+
+    assert set(profile.bulge_radius_gradient) == {"width", "r2", "usable_width", "gap"}
+    assert profile.bulged_area_gradient["gap"] > 0
+
+    x = Dual.variable(2.0, 0, 2)
+    y = Dual.variable(3.0, 1, 2)
+    z = np.abs(np.float64(1.0) - x * y / 2) ** 2
+    np.testing.assert_allclose(z.gradient, [2 * 2 * 3 / 2, 2 * 2 * 2 / 2])
@@ -0,0 +1,50 @@
+import numpy as np
+import shapely
+from pyroll.core import Profile
+
+
+def test_visvalingam_removes_collinear_vertices_first():
+    from pyroll.profile_bulging.simplification import visvalingam
+
+    coords = np.array([[0, 0], [1, 0], [2, 0], [3, 1], [4, 0]], dtype=float)
+    kept, removed_area = visvalingam(coords, keep=4)
+
+    np.testing.assert_array_equal(kept, coords[[0, 2, 3, 4]])
+    assert removed_area == 0
+
+
+def test_simplified_output_cross_section(round_oval_round, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = round_oval_round()
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+
+    def out_profile():
+        return Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+    monkeypatch.setattr(Config, "CROSS_SECTION_CACHE_SIZE", 0)
+    original = BulgingModel(roll_pass).solve(out_profile()).cross_section
+
+    monkeypatch.setattr(Config, "OUTPUT_VERTEX_BUDGET", 32)
+    simplified = BulgingModel(roll_pass).solve(out_profile())
+    cross_section = simplified.cross_section
+
+    assert shapely.get_num_coordinates(cross_section) <= 32 + 1
+    assert cross_section.is_valid
+    assert shapely.symmetric_difference(cross_section, shapely.transform(cross_section, lambda c: c * [-1, 1])).area \
+           < 1e-12
+    assert np.isclose(
+        simplified.bulged_simplification_error,
+        shapely.symmetric_difference(original, cross_section).area / original.area
+    )
+    assert 0 < simplified.bulged_simplification_error < 1e-2
+
+    Config.OUTPUT_VERTEX_BUDGET = 0
+    monkeypatch.setattr(Config, "OUTPUT_MAX_AREA_ERROR", 1e-3)
+    bounded = BulgingModel(roll_pass).solve(out_profile())
+
+    assert 0 < bounded.bulged_simplification_error <= 1e-3
+    assert shapely.get_num_coordinates(bounded.cross_section) < shapely.get_num_coordinates(original)
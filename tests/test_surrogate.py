@@ -0,0 +1,56 @@
+import dataclasses
+
+import numpy as np
+from pyroll.core import Profile
+
+
+def test_surrogate_table(round_oval_round, tmp_path, monkeypatch):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config, surrogate_tables
+    from pyroll.profile_bulging.surrogate import SurrogateTable, sample_table
+    from pyroll.profile_bulging.symmetric_roll_pass import BulgingModel
+
+    sequence, in_profile = round_oval_round()
+    roll_pass = sequence.roll_passes[0]
+    roll_pass.solve(in_profile)
+
+    def out_profile():
+        return Profile(**{k: v for k, v in roll_pass.out_profile.__dict__.items() if not k.startswith("_")})
+
+    width = roll_pass.out_profile.width
+    radius = BulgingModel(roll_pass).bulge_radius(out_profile())
+
+    table = sample_table(roll_pass, np.linspace(0.95, 1.05, 5) * width, np.linspace(0.8, 1.2, 5) * radius)
+    table.save(tmp_path / "table.npz")
+    loaded = SurrogateTable.load(tmp_path / "table.npz")
+
+    assert isinstance(loaded.area, np.memmap)
+    assert loaded.key() == table.key()
+    np.testing.assert_array_equal(loaded.area, table.area)
+
+    reference = BulgingModel(roll_pass).solve(out_profile()).cross_section.area
+    values = loaded.lookup(width, radius)
+    assert np.isclose(values["area"], reference, rtol=1e-3)
+    assert np.isnan(loaded.lookup(2 * width, radius)["area"])
+
+    monkeypatch.setattr(Config, "SURROGATE", True)
+    surrogate_tables.add(loaded)
+    try:
+        profile = BulgingModel(roll_pass).solve(out_profile())
+    finally:
+        surrogate_tables.clear()
+
+    assert profile.bulged_area == loaded.lookup(profile.width, profile.bulge_radius)["area"]
+    assert profile.bulged_scalars_only
+    assert profile.__dict__["cross_section"] is roll_pass.out_profile.cross_section
+
+    # tables sampled for other classifiers do not match
+    surrogate_tables.add(dataclasses.replace(loaded, in_classifiers=("oval",)))
+    try:
+        assert surrogate_tables.find(BulgingModel(roll_pass)) is None
+        profile = BulgingModel(roll_pass).solve(out_profile())
+    finally:
+        surrogate_tables.clear()
+
+    assert not profile.bulged_scalars_only
+    assert profile.cross_section.area == reference
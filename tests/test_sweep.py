@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+
+def test_expand_grid():
+    from pyroll.profile_bulging.sweep import expand_grid
+
+    assert expand_grid({"a": [1, 2], "b": [3]}) == [{"a": 1, "b": 3}, {"a": 2, "b": 3}]
+    assert expand_grid([{"a": 1}]) == [{"a": 1}]
+
+
+def test_sweep(round_oval_round):
+    from pyroll.profile_bulging.sweep import run_sweep
+
+    grid = {"oval_r2": [38e-3, 42e-3], "oval_depth": [8e-3]}
+    serial = run_sweep(round_oval_round, grid, processes=1)
+    parallel = run_sweep(round_oval_round, grid, processes=2)
+
+    assert not serial.errors
+    assert len(serial.table) == 4
+    assert list(serial.variant(1)["roll_pass"]) == ["Oval I", "Round II"]
+    assert np.all(serial.table["area"] > 0)
+    assert np.all(serial.table["bulge_radius"] > 0)
+
+    for name in ["bulge_radius", "area", "width", "height"]:
+        assert np.allclose(serial.table[name], parallel.table[name])
+
+    sequence, in_profile = round_oval_round(**serial.parameters[0])
+    sequence.solve(in_profile)
+    assert np.isclose(serial.table["width"][0], sequence.units[1].in_profile.width, rtol=1e-6)
+
+
+def test_sweep_errors(round_oval_round):
+    from pyroll.profile_bulging.sweep import run_sweep
+
+    result = run_sweep(round_oval_round, [{"oval_r2": 40e-3}, {"unknown": 1}], processes=1)
+    assert list(result.errors) == [1]
+    assert set(result.table["variant"]) == {0}
+
+
+def test_sweep_cross_sections(round_oval_round):
+    from pyroll.profile_bulging.sweep import run_sweep
+
+    grid = {"oval_r2": [38e-3, 42e-3]}
+    plain = run_sweep(round_oval_round, grid, processes=1)
+    result = run_sweep(round_oval_round, grid, processes=2, cross_sections=True)
+
+    assert np.array_equal(plain.table, result.table)
+    assert plain.cross_sections is None
+    assert len(result.cross_sections) == len(result.table)
+    assert result.coordinates.shape == (sum(len(c.arc) for c in result.cross_sections), 2)
+    assert all(np.shares_memory(c.arc, result.coordinates) for c in result.cross_sections)
+
+    for row, cross_section in zip(result.table, result.cross_sections):
+        assert np.isclose(cross_section().area, row["area"], rtol=1e-12)
+        assert cross_section.bulge_radius == row["bulge_radius"]
+
+
+def test_sweep_scalar_only(round_oval_round, monkeypatch):
+    from pyroll.profile_bulging import Config
+    from pyroll.profile_bulging.sweep import run_sweep
+
+    full = run_sweep(round_oval_round, [{}], processes=1)
+    monkeypatch.setattr(Config, "SCALAR_ONLY", True)
+    with pytest.warns(UserWarning, match="unbulged cross-section"):
+        scalar_only = run_sweep(round_oval_round, [{}], processes=1)
+
+    # the rows hold the bulged values, although the cross-sections of scalar-only profiles are unbulged
+    for name in ["bulge_radius", "area", "width", "height"]:
+        assert np.isclose(scalar_only.table[name][0], full.table[name][0], rtol=1e-3)
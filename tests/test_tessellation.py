@@ -0,0 +1,41 @@
+import numpy as np
+from shapely import Point
+
+
+def test_quad_segs_chord_deviation():
+    from pyroll.profile_bulging.tessellation import quad_segs, DEFAULT_QUAD_SEGS
+
+    assert quad_segs(10e-3, 0) == DEFAULT_QUAD_SEGS
+
+    for radius in [1e-3, 10e-3, 100e-3]:
+        for deviation in [1e-6, 1e-5, 1e-4]:
+            segments = quad_segs(radius, deviation)
+            angle = np.pi / 2 / segments
+            assert radius * (1 - np.cos(angle / 2)) <= deviation
+            if segments > 1:
+                coarser = np.pi / 2 / (segments - 1)
+                assert radius * (1 - np.cos(coarser / 2)) > deviation
+
+    assert quad_segs(1e-3, 1e-5) < quad_segs(100e-3, 1e-5)
+    assert quad_segs(1e-3, 1) == 1
+
+
+def test_buffer_area_error_bounded():
+    from pyroll.profile_bulging.tessellation import quad_segs
+
+    radius = 50e-3
+    deviation = 1e-6
+    circle = Point(0, 0).buffer(radius, quad_segs=quad_segs(radius, deviation))
+    assert np.pi * radius ** 2 - circle.area < 2 * np.pi * radius * deviation
+
+
+def test_contour_tessellation_chord_deviation():
+    from pyroll.profile_bulging.contour import Envelope
+
+    radius = 20e-3
+    deviation = 1e-6
+    contour = Envelope.circle((0, 0), radius, polar=False).to_contour()
+    coords = contour.coords(max_chord_deviation=deviation)
+
+    midpoints = (coords[1:] + coords[:-1]) / 2
+    assert np.all(radius - np.linalg.norm(midpoints, axis=1) <= deviation * (1 + 1e-9))
@@ -0,0 +1,49 @@
+import pytest
+import shapely
+
+
+def _results(jobs, out_profiles):
+    # the bulged profiles are passed on as incoming profiles of the following units
+    return [
+        [
+            (profile.__dict__.get("bulge_radius"), profile.cross_section)
+            for profile in [u.in_profile for u in sequence.units[1:]] + [out_profile]
+        ]
+        for (sequence, _), out_profile in zip(jobs, out_profiles)
+    ]
+
+
+def test_threaded_solution_equals_serial(round_oval_round):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import cross_section_cache, pass_geometry_cache, incremental_memo
+    from pyroll.profile_bulging.parallel import solve_sequences
+
+    # strands with equal gaps share cache entries across the threads
+    gaps = [2e-3, 2.5e-3, 3e-3] * 4
+
+    for cache in (cross_section_cache, pass_geometry_cache, incremental_memo):
+        cache.clear()
+    serial_jobs = [round_oval_round(oval_gap=g, round_gap=g) for g in gaps]
+    serial = _results(serial_jobs, solve_sequences(serial_jobs, threads=1))
+
+    for cache in (cross_section_cache, pass_geometry_cache, incremental_memo):
+        cache.clear()
+    threaded_jobs = [round_oval_round(oval_gap=g, round_gap=g) for g in gaps]
+    threaded = _results(threaded_jobs, solve_sequences(threaded_jobs, threads=4))
+
+    assert len(threaded) == len(gaps)
+    assert all(strand[0][0] is not None for strand in threaded)
+
+    for serial_strand, threaded_strand in zip(serial, threaded):
+        for (serial_radius, serial_cs), (threaded_radius, threaded_cs) in zip(serial_strand, threaded_strand):
+            assert threaded_radius == serial_radius
+            assert shapely.equals_exact(threaded_cs, serial_cs, tolerance=0)
+
+
+def test_solve_sequences_rejects_shared_units(round_oval_round):
+    from pyroll.profile_bulging.parallel import solve_sequences
+
+    sequence, in_profile = round_oval_round()
+
+    with pytest.raises(ValueError):
+        solve_sequences([(sequence, in_profile), (sequence, in_profile)])
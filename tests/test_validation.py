@@ -0,0 +1,50 @@
+import pytest
+
+
+def _sequence(square_oval_square):
+    sequence, in_profile = square_oval_square()
+    sequence.solve(in_profile)
+    return sequence
+
+
+def test_validation_table(square_oval_square):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import Config, validation
+
+    sequence = _sequence(square_oval_square)
+    cases = validation.generate_corpus(sequence.roll_passes)
+    assert {c.kind for c in cases} == set(validation.KINDS)
+
+    configurations = [c for c in validation.CONFIGURATIONS if c.name in ("polygon", "polygon 1 um", "scalar only")]
+    rows = validation.validate(cases, configurations, repeat=1)
+
+    assert [r.configuration.name for r in rows] == ["reference", "polygon", "polygon 1 um", "scalar only"]
+    assert rows[0].max_error == 0 and rows[0].mismatches == 0
+    assert rows[2].max_error < rows[1].max_error < 1e-2
+    assert rows[3].max_error < 1e-5
+    assert any(r.pareto for r in rows)
+    assert "polygon 1 um" in validation.format_table(rows)
+    assert "arcsin_limit" in validation.format_kind_table(rows)
+    assert Config.CROSS_SECTION_CACHE_SIZE == 256
+
+
+def test_overridden_rejects_unknown_names():
+    from pyroll.profile_bulging import validation
+
+    with pytest.raises(ValueError):
+        with validation.overridden({"NO_SUCH_VALUE": 1}):
+            pass
+
+
+def test_evaluate_starts_without_pass_geometries(square_oval_square):
+    import pyroll.wusatowski_spreading
+    from pyroll.profile_bulging import pass_geometry_cache, validation
+
+    cases = validation.generate_corpus(_sequence(square_oval_square).roll_passes)
+
+    validation.evaluate(validation.REFERENCE, cases)
+    stats = pass_geometry_cache.stats()
+    assert stats.misses > 0
+
+    validation.evaluate(validation.REFERENCE, cases)
+    assert pass_geometry_cache.stats() == stats